@@ -0,0 +1 @@
+"""Benchmarks del motor de Backgammon. Cada módulo se ejecuta con ``python -m``."""
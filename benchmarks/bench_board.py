@@ -0,0 +1,109 @@
+"""
+Compara el tablero de listas (``Board``) con el tablero compacto (``CompactBoard``).
+
+Mide tiempo y memoria por movimiento y por partida jugando partidas aleatorias
+con la misma semilla en ambos motores, por lo que los dos ejecutan exactamente
+la misma secuencia de validaciones y movimientos.
+
+Uso:
+    python -m benchmarks.bench_board --games 200 --seed 1
+"""
+import argparse
+import random
+import time
+import tracemalloc
+
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.game import BackgammonGame
+
+ENGINES = {"list": Board, "compact": CompactBoard}
+
+
+def play_random_game(game: BackgammonGame, rng: random.Random, max_turns: int = 2000) -> int:
+    """
+    Juega una partida completa eligiendo movimientos válidos al azar.
+
+    Args:
+        game (BackgammonGame): Partida a jugar (ya inicializada)
+        rng (random.Random): Generador usado para dados y elecciones
+        max_turns (int): Límite de turnos de seguridad
+
+    Returns:
+        int: Cantidad de movimientos de ficha ejecutados
+    """
+    board = game.get_board()
+    moves = 0
+    for _ in range(max_turns):
+        if game.check_winner():
+            break
+        player = game.get_current_player()
+        d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+        for die in [d1, d2] * (2 if d1 == d2 else 1):
+            if board.get_bar(player.get_color()) > 0:
+                legal = [25] if board.is_valid_move(player, 25, die) else []
+            else:
+                legal = [i for i in range(24) if board.is_valid_move(player, i, die)]
+            if not legal:
+                continue
+            from_point = rng.choice(legal)
+            if from_point == 25:
+                board.move_checker_from_bar(player, die)
+            else:
+                board.move_checker(player, from_point, die)
+            moves += 1
+            if game.check_winner():
+                break
+        game.switch_player()
+    return moves
+
+
+def bench_engine(engine, games: int, seed: int) -> dict:
+    """Juega ``games`` partidas con un motor y devuelve las métricas."""
+    total_moves = 0
+    start = time.perf_counter()
+    for i in range(games):
+        game = BackgammonGame(board=engine())
+        total_moves += play_random_game(game, random.Random(seed + i))
+    elapsed = time.perf_counter() - start
+
+    tracemalloc.start()
+    game = BackgammonGame(board=engine())
+    play_random_game(game, random.Random(seed))
+    _, game_peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    tracemalloc.start()
+    boards = []
+    for _ in range(1000):
+        board = engine()
+        board.setup_initial_checkers(game.get_player1(), game.get_player2())
+        boards.append(board)
+    board_bytes, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "games": games,
+        "moves": total_moves,
+        "us_per_move": elapsed / total_moves * 1e6,
+        "ms_per_game": elapsed / games * 1e3,
+        "bytes_per_board": board_bytes / len(boards),
+        "peak_bytes_per_game": game_peak,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    print(f"{'motor':<8} {'us/mov':>9} {'ms/partida':>11} {'bytes/tablero':>14} {'pico/partida':>13}")
+    for name, engine in ENGINES.items():
+        r = bench_engine(engine, args.games, args.seed)
+        print(f"{name:<8} {r['us_per_move']:>9.2f} {r['ms_per_game']:>11.2f} "
+              f"{r['bytes_per_board']:>14.0f} {r['peak_bytes_per_game']:>13}")
+
+
+if __name__ == "__main__":
+    main()
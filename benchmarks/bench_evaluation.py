@@ -0,0 +1,88 @@
+"""
+Compara la evaluación por lotes de jugadas candidatas con un bucle por tablero.
+
+Para cada posición del corpus se generan todas las jugadas de una tirada y se
+evalúan (a) con ``evaluate_plays``, que arma un único arreglo y llama una vez
+al evaluador, y (b) copiando cada tablero y evaluándolo por separado.
+
+Uso:
+    python -m benchmarks.bench_evaluation --positions 200 --evaluator mlp
+"""
+import argparse
+import random
+import time
+
+from core.board import Board
+from core.evaluation import HeuristicEvaluator, MLPEvaluator, evaluate_boards, evaluate_plays
+from core.moves import generate_plays, apply_move
+from core.player import Player
+
+
+def _roll(rng: random.Random):
+    d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+    return [d1, d2] * (2 if d1 == d2 else 1)
+
+
+def build_corpus(count: int, seed: int):
+    """Devuelve (tablero, jugador, jugadas) tomados de partidas aleatorias."""
+    rng = random.Random(seed)
+    corpus = []
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    while len(corpus) < count:
+        board = Board()
+        board.setup_initial_checkers(p1, p2)
+        player, other = p1, p2
+        for _ in range(rng.randint(0, 40)):
+            plays = generate_plays(board, player, _roll(rng))
+            if plays:
+                for move in rng.choice(plays):
+                    apply_move(board, player, move)
+            if board.has_won(player):
+                break
+            player, other = other, player
+        plays = generate_plays(board, player, _roll(rng))
+        if len(plays) > 1:
+            corpus.append((board, player, plays))
+    return corpus
+
+
+def evaluate_one_by_one(board, player, plays, evaluator):
+    """Evalúa cada jugada sobre una copia del tablero, de a una por vez."""
+    scores = []
+    for play in plays:
+        clone = board.copy()
+        for move in play:
+            apply_move(clone, player, move)
+        scores.append(float(evaluate_boards([clone], player.get_color(), evaluator)[0]))
+    return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=1)
+    parser.add_argument("--evaluator", choices=["heuristic", "mlp"], default="mlp")
+    args = parser.parse_args()
+
+    evaluator = HeuristicEvaluator() if args.evaluator == "heuristic" else MLPEvaluator.random(hidden=80)
+    corpus = build_corpus(args.positions, args.seed)
+    candidates = sum(len(plays) for _, _, plays in corpus)
+
+    start = time.perf_counter()
+    for board, player, plays in corpus:
+        evaluate_plays(board, player, plays, evaluator)
+    batch_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for board, player, plays in corpus:
+        evaluate_one_by_one(board, player, plays, evaluator)
+    loop_time = time.perf_counter() - start
+
+    print(f"posiciones: {len(corpus)}, jugadas candidatas: {candidates}")
+    print(f"por lotes:   {candidates / batch_time:10.0f} jugadas/s")
+    print(f"de a una:    {candidates / loop_time:10.0f} jugadas/s")
+    print(f"aceleración: {loop_time / batch_time:10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
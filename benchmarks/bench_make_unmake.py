@@ -0,0 +1,87 @@
+"""
+Compara una enumeración a 2 plies con ``copy.deepcopy`` contra ``make_move``/``unmake_move``.
+
+Desde la posición inicial se recorren todas las secuencias de movimientos de
+una tirada del primer jugador y, para cada posición resultante, todas las de
+las 21 tiradas del rival. La variante con copias clona el tablero en cada rama;
+la otra modifica un único tablero y lo restaura al volver.
+
+Uso:
+    python -m benchmarks.bench_make_unmake --roll 3 1
+"""
+import argparse
+import copy
+import time
+
+from core.board import Board
+from core.moves import legal_single_moves, apply_move
+from core.player import Player
+
+ROLLS = [(a, b) for a in range(1, 7) for b in range(a, 7)]
+
+
+def _dice(roll):
+    a, b = roll
+    return [a] * 4 if a == b else [a, b]
+
+
+def count_with_deepcopy(board, player, dice, memo_players, leaf=None):
+    """Cuenta hojas clonando el tablero con deepcopy en cada rama."""
+    moves = legal_single_moves(board, player, dice[0]) if dice else []
+    if not moves:
+        return leaf(board) if leaf else 1
+    total = 0
+    for move in moves:
+        child = copy.deepcopy(board, dict(memo_players))
+        apply_move(child, player, move)
+        total += count_with_deepcopy(child, player, dice[1:], memo_players, leaf)
+    return total
+
+
+def count_with_make_unmake(board, player, dice, leaf=None):
+    """Cuenta hojas modificando y restaurando un único tablero."""
+    moves = legal_single_moves(board, player, dice[0]) if dice else []
+    if not moves:
+        return leaf(board) if leaf else 1
+    total = 0
+    for move in moves:
+        record = board.make_move(player, *move)
+        total += count_with_make_unmake(board, player, dice[1:], leaf)
+        board.unmake_move(player, record)
+    return total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--roll", type=int, nargs=2, default=[3, 1])
+    args = parser.parse_args()
+
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.setup_initial_checkers(p1, p2)
+    dice = _dice(tuple(args.roll))
+    memo = {id(p1): p1, id(p2): p2}
+
+    def reply_copy(position):
+        return sum(count_with_deepcopy(position, p2, _dice(r), memo) for r in ROLLS)
+
+    def reply_make(position):
+        return sum(count_with_make_unmake(position, p2, _dice(r)) for r in ROLLS)
+
+    start = time.perf_counter()
+    leaves_copy = count_with_deepcopy(board, p1, dice, memo, reply_copy)
+    copy_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    leaves_make = count_with_make_unmake(board, p1, dice, reply_make)
+    make_time = time.perf_counter() - start
+
+    assert leaves_copy == leaves_make
+    print(f"hojas a 2 plies: {leaves_make}")
+    print(f"deepcopy:        {copy_time:8.2f} s ({leaves_copy / copy_time:10.0f} hojas/s)")
+    print(f"make/unmake:     {make_time:8.2f} s ({leaves_make / make_time:10.0f} hojas/s)")
+    print(f"aceleración:     {copy_time / make_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Mide el costo de la tabla de equity de partido: generarla, cargarla del disco y consultarla.
+
+La generación se hace una vez por proceso (o se guarda en ``assets/met.bin``);
+las decisiones de cubo durante el partido son solo consultas a la tabla.
+
+Uso:
+    python -m benchmarks.bench_met
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from core.match import Match
+from core.met import MatchEquityTable, build_table, save_table
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--lookups", type=int, default=200_000)
+    args = parser.parse_args()
+
+    print(f"{'largo':>6} {'generar ms':>11}")
+    for length in (7, 11, 15, 25):
+        start = time.perf_counter()
+        build_table(length)
+        print(f"{length:6d} {(time.perf_counter() - start) * 1000:11.2f}")
+
+    with tempfile.TemporaryDirectory() as folder:
+        path = os.path.join(folder, "met.bin")
+        save_table(path)
+        start = time.perf_counter()
+        table = MatchEquityTable.load(path)
+        print(f"Carga de {os.path.getsize(path)} bytes: {(time.perf_counter() - start) * 1000:.2f} ms")
+
+    start = time.perf_counter()
+    for index in range(args.lookups):
+        table.equity(index % 25 + 1, (index // 25) % 25 + 1, index & 1 == 1)
+    elapsed = time.perf_counter() - start
+    print(f"Consultas: {args.lookups / elapsed:,.0f}/s ({elapsed / args.lookups * 1e9:.0f} ns por consulta)")
+
+    match = Match(7, table=table)
+    decisions = args.lookups // 10
+    start = time.perf_counter()
+    for index in range(decisions):
+        match.cube_decision("W", (index % 100) / 100)
+    elapsed = time.perf_counter() - start
+    print(f"Decisiones de cubo: {decisions / elapsed:,.0f}/s ({elapsed / decisions * 1e6:.1f} us por decisión)")
+
+
+if __name__ == "__main__":
+    main()
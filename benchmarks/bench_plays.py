@@ -0,0 +1,91 @@
+"""
+Compara ``generate_plays`` con un generador ingenuo por permutaciones de dados.
+
+El generador ingenuo recorre todas las permutaciones de la tirada (24 para los
+dobles) sin podar transposiciones y deduplica recién al final. Ambos se miden
+sobre posiciones tomadas de partidas aleatorias, tirando siempre dobles.
+
+Uso:
+    python -m benchmarks.bench_plays --positions 30 --seed 1
+"""
+import argparse
+import itertools
+import random
+import time
+
+from core.board import Board
+from core.moves import generate_plays, legal_single_moves, apply_move, position_key
+from core.player import Player
+
+
+def naive_plays(board, player, dice):
+    """Genera jugadas por permutaciones completas, deduplicando al final."""
+    sequences = []
+
+    def search(current, remaining, play):
+        moves = legal_single_moves(current, player, remaining[0]) if remaining else []
+        if not moves:
+            sequences.append((position_key(current), play))
+            return
+        for move in moves:
+            child = current.copy()
+            apply_move(child, player, move)
+            search(child, remaining[1:], play + (move,))
+
+    for order in itertools.permutations(dice):
+        search(board, order, ())
+    longest = max(len(play) for _, play in sequences)
+    unique = {}
+    for key, play in sequences:
+        if len(play) == longest and play:
+            unique.setdefault(key, play)
+    return list(unique.values())
+
+
+def build_corpus(count: int, seed: int):
+    """Devuelve posiciones (tablero, jugador, dobles) de partidas aleatorias."""
+    rng = random.Random(seed)
+    corpus = []
+    while len(corpus) < count:
+        p1, p2 = Player("W", "W"), Player("B", "B")
+        board = Board()
+        board.setup_initial_checkers(p1, p2)
+        player, other = p1, p2
+        for _ in range(rng.randint(0, 30)):
+            d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+            plays = generate_plays(board, player, [d1, d2] * (2 if d1 == d2 else 1))
+            if plays:
+                for move in rng.choice(plays):
+                    apply_move(board, player, move)
+            if board.has_won(player):
+                break
+            player, other = other, player
+        if not board.has_won(p1) and not board.has_won(p2):
+            die = rng.randint(1, 6)
+            corpus.append((board, player, [die] * 4))
+    return corpus
+
+
+def _time(generator, corpus):
+    start = time.perf_counter()
+    total = sum(len(generator(board, player, dice)) for board, player, dice in corpus)
+    return time.perf_counter() - start, total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=30)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    corpus = build_corpus(args.positions, args.seed)
+    fast_time, fast_plays = _time(generate_plays, corpus)
+    naive_time, naive_plays_count = _time(naive_plays, corpus)
+    print(f"posiciones con dobles: {len(corpus)}")
+    print(f"generate_plays: {fast_time * 1e3 / len(corpus):8.2f} ms/posición ({fast_plays} jugadas)")
+    print(f"permutaciones:  {naive_time * 1e3 / len(corpus):8.2f} ms/posición ({naive_plays_count} jugadas)")
+    print(f"aceleración:    {naive_time / fast_time:8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
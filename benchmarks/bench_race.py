@@ -0,0 +1,73 @@
+"""
+Mide la evaluación de carreras de ``core.race`` contra rollouts.
+
+Genera carreras al azar (Blancas en los puntos 13-24 y Negras en los 1-12) y
+mide posiciones por segundo evaluando por lotes, de a una posición y con
+rollouts cortos; con la base de bear-off generada también mide la
+evaluación con EPC exactos.
+
+Uso:
+    python -m benchmarks.bench_race --positions 10000 --rollouts 5
+"""
+import argparse
+import random
+import time
+
+import numpy as np
+
+from core.bearoff import BearoffDatabase
+from core.evaluation import encode_boards
+from core.race import race_win_probabilities, race_win_probability
+from core.rollout import rollout
+from core.search import load_board
+
+
+def build_races(count: int, seed: int):
+    """Devuelve tableros sin contacto con entre 1 y 15 fichas por color en juego."""
+    rng = random.Random(seed)
+    boards = []
+    for _ in range(count):
+        counts = [0] * 24
+        for _ in range(rng.randint(1, 15)):
+            counts[rng.randint(12, 23)] += 1
+        for _ in range(rng.randint(1, 15)):
+            counts[rng.randint(0, 11)] -= 1
+        boards.append(load_board(counts, (0, 0))[0])
+    return boards
+
+
+def _rate(func, count: int) -> float:
+    start = time.perf_counter()
+    func()
+    return count / (time.perf_counter() - start)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--positions", type=int, default=10000)
+    parser.add_argument("--rollouts", type=int, default=5, help="Posiciones evaluadas con rollouts de 36 partidas")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    boards = build_races(args.positions, args.seed)
+    raw = encode_boards(boards)
+    bearoff = BearoffDatabase.default()
+
+    print(f"{'método':32} {'posiciones/s':>14}")
+    print(f"{'lote (tabla de desperdicio)':32} {_rate(lambda: race_win_probabilities(raw, 'W'), len(boards)):14.0f}")
+    if bearoff is not None:
+        print(f"{'lote (con base de bear-off)':32} "
+              f"{_rate(lambda: race_win_probabilities(raw, 'W', bearoff), len(boards)):14.0f}")
+    sample = boards[:1000]
+    print(f"{'de a una':32} "
+          f"{_rate(lambda: [race_win_probability(board, 'W', bearoff) for board in sample], len(sample)):14.0f}")
+    sample = boards[:args.rollouts]
+    if sample:
+        rate = _rate(lambda: [rollout(board, "W", trials=36, chunk_size=36) for board in sample], len(sample))
+        print(f"{'rollout de 36 partidas':32} {rate:14.2f}")
+    probabilities = race_win_probabilities(raw, "W", bearoff)
+    print(f"probabilidad media de las Blancas: {np.mean(probabilities):.3f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Mide la escritura y la lectura de registros de partidas en registros por segundo.
+
+Juega partidas entre bots anotándolas en un archivo temporal y luego lo lee de
+dos formas: sólo interpretando las líneas (``read_events``) y reproduciendo
+cada movimiento sobre un tablero (``replay``).
+
+Uso:
+    python -m benchmarks.bench_records --games 200 --gzip
+"""
+import argparse
+import os
+import tempfile
+import time
+
+from core.compact_board import CompactBoard
+from core.policies import EvaluatorPolicy, PipCountPolicy
+from core.record import GameRecordWriter, read_events, replay
+from core.selfplay import play_game
+
+
+def _rate(records, seconds):
+    return records / seconds if seconds else 0.0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--games", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--gzip", action="store_true", help="Comprime el registro")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "partidas.log" + (".gz" if args.gzip else ""))
+        start = time.perf_counter()
+        with GameRecordWriter(path) as writer:
+            for index in range(args.games):
+                seed = args.seed + index
+                play_game(EvaluatorPolicy(seed), PipCountPolicy(seed + 1), seed, recorder=writer)
+        play_seconds = time.perf_counter() - start
+        records = writer.get_record_count()
+
+        start = time.perf_counter()
+        parsed = sum(1 for _ in read_events(path))
+        parse_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        replayed = sum(1 for _ in replay(path))
+        replay_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        sum(1 for _ in replay(path, board_class=CompactBoard))
+        compact_seconds = time.perf_counter() - start
+        size = os.path.getsize(path)
+
+    assert parsed == replayed == records
+    print(f"partidas: {args.games}, registros: {records} ({size / records:.1f} bytes/registro)")
+    print(f"juego + escritura:     {_rate(records, play_seconds):10.0f} registros/s")
+    print(f"lectura (read_events): {_rate(records, parse_seconds):10.0f} registros/s")
+    print(f"replay (Board):        {_rate(records, replay_seconds):10.0f} registros/s")
+    print(f"replay (CompactBoard): {_rate(records, compact_seconds):10.0f} registros/s")
+
+
+if __name__ == "__main__":
+    main()
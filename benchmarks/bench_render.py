@@ -0,0 +1,100 @@
+"""
+Mide el tiempo por cuadro de la interfaz de pygame sin abrir una ventana.
+
+Usa el driver de video ``dummy`` de SDL. Compara redibujar toda la pantalla en
+cada cuadro (``invalidate`` + ``display.flip``) con actualizar sólo las
+regiones que cambiaron (``display.update`` con los rectángulos sucios), en
+cuadros sin cambios y en cuadros después de cada movimiento de una partida.
+
+Uso:
+    python -m benchmarks.bench_render --frames 600
+"""
+import argparse
+import os
+import time
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+
+from core.dice import Dice  # noqa: E402
+from core.game import BackgammonGame  # noqa: E402
+from core.moves import generate_plays  # noqa: E402
+from core.policies import PipCountPolicy  # noqa: E402
+from pygame_ui.renderer import HEIGHT, WIDTH, BoardRenderer  # noqa: E402
+
+
+def _game_states(seed: int, limit: int):
+    """Genera la partida cuadro a cuadro: se detiene después de cada tirada y de cada movimiento."""
+    game = BackgammonGame(dice=Dice(seed=seed))
+    policy = PipCountPolicy(seed)
+    board = game.get_board()
+    frames = 0
+    while frames < limit and not game.check_winner():
+        player = game.get_current_player()
+        game.roll_dice()
+        yield game
+        frames += 1
+        plays = generate_plays(board, player, game.get_remaining_moves())
+        if plays:
+            for from_point, die_value in policy.choose_play(board, player, plays):
+                game.make_move(25 if from_point == 25 else from_point + 1, die_value)
+                yield game
+                frames += 1
+        if not game.check_winner():
+            game.switch_player()
+
+
+def _frame(renderer: BoardRenderer, game, full: bool):
+    if full:
+        renderer.invalidate()
+        renderer.draw(game)
+        pygame.display.flip()
+    else:
+        dirty = renderer.draw(game)
+        if dirty:
+            pygame.display.update(dirty)
+
+
+def _ms_per_frame(func, frames: int) -> float:
+    start = time.perf_counter()
+    for _ in range(frames):
+        func()
+    return (time.perf_counter() - start) / frames * 1000
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--frames", type=int, default=600)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    renderer = BoardRenderer(screen)
+    game = BackgammonGame()
+    game.roll_dice()
+    renderer.draw(game)
+
+    print(f"{'escenario':28} {'completo ms':>12} {'regiones ms':>12}")
+    idle_full = _ms_per_frame(lambda: _frame(renderer, game, True), args.frames)
+    idle_dirty = _ms_per_frame(lambda: _frame(renderer, game, False), args.frames)
+    print(f"{'cuadro sin cambios':28} {idle_full:12.3f} {idle_dirty:12.3f}")
+
+    results = {}
+    for full in (True, False):
+        states = _game_states(args.seed, args.frames)
+        renderer.invalidate()
+        count, seconds = 0, 0.0
+        for state in states:
+            start = time.perf_counter()
+            _frame(renderer, state, full)
+            seconds += time.perf_counter() - start
+            count += 1
+        results[full] = seconds / max(count, 1) * 1000
+    print(f"{'cuadro tras cada movimiento':28} {results[True]:12.3f} {results[False]:12.3f}")
+    pygame.quit()
+
+
+if __name__ == "__main__":
+    main()
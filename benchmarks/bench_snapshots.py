@@ -0,0 +1,82 @@
+"""
+Mide la memoria y el tiempo de guardar el árbol completo a 2 plies desde la apertura.
+
+Para cada una de las 21 tiradas de las Blancas se guardan todas las
+posiciones después de sus jugadas y, para cada una, las posiciones después de
+todas las jugadas de las Negras en sus 21 tiradas. Se compara guardar cada
+nodo con ``Board.copy`` (24 listas y 7 diccionarios por nodo) contra
+``Board.snapshot`` (fotos inmutables que comparten los puntos sin cambios).
+
+Uso:
+    python -m benchmarks.bench_snapshots
+"""
+import argparse
+import time
+import tracemalloc
+
+from core.board import Board
+from core.dice import ROLLS
+from core.moves import generate_plays
+from core.player import Player
+
+
+def _dice(a: int, b: int):
+    return [a] * 4 if a == b else [a, b]
+
+
+def build_tree(store, plies: int = 2) -> list:
+    """
+    Recorre el árbol desde la apertura guardando cada nodo.
+
+    Args:
+        store: Función que recibe el tablero y devuelve lo que se guarda
+        plies (int): Plies a recorrer (1 o 2)
+
+    Returns:
+        list: Nodos guardados, en orden de recorrido
+    """
+    white, black = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.setup_initial_checkers(white, black)
+    nodes = [store(board)]
+
+    def expand(player, opponent, depth):
+        for a, b, _ in ROLLS:
+            for play in generate_plays(board, player, _dice(a, b)):
+                records = [board.make_move(player, *move) for move in play]
+                nodes.append(store(board))
+                if depth > 1:
+                    expand(opponent, player, depth - 1)
+                for record in reversed(records):
+                    board.unmake_move(player, record)
+
+    expand(white, black, plies)
+    return nodes
+
+
+def measure(store, plies: int):
+    """Devuelve (nodos, segundos, bytes retenidos) de guardar el árbol con ``store``."""
+    start = time.perf_counter()
+    count = len(build_tree(store, plies))
+    seconds = time.perf_counter() - start
+    tracemalloc.start()
+    nodes = build_tree(store, plies)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del nodes
+    return count, seconds, retained
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--plies", type=int, choices=[1, 2], default=2)
+    args = parser.parse_args()
+
+    print(f"{'almacenamiento':16} {'nodos':>8} {'segundos':>9} {'MiB':>8} {'bytes/nodo':>11}")
+    for name, store in (("Board.copy", Board.copy), ("Board.snapshot", Board.snapshot)):
+        count, seconds, retained = measure(store, args.plies)
+        print(f"{name:16} {count:8d} {seconds:9.2f} {retained / 2 ** 20:8.1f} {retained / count:11.0f}")
+
+
+if __name__ == "__main__":
+    main()
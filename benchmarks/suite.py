@@ -0,0 +1,255 @@
+"""
+Suite de benchmarks del motor sobre un corpus fijo de posiciones representativas.
+
+Mide ``is_valid_move``, ``move_checker``, ``make_move``/``unmake_move``,
+``has_valid_moves`` y ``generate_plays`` en posiciones de apertura, contacto,
+carrera, retirada y con fichas en la barra, además de partidas completas.
+Por cada operación informa operaciones por segundo, el pico de memoria
+asignada por operación y los bloques de memoria que quedan retenidos.
+
+Los resultados se guardan en JSON; con ``--compare`` se comparan contra una
+corrida anterior y el proceso termina con código 1 si alguna operación es más
+lenta que el umbral indicado.
+
+Uso:
+    python -m benchmarks.suite --output bench.json
+    python -m benchmarks.suite --compare bench.json --threshold 0.15
+"""
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from core.bearoff import BearoffDatabase
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.moves import generate_plays, legal_single_moves
+from core.policies import EvaluatorPolicy, PipCountPolicy
+from core.selfplay import play_game
+
+
+def _counts(white: Dict[int, int], black: Dict[int, int]) -> List[int]:
+    counts = [0] * 24
+    for point, count in white.items():
+        counts[point] = count
+    for point, count in black.items():
+        counts[point] = -count
+    return counts
+
+
+# nombre: (conteos, barra (W, B), color que mueve, tirada)
+CORPUS: Dict[str, Tuple[List[int], Tuple[int, int], str, Tuple[int, int]]] = {
+    "opening": (
+        _counts({0: 2, 11: 5, 16: 3, 18: 5}, {23: 2, 12: 5, 7: 3, 5: 5}), (0, 0), "W", (3, 1),
+    ),
+    "contact": (
+        _counts({0: 2, 11: 3, 16: 3, 18: 3, 19: 2, 20: 2}, {23: 1, 12: 3, 7: 2, 5: 4, 4: 2, 3: 2}),
+        (0, 1), "W", (6, 4),
+    ),
+    "race": (
+        _counts({13: 2, 15: 3, 18: 3, 19: 3, 20: 2, 21: 2}, {10: 2, 8: 3, 5: 3, 4: 3, 3: 2, 2: 2}),
+        (0, 0), "B", (5, 2),
+    ),
+    "bearoff": (
+        _counts({18: 2, 19: 3, 20: 3, 21: 2, 22: 2, 23: 1}, {0: 3, 1: 3, 2: 2, 3: 2, 4: 2, 5: 1}),
+        (0, 0), "W", (6, 3),
+    ),
+    "bar": (
+        _counts({11: 3, 16: 3, 18: 3, 20: 2, 22: 2}, {0: 2, 1: 2, 2: 2, 3: 2, 5: 2, 12: 4}),
+        (2, 1), "W", (5, 2),
+    ),
+}
+
+
+def load_position(name: str) -> BackgammonGame:
+    """
+    Crea una partida en una posición del corpus, con la tirada ya lanzada.
+
+    Args:
+        name (str): Nombre de la posición en ``CORPUS``
+
+    Returns:
+        BackgammonGame: Partida lista para mover
+    """
+    counts, bar, color, roll = CORPUS[name]
+    game = BackgammonGame(dice=Dice(sequence=[roll]))
+    game.get_board().setup_position(game.get_player1(), game.get_player2(), counts, bar)
+    if color == "B":
+        game.switch_player()
+    game.roll_dice()
+    return game
+
+
+def _position_ops(game: BackgammonGame) -> Dict[str, Tuple[Callable[[], object], int]]:
+    """Devuelve, por operación, una función a medir y cuántas operaciones realiza."""
+    board = game.get_board()
+    player = game.get_current_player()
+    dice = list(game.get_remaining_moves())
+    origins = list(range(24)) + [25]
+    single_moves = [move for die in set(dice) for move in legal_single_moves(board, player, die)]
+
+    def valid_moves():
+        for from_point in origins:
+            for die in range(1, 7):
+                board.is_valid_move(player, from_point, die)
+
+    def move_checker():
+        for from_point, die in single_moves:
+            child = board.copy()
+            if from_point == 25:
+                child.move_checker_from_bar(player, die)
+            else:
+                child.move_checker(player, from_point, die)
+
+    def make_unmake():
+        for move in single_moves:
+            board.unmake_move(player, board.make_move(player, *move))
+
+    ops = {
+        "is_valid_move": (valid_moves, len(origins) * 6),
+        "has_valid_moves": (game.has_valid_moves, 1),
+        "generate_plays": (lambda: generate_plays(board, player, dice), 1),
+    }
+    if single_moves:
+        ops["copy_move_checker"] = (move_checker, len(single_moves))
+        ops["make_unmake"] = (make_unmake, len(single_moves))
+    return ops
+
+
+def _full_game(seed: int) -> Callable[[], object]:
+    return lambda: play_game(EvaluatorPolicy(seed), PipCountPolicy(seed + 1), seed)
+
+
+def measure(func: Callable[[], object], ops: int, min_time: float, repeat: int = 3) -> Dict[str, float]:
+    """
+    Mide la velocidad y la memoria de una operación.
+
+    Ejecuta ``func`` en lotes que duran al menos ``min_time`` segundos y toma el
+    mejor de ``repeat`` lotes. La memoria se mide aparte con ``tracemalloc``
+    sobre una sola llamada, para no alterar los tiempos.
+
+    Args:
+        func (Callable): Función a medir
+        ops (int): Operaciones que realiza cada llamada
+        min_time (float): Duración mínima de cada lote en segundos
+        repeat (int): Cantidad de lotes
+
+    Returns:
+        Dict[str, float]: ops_per_sec, peak_bytes_per_op y retained_blocks
+    """
+    func()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        calls *= 2
+    best = elapsed
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(calls):
+            func()
+        best = min(best, time.perf_counter() - start)
+
+    blocks = sys.getallocatedblocks()
+    func()
+    retained = max(sys.getallocatedblocks() - blocks, 0)
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return {
+        "ops_per_sec": calls * ops / best if best else 0.0,
+        "peak_bytes_per_op": peak / ops,
+        "retained_blocks": retained,
+    }
+
+
+def run_suite(min_time: float = 0.2, repeat: int = 3, games: int = 1, seed: int = 0) -> Dict:
+    """
+    Ejecuta todos los benchmarks.
+
+    Args:
+        min_time (float): Duración mínima de cada lote en segundos
+        repeat (int): Lotes por operación
+        games (int): Partidas completas por llamada del benchmark de partidas
+        seed (int): Semilla de las partidas completas
+
+    Returns:
+        Dict: Metadatos de la corrida y resultados por "operación/posición"
+    """
+    results = {}
+    for name in CORPUS:
+        for op, (func, count) in _position_ops(load_position(name)).items():
+            results[f"{op}/{name}"] = measure(func, count, min_time, repeat)
+    game = _full_game(seed)
+    results["full_game/heuristic_vs_pipcount"] = measure(lambda: [game() for _ in range(games)], games, min_time, repeat)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "min_time": min_time,
+            "repeat": repeat,
+            "bearoff_db": BearoffDatabase.default() is not None,
+        },
+        "results": results,
+    }
+
+
+def compare_results(baseline: Dict, current: Dict, threshold: float) -> List[str]:
+    """
+    Devuelve las operaciones más lentas que en la corrida de referencia.
+
+    Args:
+        baseline (Dict): Resultado anterior de ``run_suite``
+        current (Dict): Resultado nuevo de ``run_suite``
+        threshold (float): Pérdida relativa tolerada (0.1 = 10 %)
+
+    Returns:
+        List[str]: Una línea por regresión; vacía si no hay
+    """
+    regressions = []
+    for key, result in current["results"].items():
+        before = baseline["results"].get(key)
+        if before is None or not before["ops_per_sec"]:
+            continue
+        ratio = result["ops_per_sec"] / before["ops_per_sec"]
+        if ratio < 1 - threshold:
+            regressions.append(f"{key}: {before['ops_per_sec']:.0f} -> {result['ops_per_sec']:.0f} ops/s ({ratio - 1:+.1%})")
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--output", help="Archivo JSON donde guardar los resultados")
+    parser.add_argument("--compare", help="Archivo JSON de una corrida anterior")
+    parser.add_argument("--threshold", type=float, default=0.1)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    report = run_suite(args.min_time, args.repeat)
+    print(f"{'operación/posición':40} {'ops/s':>12} {'pico B/op':>10} {'bloques':>8}")
+    for key, result in report["results"].items():
+        print(f"{key:40} {result['ops_per_sec']:12.0f} {result['peak_bytes_per_op']:10.0f} {result['retained_blocks']:8d}")
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as handle:
+            json.dump(report, handle, indent=2)
+    if args.compare:
+        with open(args.compare, encoding="utf-8") as handle:
+            regressions = compare_results(json.load(handle), report, args.threshold)
+        for line in regressions:
+            print(f"REGRESIÓN {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,7 @@
+import argparse
+
 from core.game import BackgammonGame
+from core.instrumentation import EngineProfiler
 from core.board import BEAR_OFF_B_POINT, BEAR_OFF_W_POINT
 
 
@@ -23,6 +26,30 @@ def print_board(board):
 def main():
     """
     Función principal para correr el juego en modo CLI.
+
+    Con ``--profile ARCHIVO`` instrumenta el motor durante la partida y, al
+    salir, imprime el informe y guarda las estadísticas de cProfile.
+    """
+    parser = argparse.ArgumentParser(description="Backgammon en la línea de comandos.")
+    parser.add_argument("--profile", nargs="?", const="cli.pstats", metavar="ARCHIVO",
+                        help="Perfila el motor y guarda las estadísticas (por defecto cli.pstats)")
+    args = parser.parse_args()
+    if not args.profile:
+        play()
+        return
+    profiler = EngineProfiler(profile=True)
+    profiler.enable()
+    try:
+        play()
+    finally:
+        profiler.disable()
+        print(profiler.report())
+        profiler.dump_profile(args.profile)
+        print(f"Estadísticas de cProfile guardadas en {args.profile}")
+
+
+def play():
+    """
     Gestiona el flujo del juego, recibe inputs del usuario y muestra el estado.
     """
     game = BackgammonGame()
@@ -0,0 +1,262 @@
+"""
+Análisis por lotes de posiciones: mejores jugadas de cada posición de un archivo.
+
+Cada línea de entrada tiene un ID de posición y un ID de turno (el color que
+mueve y sus dados), como los de ``core.position_id.encode_game``; las líneas
+vacías o que empiezan con ``#`` se saltean. Por cada posición se escribe una
+línea JSON con las mejores jugadas y su valor: con el evaluador en posiciones
+con contacto y con ``core.race`` (probabilidad de ganar) en las carreras.
+
+La entrada se lee y la salida se escribe de a bloques de líneas, con una
+cantidad acotada de bloques en vuelo en el pool de procesos, así que la
+memoria no depende del tamaño del archivo. Después de cada bloque escrito se
+guarda un punto de control (``<salida>.ckpt``) con los bloques terminados y
+el tamaño de la salida; ``--resume`` retoma desde ahí una corrida
+interrumpida, descartando lo que se haya escrito a medias.
+
+Uso:
+    python -m core.analysis posiciones.txt analisis.jsonl --workers 4
+"""
+import argparse
+import json
+import os
+import time
+from collections import deque
+from itertools import islice
+from multiprocessing import Pool
+from typing import Dict, Iterable, Iterator, List, Tuple
+
+import numpy as np
+
+from core.bearoff import BearoffDatabase
+from core.evaluation import HeuristicEvaluator, MLPEvaluator, evaluate_plays
+from core.moves import generate_plays
+from core.position_id import decode_position, decode_turn
+from core.race import has_contact, race_play_values
+from core.record import open_record
+from core.search import load_board
+
+DEFAULT_CHUNK_SIZE = 500
+DEFAULT_TOP = 3
+CHECKPOINT_SUFFIX = ".ckpt"
+
+Chunk = Tuple[int, List[str]]
+
+
+def analyze_position(position_id: str, turn_id: str, evaluator, bearoff: BearoffDatabase | None = None,
+                     top: int = DEFAULT_TOP) -> Dict:
+    """
+    Valora todas las jugadas legales de una posición y devuelve las mejores.
+
+    Args:
+        position_id (str): ID de posición
+        turn_id (str): ID de turno con el color que mueve y sus dados
+        evaluator: Objeto con método ``evaluate(features)``
+        bearoff (BearoffDatabase | None): Base para las carreras
+        top (int): Cantidad de jugadas a devolver
+
+    Returns:
+        Dict: Color, dados, método ("evaluator" o "race"), cantidad de jugadas
+            legales y las ``top`` mejores, cada una con sus movimientos
+            (origen, dado) y su valor
+
+    Raises:
+        ValueError: Si algún ID no es válido o el turno no tiene dados
+    """
+    board, players = load_board(*decode_position(position_id))
+    color, dice = decode_turn(turn_id)
+    if not dice:
+        raise ValueError("El turno no tiene dados.")
+    player = players[color]
+    plays = generate_plays(board, player, dice)
+    method = "evaluator" if has_contact(board) else "race"
+    best = []
+    if plays:
+        if method == "race":
+            values = race_play_values(board, player, plays, bearoff)
+        else:
+            values = evaluate_plays(board, player, plays, evaluator)
+        for index in np.argsort(-values, kind="stable")[:top]:
+            best.append({"moves": [list(move) for move in plays[index]], "value": round(float(values[index]), 6)})
+    return {"color": color, "dice": dice, "method": method, "legal": len(plays), "plays": best}
+
+
+def init_worker(weights: str | None, top: int):
+    """Carga el evaluador y la base de bear-off propios de cada proceso."""
+    global _worker_state
+    evaluator = MLPEvaluator.load(weights) if weights else HeuristicEvaluator()
+    _worker_state = (evaluator, BearoffDatabase.default(), top)
+
+
+def analyze_chunk(chunk: Chunk) -> Tuple[str, int, int]:
+    """
+    Analiza un bloque de líneas dentro de un proceso.
+
+    Args:
+        chunk (Chunk): Número de la primera línea (desde 1) y las líneas del bloque
+
+    Returns:
+        Tuple[str, int, int]: Texto de salida del bloque, posiciones analizadas
+            y posiciones con error
+    """
+    evaluator, bearoff, top = _worker_state
+    first, lines = chunk
+    output, positions, errors = [], 0, 0
+    for number, line in enumerate(lines, first):
+        fields = line.split()
+        if not fields or fields[0].startswith("#"):
+            continue
+        positions += 1
+        record = {"line": number, "position": fields[0], "turn": fields[1] if len(fields) > 1 else None}
+        try:
+            if len(fields) != 2:
+                raise ValueError("Se esperaba un ID de posición y un ID de turno.")
+            record.update(analyze_position(fields[0], fields[1], evaluator, bearoff, top))
+        except ValueError as error:
+            errors += 1
+            record["error"] = str(error)
+        output.append(json.dumps(record, separators=(",", ":")) + "\n")
+    return "".join(output), positions, errors
+
+
+def read_chunks(lines: Iterable[str], chunk_size: int) -> Iterator[Chunk]:
+    """
+    Agrupa las líneas de entrada en bloques, sin leer el archivo completo.
+
+    Args:
+        lines (Iterable[str]): Líneas de entrada
+        chunk_size (int): Líneas por bloque
+
+    Yields:
+        Chunk: Número de la primera línea del bloque (desde 1) y sus líneas
+    """
+    iterator = iter(lines)
+    first = 1
+    while True:
+        lines = list(islice(iterator, chunk_size))
+        if not lines:
+            return
+        yield first, lines
+        first += len(lines)
+
+
+def _bounded_imap(pool: Pool, chunks: Iterator[Chunk], window: int) -> Iterator[Tuple[str, int, int]]:
+    """Como ``pool.imap`` pero con a lo sumo ``window`` bloques leídos y sin escribir."""
+    pending = deque()
+    for chunk in chunks:
+        pending.append(pool.apply_async(analyze_chunk, (chunk,)))
+        if len(pending) >= window:
+            yield pending.popleft().get()
+    while pending:
+        yield pending.popleft().get()
+
+
+def _load_checkpoint(path: str, input_path: str, chunk_size: int) -> Dict:
+    with open(path, encoding="ascii") as handle:
+        state = json.load(handle)
+    if state["input"] != os.path.abspath(input_path) or state["chunk_size"] != chunk_size:
+        raise ValueError("El punto de control corresponde a otra entrada o a otro tamaño de bloque.")
+    return state
+
+
+def _save_checkpoint(path: str, state: Dict):
+    """Escribe el punto de control de forma atómica."""
+    temporary = path + ".tmp"
+    with open(temporary, "w", encoding="ascii") as handle:
+        json.dump(state, handle)
+    os.replace(temporary, path)
+
+
+def run_analysis(input_path: str, output_path: str, workers: int = 1, chunk_size: int = DEFAULT_CHUNK_SIZE,
+                 top: int = DEFAULT_TOP, weights: str | None = None, resume: bool = False) -> Dict[str, float]:
+    """
+    Analiza todas las posiciones de un archivo y escribe una línea JSON por posición.
+
+    La salida conserva el orden de la entrada. Con ``resume`` se saltean los
+    bloques que el punto de control da por terminados y se sigue agregando a
+    la salida; sin él, la salida y el punto de control se empiezan de cero.
+
+    Args:
+        input_path (str): Archivo de posiciones (puede estar comprimido con gzip)
+        output_path (str): Archivo de resultados
+        workers (int): Procesos a utilizar (1 analiza en el proceso actual)
+        chunk_size (int): Líneas de entrada por bloque
+        top (int): Jugadas a informar por posición
+        weights (str | None): Pesos de un ``MLPEvaluator``; por defecto el heurístico
+        resume (bool): Si se retoma una corrida interrumpida
+
+    Returns:
+        Dict[str, float]: Posiciones, errores, bloques, bloques retomados,
+            segundos y posiciones por segundo de esta corrida
+
+    Raises:
+        ValueError: Si el punto de control no corresponde a la entrada
+    """
+    checkpoint_path = output_path + CHECKPOINT_SUFFIX
+    state = {"input": os.path.abspath(input_path), "chunk_size": chunk_size, "chunks": 0, "offset": 0,
+             "positions": 0, "errors": 0}
+    if resume and os.path.exists(checkpoint_path) and os.path.exists(output_path):
+        state = _load_checkpoint(checkpoint_path, input_path, chunk_size)
+    resumed = state["chunks"]
+    positions = errors = 0
+
+    start_time = time.perf_counter()
+    with open_record(input_path) as source, open(output_path, "r+" if resumed else "w", encoding="ascii") as output:
+        output.truncate(state["offset"])
+        output.seek(state["offset"])
+        chunks = islice(read_chunks(source, chunk_size), resumed, None)
+        if workers <= 1:
+            init_worker(weights, top)
+            results = map(analyze_chunk, chunks)
+            pool = None
+        else:
+            pool = Pool(workers, initializer=init_worker, initargs=(weights, top))
+            results = _bounded_imap(pool, chunks, 2 * workers)
+        try:
+            for text, count, failed in results:
+                output.write(text)
+                output.flush()
+                positions += count
+                errors += failed
+                state.update(chunks=state["chunks"] + 1, offset=output.tell(),
+                             positions=state["positions"] + count, errors=state["errors"] + failed)
+                _save_checkpoint(checkpoint_path, state)
+        finally:
+            if pool is not None:
+                pool.terminate()
+                pool.join()
+    elapsed = time.perf_counter() - start_time
+    return {
+        "positions": positions,
+        "errors": errors,
+        "chunks": state["chunks"] - resumed,
+        "resumed_chunks": resumed,
+        "total_positions": state["positions"],
+        "seconds": elapsed,
+        "positions_per_sec": positions / elapsed if elapsed else 0.0,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Análisis por lotes de posiciones.")
+    parser.add_argument("input", help="Archivo con un ID de posición y un ID de turno por línea")
+    parser.add_argument("output", help="Archivo de resultados (una línea JSON por posición)")
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    parser.add_argument("--top", type=int, default=DEFAULT_TOP)
+    parser.add_argument("--weights", help="Pesos de un MLPEvaluator (.npz)")
+    parser.add_argument("--resume", action="store_true", help="Retoma desde el último bloque terminado")
+    args = parser.parse_args()
+
+    stats = run_analysis(args.input, args.output, args.workers, args.chunk_size, args.top, args.weights,
+                         args.resume)
+    if stats["resumed_chunks"]:
+        print(f"Retomado:           {stats['resumed_chunks']} bloques ya terminados")
+    print(f"Posiciones:         {stats['positions']} en {stats['seconds']:.2f} s "
+          f"({stats['positions_per_sec']:.1f}/s, {stats['total_positions']} en total)")
+    if stats["errors"]:
+        print(f"Con error:          {stats['errors']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,359 @@
+"""
+Base de datos de retirada de fichas (bear-off) de un solo lado.
+
+Para cada distribución de hasta 15 fichas en los 6 puntos del home board guarda
+la cantidad esperada de tiradas para retirarlas todas y la distribución de esa
+cantidad, jugando siempre para minimizar el valor esperado. Las reglas de
+retirada son las de ``Board.is_valid_move``: una ficha se retira con el dado
+exacto, o con uno mayor si no hay fichas propias más cerca de la salida.
+
+El archivo se genera una vez con:
+    python -m core.bearoff --checkers 15 --output assets/bearoff.db
+"""
+import argparse
+import mmap
+import os
+import struct
+import time
+from array import array
+from math import comb
+from operator import itemgetter
+from typing import List, Tuple
+
+import numpy as np
+
+from core.board import HOME_MASKS
+from core.dice import ROLLS
+
+POINTS = 6
+MAX_ROLLS = 32
+MAGIC = b"BGBO"
+HEADER = struct.Struct("<4sBBBBI")
+RECORD = struct.Struct(f"<f{MAX_ROLLS}H")
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "bearoff.db")
+
+Position = Tuple[int, ...]
+
+
+def _prefix_table(max_checkers: int) -> List[List[List[int]]]:
+    """
+    Precalcula, para ``m`` puntos restantes y ``r`` fichas disponibles, cuántas
+    posiciones quedan antes de poner ``c`` fichas en el punto actual.
+    """
+    table = []
+    for m in range(POINTS):
+        rows = []
+        for r in range(max_checkers + 1):
+            prefix = [0]
+            for v in range(r + 1):
+                prefix.append(prefix[-1] + comb(r - v + m, m))
+            rows.append(prefix)
+        table.append(rows)
+    return table
+
+
+class PositionIndexer:
+    """
+    Convierte posiciones del home board en índices consecutivos y viceversa.
+
+    Attributes:
+        __max_checkers__ (int): Máximo de fichas por posición
+        __prefix__ (List): Tabla de sumas combinatorias para el ranking
+    """
+
+    def __init__(self, max_checkers: int = 15):
+        self.__max_checkers__ = max_checkers
+        self.__prefix__ = _prefix_table(max_checkers)
+
+    def get_max_checkers(self) -> int:
+        """Devuelve la cantidad máxima de fichas de las posiciones indexadas."""
+        return self.__max_checkers__
+
+    def size(self) -> int:
+        """Devuelve la cantidad de posiciones distintas (incluida la vacía)."""
+        return comb(self.__max_checkers__ + POINTS, POINTS)
+
+    def index(self, position: Position) -> int:
+        """
+        Devuelve el índice de una posición.
+
+        Args:
+            position (Position): Fichas a distancia 1..6 de la salida
+
+        Returns:
+            int: Índice entre 0 y ``size() - 1``
+
+        Raises:
+            ValueError: Si la posición tiene más fichas que el máximo
+        """
+        remaining = self.__max_checkers__
+        rank = 0
+        for point, count in enumerate(position):
+            if count > remaining:
+                raise ValueError("La posición supera la cantidad máxima de fichas.")
+            rank += self.__prefix__[POINTS - 1 - point][remaining][count]
+            remaining -= count
+        return rank
+
+    def positions(self) -> List[Position]:
+        """Devuelve todas las posiciones, ordenadas por índice."""
+        result = []
+
+        def fill(prefix, remaining):
+            if len(prefix) == POINTS:
+                result.append(tuple(prefix))
+                return
+            for count in range(remaining + 1):
+                fill(prefix + [count], remaining - count)
+
+        fill([], self.__max_checkers__)
+        return result
+
+
+def successors(position: Position, die_value: int) -> List[Position]:
+    """
+    Devuelve las posiciones alcanzables moviendo una ficha con un dado.
+
+    Args:
+        position (Position): Fichas a distancia 1..6 de la salida
+        die_value (int): Valor del dado
+
+    Returns:
+        List[Position]: Posiciones resultantes (vacía si no hay fichas)
+    """
+    result = []
+    lowest = next((point for point, count in enumerate(position) if count), None)
+    for point, count in enumerate(position):
+        if not count:
+            continue
+        distance = point + 1
+        if die_value > distance and point != lowest:
+            continue
+        moved = list(position)
+        moved[point] -= 1
+        if die_value < distance:
+            moved[point - die_value] += 1
+        result.append(tuple(moved))
+    return result
+
+
+def build_tables(max_checkers: int = 15) -> Tuple[array, np.ndarray]:
+    """
+    Calcula las tiradas esperadas y su distribución para todas las posiciones.
+
+    Args:
+        max_checkers (int): Máximo de fichas por posición
+
+    Returns:
+        Tuple[array, np.ndarray]: Valor esperado por índice y matriz
+            (posiciones, MAX_ROLLS) con la probabilidad de terminar en n tiradas
+    """
+    indexer = PositionIndexer(max_checkers)
+    positions = indexer.positions()
+    size = len(positions)
+    expected = array("d", [0.0]) * size
+    distribution = np.zeros((size, MAX_ROLLS), dtype=np.float64)
+    distribution[0, 0] = 1.0
+    moves = [[None] * size for _ in range(7)]
+    best_value = {(times, die): array("d", [-1.0]) * size for times in range(1, 5) for die in range(1, 7)}
+    best_final = {(times, die): array("l", [0]) * size for times in range(1, 5) for die in range(1, 7)}
+
+    def next_indices(idx, die):
+        cached = moves[die][idx]
+        if cached is None:
+            cached = moves[die][idx] = [indexer.index(nxt) for nxt in successors(positions[idx], die)]
+        return cached
+
+    def best_after(idx, die, times):
+        """Mejor (valor, índice final) jugando ``times`` veces ``die`` desde ``idx``."""
+        if times == 0 or idx == 0:
+            return expected[idx], idx
+        values, finals = best_value[times, die], best_final[times, die]
+        if values[idx] < 0:
+            values[idx], finals[idx] = min(
+                (best_after(nxt, die, times - 1) for nxt in next_indices(idx, die)), key=itemgetter(0)
+            )
+        return values[idx], finals[idx]
+
+    order = sorted(range(1, size), key=lambda i: sum((p + 1) * c for p, c in enumerate(positions[i])))
+    weights = np.array([probability for _, _, probability in ROLLS])
+    for idx in order:
+        finals = []
+        total = 0.0
+        for a, b, probability in ROLLS:
+            if a == b:
+                value, final = best_after(idx, a, 4)
+            else:
+                value, final = min(
+                    [best_after(nxt, b, 1) for nxt in next_indices(idx, a)]
+                    + [best_after(nxt, a, 1) for nxt in next_indices(idx, b)],
+                    key=itemgetter(0),
+                )
+            total += probability * value
+            finals.append(final)
+        expected[idx] = 1.0 + total
+        mixed = weights @ distribution[finals]
+        distribution[idx, 1:] = mixed[:-1]
+        distribution[idx, -1] += mixed[-1]
+    return expected, distribution
+
+
+def build_database(path: str = DEFAULT_PATH, max_checkers: int = 15):
+    """
+    Genera el archivo binario de la base de datos.
+
+    Formato: cabecera ``HEADER`` (magia, versión, fichas, puntos, tiradas,
+    cantidad de posiciones) seguida de un registro ``RECORD`` por posición con
+    el valor esperado (float32) y la distribución en 1/65535 (uint16).
+
+    Args:
+        path (str): Archivo de salida
+        max_checkers (int): Máximo de fichas por posición
+    """
+    expected, distribution = build_tables(max_checkers)
+    quantized = np.rint(distribution * 65535).astype(np.uint16)
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, 1, max_checkers, POINTS, MAX_ROLLS, len(expected)))
+        for idx, value in enumerate(expected):
+            handle.write(RECORD.pack(value, *quantized[idx]))
+
+
+def home_counts(board, color: str) -> Position:
+    """
+    Devuelve las fichas de un color a distancia 1..6 de su salida.
+
+    Args:
+        board (Board): Tablero
+        color (str): Color del jugador
+
+    Returns:
+        Position: Cantidad de fichas en cada punto del home board
+    """
+    counts = board.get_counts()
+    if color == "W":
+        return tuple(max(counts[24 - distance], 0) for distance in range(1, POINTS + 1))
+    return tuple(max(-counts[distance - 1], 0) for distance in range(1, POINTS + 1))
+
+
+def is_pure_bear_off(board) -> bool:
+    """
+    Indica si ambos jugadores están retirando fichas y ya no hay contacto.
+
+    Equivale a ``is_ready_to_bear_off`` para los dos colores: ninguna ficha en
+    la barra ni fuera de su home board.
+
+    Args:
+        board (Board): Tablero
+
+    Returns:
+        bool: True si la posición es una retirada pura para ambos
+    """
+    if board.get_bar("W") or board.get_bar("B"):
+        return False
+    return not (board.get_occupied_mask("W") & ~HOME_MASKS["W"] or board.get_occupied_mask("B") & ~HOME_MASKS["B"])
+
+
+class BearoffDatabase:
+    """
+    Consulta la base de datos de retirada mapeando el archivo en memoria.
+
+    Abrirla no lee los registros: cada consulta calcula el índice de la
+    posición y lee sólo su registro.
+
+    Attributes:
+        __file__ (file): Archivo abierto
+        __map__ (mmap.mmap): Mapeo en memoria del archivo
+        __indexer__ (PositionIndexer): Conversor de posiciones a índices
+        __count__ (int): Cantidad de posiciones almacenadas
+    """
+
+    _default = None
+
+    def __init__(self, path: str = DEFAULT_PATH):
+        """
+        Args:
+            path (str): Archivo generado con ``build_database``
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        self.__file__ = open(path, "rb")
+        self.__map__ = mmap.mmap(self.__file__.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, max_checkers, points, rolls, count = HEADER.unpack_from(self.__map__, 0)
+        if magic != MAGIC or version != 1 or points != POINTS or rolls != MAX_ROLLS:
+            self.close()
+            raise ValueError("Archivo de bear-off inválido.")
+        self.__indexer__ = PositionIndexer(max_checkers)
+        self.__count__ = count
+
+    @classmethod
+    def default(cls) -> "BearoffDatabase | None":
+        """
+        Devuelve la base de datos de ``DEFAULT_PATH`` si fue generada.
+
+        Returns:
+            BearoffDatabase | None: Instancia compartida, o None si no existe el archivo
+        """
+        if cls._default is None and os.path.exists(DEFAULT_PATH):
+            cls._default = cls(DEFAULT_PATH)
+        return cls._default
+
+    def get_max_checkers(self) -> int:
+        """Devuelve la cantidad máxima de fichas por posición de la base."""
+        return self.__indexer__.get_max_checkers()
+
+    def covers(self, position: Position) -> bool:
+        """Indica si la posición tiene pocas fichas como para estar en la base."""
+        return sum(position) <= self.get_max_checkers()
+
+    def _record_offset(self, position: Position) -> int:
+        return HEADER.size + self.__indexer__.index(position) * RECORD.size
+
+    def expected_rolls(self, position: Position) -> float:
+        """
+        Devuelve la cantidad esperada de tiradas para retirar todas las fichas.
+
+        Args:
+            position (Position): Fichas a distancia 1..6 de la salida
+
+        Returns:
+            float: Tiradas esperadas
+        """
+        return struct.unpack_from("<f", self.__map__, self._record_offset(position))[0]
+
+    def roll_distribution(self, position: Position) -> List[float]:
+        """
+        Devuelve la probabilidad de terminar en exactamente n tiradas.
+
+        Args:
+            position (Position): Fichas a distancia 1..6 de la salida
+
+        Returns:
+            List[float]: Probabilidad para n = 0..MAX_ROLLS-1
+        """
+        record = RECORD.unpack_from(self.__map__, self._record_offset(position))
+        return [value / 65535 for value in record[1:]]
+
+    def close(self):
+        """Libera el mapeo y cierra el archivo."""
+        self.__map__.close()
+        self.__file__.close()
+
+    def __len__(self) -> int:
+        return self.__count__
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera la base de datos de bear-off.")
+    parser.add_argument("--checkers", type=int, default=15)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    build_database(args.output, args.checkers)
+    size = os.path.getsize(args.output)
+    print(f"Base generada en {args.output}: {size / 1024:.0f} KiB en {time.perf_counter() - start:.1f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,214 @@
-from typing import List, Dict
+import weakref
+from typing import Dict, Iterator, List, NamedTuple, Tuple
 from core.player import Player
+from core.zobrist import POINT_KEYS, BAR_KEYS, OFF_KEYS, compute_hash
 
 BEAR_OFF_W_POINT = 24
 BEAR_OFF_B_POINT = -1
 
+# Máscaras de 24 bits: el bit i corresponde al punto i.
+POINTS_MASK = (1 << 24) - 1
+HOME_MASKS = {"W": POINTS_MASK ^ ((1 << 18) - 1), "B": (1 << 6) - 1}
+OPPONENT = {"W": "B", "B": "W"}
+
+
+def longest_run(mask: int) -> int:
+    """
+    Devuelve la cantidad de bits consecutivos en 1 más larga de una máscara.
+
+    Cada paso ``mask & (mask << 1)`` acorta todas las series en uno, así que
+    la cantidad de pasos hasta vaciar la máscara es el largo de la mayor.
+
+    Args:
+        mask (int): Máscara de puntos
+
+    Returns:
+        int: Largo de la serie más larga (por ejemplo, del prime más largo)
+    """
+    length = 0
+    while mask:
+        mask &= mask << 1
+        length += 1
+    return length
+
+
+def shot_mask(blots: int, attackers: int, attacker_color: str, attacker_on_bar: bool) -> int:
+    """
+    Devuelve los blots que el rival puede golpear con un solo dado (a 1-6 pips).
+
+    Un golpe con un solo dado no puede bloquearse: sólo importa la distancia
+    entre el blot y las fichas del rival que tiene detrás.
+
+    Args:
+        blots (int): Máscara de blots del color expuesto
+        attackers (int): Máscara de puntos ocupados por el rival
+        attacker_color (str): Color del rival
+        attacker_on_bar (bool): Si el rival tiene fichas en la barra (entran
+            como desde el punto -1 las Blancas o 24 las Negras)
+
+    Returns:
+        int: Máscara de los blots expuestos a un tiro directo
+    """
+    reach = 0
+    if attacker_color == "W":
+        for distance in range(1, 7):
+            reach |= attackers << distance
+        if attacker_on_bar:
+            reach |= HOME_MASKS["B"]
+    else:
+        for distance in range(1, 7):
+            reach |= attackers >> distance
+        if attacker_on_bar:
+            reach |= HOME_MASKS["W"]
+    return blots & reach & POINTS_MASK
+
+
+class MoveRecord(NamedTuple):
+    """Registro mínimo de un movimiento para poder deshacerlo."""
+    from_point: int
+    to_point: int
+    hit: bool
+    borne_off: bool
+
+
+QUADRANT = 6
+_EMPTY: Tuple[Player, ...] = ()
+# Tuplas de puntos compartidas por todas las fotos: por jugador, la de n fichas.
+_POINT_TUPLES: "weakref.WeakKeyDictionary[Player, List[Tuple[Player, ...]]]" = weakref.WeakKeyDictionary()
+
+
+def _point_tuple(player: Player, count: int) -> Tuple[Player, ...]:
+    """Devuelve la tupla compartida con ``count`` fichas de un jugador."""
+    tuples = _POINT_TUPLES.get(player)
+    if tuples is None:
+        tuples = _POINT_TUPLES[player] = [_EMPTY]
+    while len(tuples) <= count:
+        tuples.append((player,) * len(tuples))
+    return tuples[count]
+
+
+class BoardSnapshot:
+    """
+    Foto inmutable y hasheable de un ``Board``.
+
+    Los 24 puntos se guardan en cuatro cuadrantes de seis tuplas. Una foto
+    tomada después de mover reutiliza los cuadrantes sin cambios de la foto
+    anterior del mismo tablero, y las tuplas de los puntos se comparten entre
+    todas las fotos, así que miles de posiciones hermanas sólo ocupan memoria
+    por los cuadrantes tocados. El hash es el Zobrist de la posición.
+
+    Attributes:
+        __quadrants__ (Tuple[Tuple[Tuple[Player, ...], ...], ...]): Fichas de cada punto por cuadrante
+        __counters__ (Tuple[int, int, int, int]): Barra de Blancas y Negras y retiradas de Blancas y Negras
+        __zobrist__ (int): Hash Zobrist de la posición
+        __players__ (Tuple[Tuple[str, Player], ...]): Últimos jugadores golpeados por color
+    """
+
+    __slots__ = ("__quadrants__", "__counters__", "__zobrist__", "__players__")
+
+    def __init__(self, quadrants, counters, zobrist, players):
+        object.__setattr__(self, "__quadrants__", quadrants)
+        object.__setattr__(self, "__counters__", counters)
+        object.__setattr__(self, "__zobrist__", zobrist)
+        object.__setattr__(self, "__players__", players)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("BoardSnapshot es inmutable.")
+
+    def __reduce__(self):
+        return BoardSnapshot, tuple(getattr(self, name) for name in self.__slots__)
+
+    def get_quadrants(self) -> Tuple[Tuple[Tuple[Player, ...], ...], ...]:
+        """Devuelve los cuatro cuadrantes de seis puntos (compartidos con otras fotos)."""
+        return self.__quadrants__
+
+    def get_point(self, index: int) -> Tuple[Player, ...]:
+        """
+        Devuelve las fichas de un punto.
+
+        Args:
+            index (int): Índice del punto (0-23)
+
+        Returns:
+            Tuple[Player, ...]: Fichas en ese punto
+
+        Raises:
+            IndexError: Si el índice está fuera del rango válido
+        """
+        if 0 <= index < 24:
+            return self.__quadrants__[index // QUADRANT][index % QUADRANT]
+        raise IndexError("Índice de punto inválido")
+
+    def get_counts(self) -> List[int]:
+        """Devuelve los 24 conteos con signo, como ``Board.get_counts``."""
+        return [
+            (len(point) if point[0].get_color() == "W" else -len(point)) if point else 0
+            for quadrant in self.__quadrants__ for point in quadrant
+        ]
+
+    def get_bar(self, color: str) -> int:
+        """Devuelve la cantidad de fichas en la barra de un color."""
+        return self.__counters__[0 if color == "W" else 1]
+
+    def get_borne_off(self, color: str) -> int:
+        """Devuelve la cantidad de fichas retiradas de un color."""
+        return self.__counters__[2 if color == "W" else 3]
+
+    def get_hash(self) -> int:
+        """Devuelve el hash Zobrist de la posición."""
+        return self.__zobrist__
+
+    def __hash__(self) -> int:
+        return self.__zobrist__
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, BoardSnapshot):
+            return NotImplemented
+        return self is other or (self.__zobrist__ == other.__zobrist__ and self.__counters__ == other.__counters__
+                                 and self.__quadrants__ == other.__quadrants__)
+
+
+def _checkers_in_position(counts: List[int], bar: Tuple[int, int]) -> Dict[str, int]:
+    """
+    Cuenta las fichas de cada color en el tablero y la barra de una posición.
+
+    Raises:
+        ValueError: Si no hay 24 conteos, la barra es negativa o algún color supera las 15 fichas
+    """
+    if len(counts) != 24:
+        raise ValueError("Se esperaban 24 conteos.")
+    on_board = {
+        "W": sum(count for count in counts if count > 0) + bar[0],
+        "B": -sum(count for count in counts if count < 0) + bar[1],
+    }
+    if min(bar) < 0 or max(on_board.values()) > 15:
+        raise ValueError("Cantidad de fichas inválida.")
+    return on_board
+
 
 class Board:
     """
     Representa el tablero de Backgammon con 24 puntos y la barra.
+
+    Además de las fichas, el tablero mantiene de forma incremental el pip count,
+    las fichas en el home board y el punto ocupado más avanzado de cada color,
+    por lo que las fichas deben moverse siempre a través de sus métodos.
     
     Attributes:
         __points__ (List[List[Player]]): Lista de 24 puntos, cada uno contiene fichas (Players)
         __borne_off__ (Dict[str, int]): Fichas retiradas por cada jugador
         __bar__ (Dict[str, int]): Fichas en la barra por cada jugador
+        __pips__ (Dict[str, int]): Pip count de cada jugador
+        __home__ (Dict[str, int]): Fichas en el home board de cada jugador
+        __front__ (Dict[str, int]): Punto ocupado más cercano a la salida de cada jugador
+        __occupied__ (Dict[str, int]): Máscara de 24 bits de los puntos con fichas de cada color
+        __made__ (Dict[str, int]): Máscara de los puntos con 2 o más fichas de cada color
+        __exposed__ (bool): True si ``get_all_points`` entregó las listas internas
+            y el estado incremental debe reconstruirse antes de usarse
+        __zobrist__ (int): Hash Zobrist de la posición
+        __players__ (Dict[str, Player]): Último jugador golpeado de cada color, para deshacer golpes
+        __base__ (BoardSnapshot | None): Última foto tomada o restaurada, con la que
+            ``snapshot`` comparte los puntos sin cambios
     """
 
     def __init__(self):
@@ -20,6 +216,15 @@ class Board:
         self.__points__: List[List[Player]] = [[] for _ in range(24)]
         self.__borne_off__: Dict[str, int] = {"W": 0, "B": 0}
         self.__bar__: Dict[str, int] = {"W": 0, "B": 0}
+        self.__pips__: Dict[str, int] = {"W": 0, "B": 0}
+        self.__home__: Dict[str, int] = {"W": 0, "B": 0}
+        self.__front__: Dict[str, int] = {"W": -1, "B": 24}
+        self.__occupied__: Dict[str, int] = {"W": 0, "B": 0}
+        self.__made__: Dict[str, int] = {"W": 0, "B": 0}
+        self.__exposed__: bool = False
+        self.__zobrist__: int = 0
+        self.__players__: Dict[str, Player] = {}
+        self.__base__: BoardSnapshot | None = None
 
     def setup_initial_checkers(self, p1: Player, p2: Player):
         """
@@ -29,10 +234,7 @@ class Board:
             p1 (Player): Primer jugador (Blancas)
             p2 (Player): Segundo jugador (Negras)
         """
-        self.__points__ = [[] for _ in range(24)]
-        self.__borne_off__ = {"W": 0, "B": 0}
-        self.__bar__ = {"W": 0, "B": 0}
-
+        self._clear()
         initial_setup = {
             0: (p1, 2), 5: (p2, 5), 7: (p2, 3), 11: (p1, 5),
             12: (p2, 5), 16: (p1, 3), 18: (p1, 5), 23: (p2, 2),
@@ -41,6 +243,48 @@ class Board:
             for _ in range(count):
                 self.place_checker(point, player)
 
+    def setup_position(self, p1: Player, p2: Player, counts: List[int], bar: Tuple[int, int] = (0, 0)):
+        """
+        Configura una posición arbitraria a partir de conteos con signo.
+
+        Las fichas de cada color que no están en el tablero ni en la barra se
+        consideran retiradas.
+
+        Args:
+            p1 (Player): Primer jugador (Blancas)
+            p2 (Player): Segundo jugador (Negras)
+            counts (List[int]): 24 conteos, positivos para Blancas y negativos para Negras
+            bar (Tuple[int, int]): Fichas en la barra de Blancas y Negras
+
+        Raises:
+            ValueError: Si no hay 24 conteos o algún color supera las 15 fichas
+        """
+        on_board = _checkers_in_position(counts, bar)
+        self._clear()
+        for point, count in enumerate(counts):
+            for _ in range(abs(count)):
+                self.place_checker(point, p1 if count > 0 else p2)
+        for player, count in ((p1, bar[0]), (p2, bar[1])):
+            for _ in range(count):
+                self._send_to_bar(player)
+        for color, count in on_board.items():
+            for _ in range(15 - count):
+                self.__borne_off__[color] += 1
+                self.__zobrist__ ^= OFF_KEYS[color][self.__borne_off__[color]]
+
+    def _clear(self):
+        """Vacía el tablero, la barra y las fichas retiradas."""
+        self.__points__ = [[] for _ in range(24)]
+        self.__borne_off__ = {"W": 0, "B": 0}
+        self.__bar__ = {"W": 0, "B": 0}
+        self.__pips__ = {"W": 0, "B": 0}
+        self.__home__ = {"W": 0, "B": 0}
+        self.__front__ = {"W": -1, "B": 24}
+        self.__occupied__ = {"W": 0, "B": 0}
+        self.__made__ = {"W": 0, "B": 0}
+        self.__exposed__ = False
+        self.__zobrist__ = 0
+
     def get_point(self, index: int) -> List[Player]:
         """
         Devuelve la lista de jugadores (fichas) en un punto.
@@ -49,13 +293,14 @@ class Board:
             index (int): Índice del punto (0-23)
             
         Returns:
-            List[Player]: Lista de fichas en ese punto
+            List[Player]: Copia de las fichas en ese punto; modificarla no
+                cambia el tablero
             
         Raises:
             IndexError: Si el índice está fuera del rango válido
         """
         if 0 <= index < 24:
-            return self.__points__[index]
+            return list(self.__points__[index])
         raise IndexError("Índice de punto inválido")
 
     def get_bar(self, color: str) -> int:
@@ -87,10 +332,139 @@ class Board:
         Devuelve todos los puntos del tablero.
         
         Returns:
-            List[List[Player]]: Lista con los 24 puntos
+            List[List[Player]]: Lista con los 24 puntos (las listas internas del tablero)
         """
+        self.__exposed__ = True
         return self.__points__
 
+    def get_counts(self) -> List[int]:
+        """
+        Devuelve la cantidad de fichas de cada punto con signo.
+
+        Returns:
+            List[int]: 24 conteos, positivos para Blancas y negativos para Negras
+        """
+        return [
+            (len(point) if point[0].get_color() == "W" else -len(point)) if point else 0
+            for point in self.__points__
+        ]
+
+    def copy(self) -> "Board":
+        """
+        Devuelve una copia independiente del tablero que comparte los jugadores.
+
+        Returns:
+            Board: Nuevo tablero con la misma posición
+        """
+        if self.__exposed__:
+            self._sync()
+        clone = Board()
+        clone.__points__ = [list(point) for point in self.__points__]
+        clone.__borne_off__ = dict(self.__borne_off__)
+        clone.__bar__ = dict(self.__bar__)
+        clone.__pips__ = dict(self.__pips__)
+        clone.__home__ = dict(self.__home__)
+        clone.__front__ = dict(self.__front__)
+        clone.__occupied__ = dict(self.__occupied__)
+        clone.__made__ = dict(self.__made__)
+        clone.__zobrist__ = self.__zobrist__
+        clone.__players__ = dict(self.__players__)
+        clone.__base__ = self.__base__
+        return clone
+
+    def snapshot(self) -> BoardSnapshot:
+        """
+        Devuelve una foto inmutable de la posición.
+
+        Los cuadrantes sin cambios desde la foto anterior (tomada o restaurada)
+        se reutilizan enteros. Tomar una foto no agrega trabajo a
+        ``make_move``/``unmake_move``: los cambios se detectan al comparar los
+        24 puntos con la foto anterior.
+
+        Returns:
+            BoardSnapshot: Foto de la posición, que pasa a ser la foto de referencia
+        """
+        if self.__exposed__:
+            self._sync()
+        base = self.__base__
+        points = self.__points__
+        quadrants = []
+        for q in range(4):
+            current = tuple(_point_tuple(point[0], len(point)) if point else _EMPTY
+                            for point in points[q * QUADRANT:(q + 1) * QUADRANT])
+            if base is not None and base.__quadrants__[q] == current:
+                current = base.__quadrants__[q]
+            quadrants.append(current)
+        counters = (self.__bar__["W"], self.__bar__["B"], self.__borne_off__["W"], self.__borne_off__["B"])
+        players = tuple(self.__players__.items())
+        if base is not None:
+            if counters == base.__counters__:
+                counters = base.__counters__
+            if players == base.__players__:
+                players = base.__players__
+        snapshot = BoardSnapshot(tuple(quadrants), counters, self.__zobrist__, players)
+        if base is not None and snapshot == base and players is base.__players__:
+            snapshot = base
+        self.__base__ = snapshot
+        return snapshot
+
+    @classmethod
+    def from_snapshot(cls, snapshot: BoardSnapshot) -> "Board":
+        """
+        Crea un tablero con la posición de una foto.
+
+        Args:
+            snapshot (BoardSnapshot): Foto devuelta por ``snapshot``
+
+        Returns:
+            Board: Tablero nuevo, que toma la foto como referencia
+        """
+        board = cls()
+        board.__points__ = [list(point) for quadrant in snapshot.__quadrants__ for point in quadrant]
+        bar_w, bar_b, off_w, off_b = snapshot.__counters__
+        board.__bar__ = {"W": bar_w, "B": bar_b}
+        board.__borne_off__ = {"W": off_w, "B": off_b}
+        board._recount()
+        board.__zobrist__ = snapshot.__zobrist__
+        board.__players__ = dict(snapshot.__players__)
+        board.__base__ = snapshot
+        return board
+
+    def _recount(self):
+        """Recalcula pips, home board, punto más avanzado y máscaras a partir de los puntos y la barra."""
+        pips = {"W": 25 * self.__bar__["W"], "B": 25 * self.__bar__["B"]}
+        home, front = {"W": 0, "B": 0}, {"W": -1, "B": 24}
+        occupied, made = {"W": 0, "B": 0}, {"W": 0, "B": 0}
+        for index, point in enumerate(self.__points__):
+            if not point:
+                continue
+            color = point[0].get_color()
+            occupied[color] |= 1 << index
+            if len(point) > 1:
+                made[color] |= 1 << index
+            if color == "W":
+                pips["W"] += (24 - index) * len(point)
+                home["W"] += len(point) if index >= 18 else 0
+                front["W"] = index
+            else:
+                pips["B"] += (index + 1) * len(point)
+                home["B"] += len(point) if index < 6 else 0
+                front["B"] = min(front["B"], index)
+        self.__pips__, self.__home__, self.__front__ = pips, home, front
+        self.__occupied__, self.__made__ = occupied, made
+
+    def _sync(self):
+        """
+        Reconstruye el estado incremental después de exponer las listas de los puntos.
+
+        ``get_all_points`` entrega las listas internas; si se modificaron por
+        fuera, las máscaras, el pip count, el home board y el hash se
+        recalculan antes del siguiente movimiento o consulta que los use.
+        """
+        self.__exposed__ = False
+        self._recount()
+        self.__zobrist__ = compute_hash(self)
+
     def place_checker(self, index: int, player: Player):
         """
         Coloca una ficha de un jugador en un punto del tablero.
@@ -103,10 +477,182 @@ class Board:
             IndexError: Si el índice está fuera del rango válido
         """
         if 0 <= index < 24:
-            self.__points__[index].append(player)
+            self._add_checker(index, player)
         else:
             raise IndexError("Índice de punto inválido")
 
+    def _add_checker(self, index: int, player: Player):
+        """Agrega una ficha a un punto y actualiza las estadísticas incrementales."""
+        if self.__exposed__:
+            self._sync()
+        point = self.__points__[index]
+        point.append(player)
+        color = player.get_color()
+        count = len(point)
+        self.__zobrist__ ^= POINT_KEYS[color][index][count]
+        # Sólo cambian las máscaras cuando el punto pasa a tener 1 o 2 fichas; los
+        # blots son los puntos ocupados que no están hechos.
+        if count == 1:
+            self.__occupied__[color] ^= 1 << index
+        elif count == 2:
+            self.__made__[color] ^= 1 << index
+        if color == "W":
+            self.__pips__["W"] += 24 - index
+            if index >= 18:
+                self.__home__["W"] += 1
+            if index > self.__front__["W"]:
+                self.__front__["W"] = index
+        else:
+            self.__pips__["B"] += index + 1
+            if index < 6:
+                self.__home__["B"] += 1
+            if index < self.__front__["B"]:
+                self.__front__["B"] = index
+
+    def _remove_checker(self, index: int) -> Player:
+        """Quita la última ficha de un punto y actualiza las estadísticas incrementales."""
+        if self.__exposed__:
+            self._sync()
+        point = self.__points__[index]
+        player = point[-1]
+        color = player.get_color()
+        count = len(point)
+        self.__zobrist__ ^= POINT_KEYS[color][index][count]
+        point.pop()
+        if count == 2:
+            self.__made__[color] ^= 1 << index
+        elif count == 1:
+            self.__occupied__[color] ^= 1 << index
+        if color == "W":
+            self.__pips__["W"] -= 24 - index
+            if index >= 18:
+                self.__home__["W"] -= 1
+            if not point and index == self.__front__["W"]:
+                self.__front__["W"] = self.__occupied__["W"].bit_length() - 1
+        else:
+            self.__pips__["B"] -= index + 1
+            if index < 6:
+                self.__home__["B"] -= 1
+            if not point and index == self.__front__["B"]:
+                occupied = self.__occupied__["B"]
+                self.__front__["B"] = (occupied & -occupied).bit_length() - 1 if occupied else 24
+        return player
+
+    def _is_occupied_by(self, index: int, color: str) -> bool:
+        """Indica si un punto tiene fichas de un color."""
+        return bool(self.__occupied__[color] >> index & 1)
+
+    def _send_to_bar(self, player: Player):
+        """Coloca en la barra una ficha golpeada."""
+        color = player.get_color()
+        self.__players__[color] = player
+        self.__bar__[color] += 1
+        self.__pips__[color] += 25
+        self.__zobrist__ ^= BAR_KEYS[color][self.__bar__[color]]
+
+    def _take_from_bar(self, color: str):
+        """Quita una ficha de la barra de un color."""
+        self.__zobrist__ ^= BAR_KEYS[color][self.__bar__[color]]
+        self.__bar__[color] -= 1
+        self.__pips__[color] -= 25
+
+    def get_hash(self) -> int:
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición (sin el turno).
+        
+        Returns:
+            int: Hash mantenido de forma incremental en cada movimiento
+        """
+        if self.__exposed__:
+            self._sync()
+        return self.__zobrist__
+
+    def pip_count(self, color: str) -> int:
+        """
+        Devuelve el pip count de un jugador (incluye las fichas en la barra).
+        
+        Args:
+            color (str): Color del jugador ("W" o "B")
+            
+        Returns:
+            int: Cantidad de pips que le faltan para retirar todas sus fichas
+        """
+        if self.__exposed__:
+            self._sync()
+        return self.__pips__[color]
+
+    def get_occupied_mask(self, color: str) -> int:
+        """
+        Devuelve la máscara de 24 bits de los puntos con fichas de un color.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Bit i encendido si el punto i tiene fichas de ese color
+        """
+        if self.__exposed__:
+            self._sync()
+        return self.__occupied__[color]
+
+    def get_made_mask(self, color: str) -> int:
+        """
+        Devuelve la máscara de los puntos hechos (2 o más fichas) de un color.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Bit i encendido si el punto i está hecho por ese color
+        """
+        if self.__exposed__:
+            self._sync()
+        return self.__made__[color]
+
+    def get_blot_mask(self, color: str) -> int:
+        """
+        Devuelve la máscara de los blots (una sola ficha) de un color.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Bit i encendido si el punto i tiene una sola ficha de ese color
+        """
+        if self.__exposed__:
+            self._sync()
+        return self.__occupied__[color] & ~self.__made__[color]
+
+    def prime_length(self, color: str) -> int:
+        """
+        Devuelve el largo del prime más largo (puntos hechos consecutivos) de un color.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Cantidad de puntos hechos consecutivos, de 0 a 7 en una partida real
+        """
+        if self.__exposed__:
+            self._sync()
+        return longest_run(self.__made__[color])
+
+    def direct_shot_mask(self, color: str) -> int:
+        """
+        Devuelve los blots de un color que el rival puede golpear con un solo dado.
+
+        Args:
+            color (str): Color de los blots
+
+        Returns:
+            int: Máscara de los blots a 1-6 pips delante de una ficha rival o
+                al alcance de las fichas rivales en la barra
+        """
+        if self.__exposed__:
+            self._sync()
+        opponent = OPPONENT[color]
+        return shot_mask(self.__occupied__[color] & ~self.__made__[color], self.__occupied__[opponent], opponent, self.__bar__[opponent] > 0)
+
     def is_ready_to_bear_off(self, player: Player) -> bool:
         """
         Verifica si todas las fichas de un jugador están en su home board.
@@ -117,13 +663,10 @@ class Board:
         Returns:
             bool: True si puede retirar fichas, False en caso contrario
         """
-        home_board_range = range(18, 24) if player.get_color() == "W" else range(0, 6)
-        checkers_in_home_board = sum(
-            len(self.get_point(i))
-            for i in home_board_range
-            if self.get_point(i) and self.get_point(i)[0] == player
-        )
-        return checkers_in_home_board + self.get_borne_off(player.get_color()) == 15
+        if self.__exposed__:
+            self._sync()
+        color = player.get_color()
+        return self.__home__[color] + self.__borne_off__[color] == 15
 
     def has_won(self, player: Player) -> bool:
         """
@@ -138,16 +681,10 @@ class Board:
         return self.get_borne_off(player.get_color()) == 15
 
     def _can_move_to_point(self, player: Player, to_point: int) -> bool:
-        """Verifica si un punto de destino es válido para un movimiento."""
-        if not (0 <= to_point < 24):
-            return False
-
-        destination_content = self.get_point(to_point)
-        return (
-            not destination_content or
-            destination_content[0] == player or
-            len(destination_content) == 1
-        )
+        """Verifica si un punto de destino es válido: no es un punto hecho del rival."""
+        if self.__exposed__:
+            self._sync()
+        return 0 <= to_point < 24 and not self.__made__[OPPONENT[player.get_color()]] >> to_point & 1
 
     def is_valid_move(self, player: Player, from_point: int, die_value: int) -> bool:
         """
@@ -161,37 +698,72 @@ class Board:
         Returns:
             bool: True si el movimiento es válido, False en caso contrario
         """
+        if self.__exposed__:
+            self._sync()
+        color = player.get_color()
         if from_point == 25:
-            if self.get_bar(player.get_color()) == 0:
+            if self.__bar__[color] == 0:
                 return False
-            to_point = (die_value - 1) if player.get_color() == "W" else (24 - die_value)
+            to_point = (die_value - 1) if color == "W" else (24 - die_value)
             return self._can_move_to_point(player, to_point)
 
-        source_content = self.get_point(from_point)
-        if not source_content or source_content[0] != player:
+        if not 0 <= from_point < 24:
+            raise IndexError("Índice de punto inválido")
+        if not self.__occupied__[color] >> from_point & 1:
             return False
 
-        direction = 1 if player.get_color() == "W" else -1
-        to_point = from_point + die_value * direction
+        to_point = from_point + die_value if color == "W" else from_point - die_value
 
-        if self.is_ready_to_bear_off(player):
-            is_exact_move = (player.get_color() == 'W' and from_point + die_value == 24) or \
-                            (player.get_color() == 'B' and from_point - die_value == -1)
-            
-            if is_exact_move:
+        if self.__home__[color] + self.__borne_off__[color] == 15:
+            if to_point == 24 or to_point == -1:
                 return True
+            if to_point > 24:
+                return self.__front__["W"] <= from_point
+            if to_point < -1:
+                return self.__front__["B"] >= from_point
+
+        return self._can_move_to_point(player, to_point)
 
-            is_overshoot = (player.get_color() == 'W' and to_point > 24) or \
-                           (player.get_color() == 'B' and to_point < -1)
+    def iter_legal_moves(self, player: Player, dice: List[int],
+                         from_point: int | None = None) -> Iterator[Tuple[int, int]]:
+        """
+        Genera de a uno los movimientos de una ficha válidos con los dados.
 
-            if is_overshoot:
-                if player.get_color() == 'W':
-                    higher_points_range = range(from_point + 1, 24)
-                else:
-                    higher_points_range = range(0, from_point)
-                return not any(self.get_point(i) and self.get_point(i)[0] == player for i in higher_points_range)
+        Primero la barra (y nada más si hay fichas en ella), después los puntos
+        propios desde el más alejado de la salida; en cada origen, los dados de
+        menor a mayor. Quien sólo necesita el primer movimiento, o saber si hay
+        alguno, corta sin validar el resto de los puntos.
 
-        return self._can_move_to_point(player, to_point)
+        Args:
+            player (Player): Jugador que mueve
+            dice (List[int]): Dados disponibles (los repetidos se consideran una vez)
+            from_point (int | None): Origen al que limitar la búsqueda (0-23, 25
+                para la barra); None para todos
+
+        Yields:
+            Tuple[int, int]: Pares (origen, dado), con 25 como origen para la barra
+        """
+        if self.__exposed__:
+            self._sync()
+        color = player.get_color()
+        values = sorted(set(dice))
+        if self.__bar__[color]:
+            if from_point is None or from_point == 25:
+                for die_value in values:
+                    if self.is_valid_move(player, 25, die_value):
+                        yield 25, die_value
+            return
+        if from_point is not None:
+            origins = (from_point,) if 0 <= from_point < 24 else ()
+        else:
+            origins = range(24) if color == "W" else range(23, -1, -1)
+        points = self.__points__
+        for index in origins:
+            point = points[index]
+            if point and point[0] == player:
+                for die_value in values:
+                    if self.is_valid_move(player, index, die_value):
+                        yield index, die_value
 
     def move_checker(self, player: Player, from_point: int, die_value: int):
         """
@@ -207,25 +779,7 @@ class Board:
         """
         if not self.is_valid_move(player, from_point, die_value):
             raise ValueError("Movimiento inválido.")
-
-        direction = 1 if player.get_color() == "W" else -1
-        to_point = from_point + die_value * direction
-        source_content = self.get_point(from_point)
-
-        if self.is_ready_to_bear_off(player) and \
-           ((player.get_color() == "W" and to_point >= 24) or \
-            (player.get_color() == "B" and to_point <= -1)):
-            source_content.pop()
-            self.__borne_off__[player.get_color()] += 1
-            return
-
-        destination_content = self.get_point(to_point)
-        if destination_content and destination_content[0] != player:
-            opponent_checker = destination_content.pop()
-            self.__bar__[opponent_checker.get_color()] += 1
-
-        source_content.pop()
-        self.place_checker(to_point, player)
+        self._apply_move(player, from_point, die_value)
 
     def move_checker_from_bar(self, player: Player, die_value: int):
         """
@@ -240,13 +794,77 @@ class Board:
         """
         if not self.is_valid_move(player, 25, die_value):
             raise ValueError("Movimiento desde la barra inválido.")
+        self._apply_move(player, 25, die_value)
+
+    def make_move(self, player: Player, from_point: int, die_value: int) -> MoveRecord:
+        """
+        Ejecuta un movimiento y devuelve el registro necesario para deshacerlo.
+        
+        Args:
+            player (Player): Jugador que realiza el movimiento
+            from_point (int): Punto de origen (0-23, 25 para la barra)
+            die_value (int): Valor del dado a utilizar
+            
+        Returns:
+            MoveRecord: Origen, destino y si hubo golpe o retirada
+            
+        Raises:
+            ValueError: Si el movimiento es inválido
+        """
+        if not self.is_valid_move(player, from_point, die_value):
+            raise ValueError("Movimiento desde la barra inválido." if from_point == 25 else "Movimiento inválido.")
+        return self._apply_move(player, from_point, die_value)
+
+    def unmake_move(self, player: Player, record: MoveRecord):
+        """
+        Deshace un movimiento hecho con ``make_move``, restaurando el estado exacto.
 
-        to_point = (die_value - 1) if player.get_color() == "W" else (24 - die_value)
+        Los movimientos deben deshacerse en el orden inverso al que se hicieron.
         
-        destination_content = self.get_point(to_point)
-        if destination_content and destination_content[0] != player:
-            opponent_checker = destination_content.pop()
-            self.__bar__[opponent_checker.get_color()] += 1
+        Args:
+            player (Player): Jugador que realizó el movimiento
+            record (MoveRecord): Registro devuelto por ``make_move``
+        """
+        from_point, to_point, hit, borne_off = record
+        color = player.get_color()
+        if borne_off:
+            self.__zobrist__ ^= OFF_KEYS[color][self.__borne_off__[color]]
+            self.__borne_off__[color] -= 1
+        else:
+            self._remove_checker(to_point)
+            if hit:
+                opponent_color = "B" if color == "W" else "W"
+                self._take_from_bar(opponent_color)
+                self._add_checker(to_point, self.__players__[opponent_color])
+
+        if from_point == 25:
+            self.__bar__[color] += 1
+            self.__pips__[color] += 25
+            self.__zobrist__ ^= BAR_KEYS[color][self.__bar__[color]]
+        else:
+            self._add_checker(from_point, player)
+
+    def _apply_move(self, player: Player, from_point: int, die_value: int) -> MoveRecord:
+        """Ejecuta un movimiento ya validado y devuelve su registro."""
+        color = player.get_color()
+        if from_point == 25:
+            to_point = (die_value - 1) if color == "W" else (24 - die_value)
+        else:
+            to_point = from_point + die_value if color == "W" else from_point - die_value
+            if self.is_ready_to_bear_off(player) and (to_point >= 24 or to_point <= -1):
+                self._remove_checker(from_point)
+                self.__borne_off__[color] += 1
+                self.__zobrist__ ^= OFF_KEYS[color][self.__borne_off__[color]]
+                return MoveRecord(from_point, to_point, False, True)
+
+        destination_content = self.__points__[to_point]
+        hit = bool(destination_content) and destination_content[0] != player
+        if hit:
+            self._send_to_bar(self._remove_checker(to_point))
 
-        self.__bar__[player.get_color()] -= 1
-        self.place_checker(to_point, player)
+        if from_point == 25:
+            self._take_from_bar(color)
+        else:
+            self._remove_checker(from_point)
+        self._add_checker(to_point, player)
+        return MoveRecord(from_point, to_point, hit, False)
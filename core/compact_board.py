@@ -0,0 +1,490 @@
+from array import array
+from typing import Dict, Iterator, List, Tuple
+from core.board import MoveRecord, _checkers_in_position, longest_run, shot_mask
+from core.player import Player
+from core.zobrist import POINT_KEYS, BAR_KEYS, OFF_KEYS, compute_hash
+
+WHITE_BAR = 24
+BLACK_BAR = 25
+
+
+class CompactBoard:
+    """
+    Tablero de Backgammon compacto basado en un arreglo de conteos con signo.
+
+    Guarda la posición en un arreglo fijo de 26 casillas: los índices 0-23 son
+    los puntos (positivo para Blancas, negativo para Negras) y los índices 24 y
+    25 son la barra de Blancas y de Negras. No existe un objeto por ficha: los
+    métodos ``get_point`` y ``get_all_points`` construyen listas de ``Player``
+    a pedido para mantener la misma API que ``Board``, por lo que modificar esas
+    listas no altera el tablero.
+
+    Attributes:
+        __counts__ (array): Conteos con signo de los 24 puntos y las dos barras
+        __borne_off__ (array): Fichas retiradas por Blancas y Negras
+        __players__ (Dict[str, Player]): Jugador registrado para cada color
+        __zobrist__ (int): Hash Zobrist de la posición
+    """
+
+    __slots__ = ("__counts__", "__borne_off__", "__players__", "__zobrist__")
+
+    def __init__(self):
+        """Inicializa un tablero compacto vacío."""
+        self.__counts__ = array("b", bytes(26))
+        self.__borne_off__ = array("b", bytes(2))
+        self.__players__: Dict[str, Player] = {}
+        self.__zobrist__: int = 0
+
+    def setup_initial_checkers(self, p1: Player, p2: Player):
+        """
+        Configura la posición inicial de las fichas en el tablero.
+
+        Args:
+            p1 (Player): Primer jugador (Blancas)
+            p2 (Player): Segundo jugador (Negras)
+        """
+        self.__counts__ = array("b", bytes(26))
+        self.__borne_off__ = array("b", bytes(2))
+        self.__players__ = {p1.get_color(): p1, p2.get_color(): p2}
+        self.__zobrist__ = 0
+
+        initial_setup = {
+            0: (p1, 2), 5: (p2, 5), 7: (p2, 3), 11: (p1, 5),
+            12: (p2, 5), 16: (p1, 3), 18: (p1, 5), 23: (p2, 2),
+        }
+        for point, (player, count) in initial_setup.items():
+            for _ in range(count):
+                self.place_checker(point, player)
+
+    def setup_position(self, p1: Player, p2: Player, counts: List[int], bar: Tuple[int, int] = (0, 0)):
+        """
+        Configura una posición arbitraria a partir de conteos con signo.
+
+        Las fichas de cada color que no están en el tablero ni en la barra se
+        consideran retiradas.
+
+        Args:
+            p1 (Player): Primer jugador (Blancas)
+            p2 (Player): Segundo jugador (Negras)
+            counts (List[int]): 24 conteos, positivos para Blancas y negativos para Negras
+            bar (Tuple[int, int]): Fichas en la barra de Blancas y Negras
+
+        Raises:
+            ValueError: Si no hay 24 conteos o algún color supera las 15 fichas
+        """
+        on_board = _checkers_in_position(counts, bar)
+        self.__counts__ = array("b", list(counts) + list(bar))
+        self.__borne_off__ = array("b", [15 - on_board["W"], 15 - on_board["B"]])
+        self.__players__ = {p1.get_color(): p1, p2.get_color(): p2}
+        self.__zobrist__ = compute_hash(self)
+
+    def get_point(self, index: int) -> List[Player]:
+        """
+        Devuelve la lista de jugadores (fichas) en un punto.
+
+        Args:
+            index (int): Índice del punto (0-23)
+
+        Returns:
+            List[Player]: Lista nueva con las fichas de ese punto
+
+        Raises:
+            IndexError: Si el índice está fuera del rango válido
+        """
+        if not 0 <= index < 24:
+            raise IndexError("Índice de punto inválido")
+        count = self.__counts__[index]
+        if count > 0:
+            return [self.__players__["W"]] * count
+        if count < 0:
+            return [self.__players__["B"]] * -count
+        return []
+
+    def get_count(self, index: int) -> int:
+        """
+        Devuelve el conteo con signo de un punto (positivo Blancas, negativo Negras).
+
+        Args:
+            index (int): Índice del punto (0-23)
+
+        Returns:
+            int: Conteo con signo de fichas en el punto
+        """
+        if 0 <= index < 24:
+            return self.__counts__[index]
+        raise IndexError("Índice de punto inválido")
+
+    def get_counts(self) -> List[int]:
+        """
+        Devuelve la cantidad de fichas de cada punto con signo.
+
+        Returns:
+            List[int]: 24 conteos, positivos para Blancas y negativos para Negras
+        """
+        return self.__counts__[:24].tolist()
+
+    def copy(self) -> "CompactBoard":
+        """
+        Devuelve una copia independiente del tablero que comparte los jugadores.
+
+        Returns:
+            CompactBoard: Nuevo tablero con la misma posición
+        """
+        clone = CompactBoard()
+        clone.__counts__ = array("b", self.__counts__)
+        clone.__borne_off__ = array("b", self.__borne_off__)
+        clone.__players__ = dict(self.__players__)
+        clone.__zobrist__ = self.__zobrist__
+        return clone
+
+    def get_hash(self) -> int:
+        """
+        Devuelve el hash Zobrist de 64 bits de la posición (sin el turno).
+
+        Returns:
+            int: Hash mantenido de forma incremental en cada movimiento
+        """
+        return self.__zobrist__
+
+    def get_bar(self, color: str) -> int:
+        """
+        Devuelve la cantidad de fichas en la barra para un jugador.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Cantidad de fichas en la barra
+        """
+        return self.__counts__[WHITE_BAR if color == "W" else BLACK_BAR]
+
+    def get_borne_off(self, color: str) -> int:
+        """
+        Devuelve la cantidad de fichas retiradas para un jugador.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Cantidad de fichas retiradas
+        """
+        return self.__borne_off__[0 if color == "W" else 1]
+
+    def get_all_points(self) -> List[List[Player]]:
+        """
+        Devuelve todos los puntos del tablero como listas de jugadores.
+
+        Returns:
+            List[List[Player]]: Lista con los 24 puntos
+        """
+        return [self.get_point(i) for i in range(24)]
+
+    def place_checker(self, index: int, player: Player):
+        """
+        Coloca una ficha de un jugador en un punto del tablero.
+
+        Args:
+            index (int): Índice del punto (0-23)
+            player (Player): Jugador que coloca la ficha
+
+        Raises:
+            IndexError: Si el índice está fuera del rango válido
+            ValueError: Si el punto está ocupado por fichas del rival
+        """
+        if not 0 <= index < 24:
+            raise IndexError("Índice de punto inválido")
+        color = player.get_color()
+        self.__players__.setdefault(color, player)
+        sign = 1 if color == "W" else -1
+        if self.__counts__[index] * sign < 0:
+            raise ValueError("El punto está ocupado por fichas del rival.")
+        self.__counts__[index] += sign
+        self.__zobrist__ ^= POINT_KEYS[color][index][abs(self.__counts__[index])]
+
+    def pip_count(self, color: str) -> int:
+        """
+        Devuelve el pip count de un jugador (incluye las fichas en la barra).
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Cantidad de pips que le faltan para retirar todas sus fichas
+        """
+        counts = self.__counts__
+        if color == "W":
+            return sum((24 - i) * c for i, c in enumerate(counts[:24]) if c > 0) + 25 * counts[WHITE_BAR]
+        return sum((i + 1) * -c for i, c in enumerate(counts[:24]) if c < 0) + 25 * counts[BLACK_BAR]
+
+    def _mask(self, color: str, low: int, high: int = 15) -> int:
+        """Máscara de los puntos con entre ``low`` y ``high`` fichas de un color."""
+        sign = 1 if color == "W" else -1
+        mask = 0
+        for index, count in enumerate(self.__counts__[:24]):
+            if low <= count * sign <= high:
+                mask |= 1 << index
+        return mask
+
+    def get_occupied_mask(self, color: str) -> int:
+        """
+        Devuelve la máscara de 24 bits de los puntos con fichas de un color.
+
+        A diferencia de ``Board``, se calcula a pedido a partir de los conteos.
+
+        Args:
+            color (str): Color del jugador ("W" o "B")
+
+        Returns:
+            int: Bit i encendido si el punto i tiene fichas de ese color
+        """
+        return self._mask(color, 1)
+
+    def get_made_mask(self, color: str) -> int:
+        """Devuelve la máscara de los puntos hechos (2 o más fichas) de un color."""
+        return self._mask(color, 2)
+
+    def get_blot_mask(self, color: str) -> int:
+        """Devuelve la máscara de los blots (una sola ficha) de un color."""
+        return self._mask(color, 1, 1)
+
+    def prime_length(self, color: str) -> int:
+        """Devuelve el largo del prime más largo (puntos hechos consecutivos) de un color."""
+        return longest_run(self.get_made_mask(color))
+
+    def direct_shot_mask(self, color: str) -> int:
+        """Devuelve los blots de un color que el rival puede golpear con un solo dado."""
+        opponent = "B" if color == "W" else "W"
+        return shot_mask(self.get_blot_mask(color), self.get_occupied_mask(opponent), opponent,
+                         self.get_bar(opponent) > 0)
+
+    def is_ready_to_bear_off(self, player: Player) -> bool:
+        """
+        Verifica si todas las fichas de un jugador están en su home board.
+
+        Args:
+            player (Player): Jugador a verificar
+
+        Returns:
+            bool: True si puede retirar fichas, False en caso contrario
+        """
+        counts = self.__counts__
+        if player.get_color() == "W":
+            in_home = sum(c for c in counts[18:24] if c > 0)
+            return in_home + self.__borne_off__[0] == 15
+        in_home = -sum(c for c in counts[0:6] if c < 0)
+        return in_home + self.__borne_off__[1] == 15
+
+    def has_won(self, player: Player) -> bool:
+        """
+        Verifica si un jugador ha ganado (ha retirado sus 15 fichas).
+
+        Args:
+            player (Player): Jugador a verificar
+
+        Returns:
+            bool: True si el jugador ganó, False en caso contrario
+        """
+        return self.get_borne_off(player.get_color()) == 15
+
+    def _can_move_to_point(self, player: Player, to_point: int) -> bool:
+        """Verifica si un punto de destino es válido para un movimiento."""
+        if not (0 <= to_point < 24):
+            return False
+        sign = 1 if player.get_color() == "W" else -1
+        return self.__counts__[to_point] * sign >= -1
+
+    def is_valid_move(self, player: Player, from_point: int, die_value: int) -> bool:
+        """
+        Verifica si un movimiento es válido sin ejecutarlo.
+
+        Args:
+            player (Player): Jugador que realiza el movimiento
+            from_point (int): Punto de origen (0-23, 25 para la barra)
+            die_value (int): Valor del dado
+
+        Returns:
+            bool: True si el movimiento es válido, False en caso contrario
+        """
+        is_white = player.get_color() == "W"
+        counts = self.__counts__
+
+        if from_point == 25:
+            if counts[WHITE_BAR if is_white else BLACK_BAR] == 0:
+                return False
+            to_point = (die_value - 1) if is_white else (24 - die_value)
+            return self._can_move_to_point(player, to_point)
+
+        if not 0 <= from_point < 24:
+            raise IndexError("Índice de punto inválido")
+        source = counts[from_point]
+        if (source <= 0) if is_white else (source >= 0):
+            return False
+
+        to_point = from_point + die_value if is_white else from_point - die_value
+
+        if self.is_ready_to_bear_off(player):
+            if to_point == 24 or to_point == -1:
+                return True
+            if is_white and to_point > 24:
+                return not any(c > 0 for c in counts[from_point + 1:24])
+            if not is_white and to_point < -1:
+                return not any(c < 0 for c in counts[0:from_point])
+
+        return self._can_move_to_point(player, to_point)
+
+    def iter_legal_moves(self, player: Player, dice: List[int],
+                         from_point: int | None = None) -> Iterator[Tuple[int, int]]:
+        """
+        Genera de a uno los movimientos de una ficha válidos con los dados.
+
+        Mismo orden que ``Board.iter_legal_moves``: la barra, después los puntos
+        propios desde el más alejado de la salida y en cada uno los dados de
+        menor a mayor.
+
+        Args:
+            player (Player): Jugador que mueve
+            dice (List[int]): Dados disponibles (los repetidos se consideran una vez)
+            from_point (int | None): Origen al que limitar la búsqueda (0-23, 25
+                para la barra); None para todos
+
+        Yields:
+            Tuple[int, int]: Pares (origen, dado), con 25 como origen para la barra
+        """
+        is_white = player.get_color() == "W"
+        counts = self.__counts__
+        values = sorted(set(dice))
+        if counts[WHITE_BAR if is_white else BLACK_BAR]:
+            if from_point is None or from_point == 25:
+                for die_value in values:
+                    if self.is_valid_move(player, 25, die_value):
+                        yield 25, die_value
+            return
+        if from_point is not None:
+            origins = (from_point,) if 0 <= from_point < 24 else ()
+        else:
+            origins = range(24) if is_white else range(23, -1, -1)
+        for index in origins:
+            if (counts[index] > 0) if is_white else (counts[index] < 0):
+                for die_value in values:
+                    if self.is_valid_move(player, index, die_value):
+                        yield index, die_value
+
+    def move_checker(self, player: Player, from_point: int, die_value: int):
+        """
+        Mueve una ficha de un punto a otro o la retira del tablero.
+
+        Args:
+            player (Player): Jugador que realiza el movimiento
+            from_point (int): Punto de origen (0-23)
+            die_value (int): Valor del dado a utilizar
+
+        Raises:
+            ValueError: Si el movimiento es inválido
+        """
+        if not self.is_valid_move(player, from_point, die_value):
+            raise ValueError("Movimiento inválido.")
+        self._apply_move(player, from_point, die_value)
+
+    def move_checker_from_bar(self, player: Player, die_value: int):
+        """
+        Mueve una ficha desde la barra al tablero.
+
+        Args:
+            player (Player): Jugador que reingresa la ficha
+            die_value (int): Valor del dado a utilizar
+
+        Raises:
+            ValueError: Si el movimiento es inválido
+        """
+        if not self.is_valid_move(player, 25, die_value):
+            raise ValueError("Movimiento desde la barra inválido.")
+        self._apply_move(player, 25, die_value)
+
+    def make_move(self, player: Player, from_point: int, die_value: int) -> MoveRecord:
+        """
+        Ejecuta un movimiento y devuelve el registro necesario para deshacerlo.
+
+        Args:
+            player (Player): Jugador que realiza el movimiento
+            from_point (int): Punto de origen (0-23, 25 para la barra)
+            die_value (int): Valor del dado a utilizar
+
+        Returns:
+            MoveRecord: Origen, destino y si hubo golpe o retirada
+
+        Raises:
+            ValueError: Si el movimiento es inválido
+        """
+        if not self.is_valid_move(player, from_point, die_value):
+            raise ValueError("Movimiento desde la barra inválido." if from_point == 25 else "Movimiento inválido.")
+        return self._apply_move(player, from_point, die_value)
+
+    def unmake_move(self, player: Player, record: MoveRecord):
+        """
+        Deshace un movimiento hecho con ``make_move``, restaurando el estado exacto.
+
+        Args:
+            player (Player): Jugador que realizó el movimiento
+            record (MoveRecord): Registro devuelto por ``make_move``
+        """
+        from_point, to_point, hit, borne_off = record
+        color = player.get_color()
+        is_white = color == "W"
+        sign = 1 if is_white else -1
+        counts = self.__counts__
+        if borne_off:
+            side = 0 if is_white else 1
+            self.__zobrist__ ^= OFF_KEYS[color][self.__borne_off__[side]]
+            self.__borne_off__[side] -= 1
+        else:
+            self.__zobrist__ ^= POINT_KEYS[color][to_point][abs(counts[to_point])]
+            counts[to_point] -= sign
+            if hit:
+                opponent = "B" if is_white else "W"
+                opponent_bar = BLACK_BAR if is_white else WHITE_BAR
+                self.__zobrist__ ^= BAR_KEYS[opponent][counts[opponent_bar]]
+                counts[opponent_bar] -= 1
+                counts[to_point] = -sign
+                self.__zobrist__ ^= POINT_KEYS[opponent][to_point][1]
+
+        if from_point == 25:
+            own_bar = WHITE_BAR if is_white else BLACK_BAR
+            counts[own_bar] += 1
+            self.__zobrist__ ^= BAR_KEYS[color][counts[own_bar]]
+        else:
+            counts[from_point] += sign
+            self.__zobrist__ ^= POINT_KEYS[color][from_point][abs(counts[from_point])]
+
+    def _apply_move(self, player: Player, from_point: int, die_value: int) -> MoveRecord:
+        """Ejecuta un movimiento ya validado y devuelve su registro."""
+        color = player.get_color()
+        is_white = color == "W"
+        sign = 1 if is_white else -1
+        counts = self.__counts__
+
+        if from_point == 25:
+            to_point = (die_value - 1) if is_white else (24 - die_value)
+            own_bar = WHITE_BAR if is_white else BLACK_BAR
+            self.__zobrist__ ^= BAR_KEYS[color][counts[own_bar]]
+            counts[own_bar] -= 1
+        else:
+            to_point = from_point + die_value * sign
+            self.__zobrist__ ^= POINT_KEYS[color][from_point][abs(counts[from_point])]
+            counts[from_point] -= sign
+            if to_point >= 24 or to_point <= -1:
+                side = 0 if is_white else 1
+                self.__borne_off__[side] += 1
+                self.__zobrist__ ^= OFF_KEYS[color][self.__borne_off__[side]]
+                return MoveRecord(from_point, to_point, False, True)
+
+        hit = counts[to_point] == -sign
+        if hit:
+            opponent = "B" if is_white else "W"
+            opponent_bar = BLACK_BAR if is_white else WHITE_BAR
+            self.__zobrist__ ^= POINT_KEYS[opponent][to_point][1]
+            counts[to_point] = 0
+            counts[opponent_bar] += 1
+            self.__zobrist__ ^= BAR_KEYS[opponent][counts[opponent_bar]]
+        counts[to_point] += sign
+        self.__zobrist__ ^= POINT_KEYS[color][to_point][abs(counts[to_point])]
+        return MoveRecord(from_point, to_point, hit, False)
@@ -1,19 +1,117 @@
 import random
+from typing import Iterable, List, Tuple
+
+DEFAULT_BLOCK_SIZE = 1024
+
+# Las 21 tiradas distintas (d1 <= d2) con su probabilidad: 1/36 los dobles y 2/36 el resto.
+ROLLS: List[Tuple[int, int, float]] = [
+    (a, b, (1 if a == b else 2) / 36) for a in range(1, 7) for b in range(a, 7)
+]
+
+# Pips que avanza en promedio una tirada (los dobles se juegan cuatro veces): 49/6.
+AVERAGE_PIPS = sum(probability * (a * 4 if a == b else a + b) for a, b, probability in ROLLS)
+
 
 class Dice:
     """
     Simula dos dados de Backgammon.
+
+    Por defecto usa el módulo global ``random``. Con ``seed`` o ``rng`` usa un
+    generador propio, reproducible e independiente de otras partidas; con
+    ``block_size`` genera las tiradas por bloques con NumPy y las consume de un
+    buffer; NumPy sólo se importa en ese modo. Con ``sequence`` reproduce una secuencia de tiradas ya registrada.
+
+    Attributes:
+        __values__ (List[int]): Valores de la última tirada
+        __rng__ (random.Random | np.random.Generator | None): Generador propio
+        __block_size__ (int): Tiradas generadas por bloque (0 desactiva los bloques)
+        __buffer__ (List[List[int]]): Tiradas pendientes del bloque o secuencia actual
+        __cursor__ (int): Próxima tirada a consumir de ``__buffer__``
+        __replay__ (bool): True si se está reproduciendo una secuencia
+        __history__ (List[Tuple[int, int]] | None): Tiradas realizadas, si se registran
     """
 
-    def __init__(self):
+    def __init__(self, seed: int | None = None, rng=None, block_size: int = 0,
+                 sequence: Iterable[Tuple[int, int]] | None = None, record: bool = False):
+        """
+        Args:
+            seed (int | None): Semilla para crear un generador propio
+            rng (random.Random | np.random.Generator | None): Generador a usar en
+                lugar de crear uno; debe ser de NumPy si se usa ``block_size``, y
+                uno de NumPy siempre genera por bloques
+            block_size (int): Cantidad de tiradas a generar de una vez con NumPy
+            sequence (Iterable[Tuple[int, int]] | None): Tiradas a reproducir en orden
+            record (bool): Si es True, guarda las tiradas en ``get_history()``
+
+        Raises:
+            ValueError: Si ``block_size`` es negativo o no se puede usar con ``rng``,
+                si se indican ``seed`` y ``rng`` a la vez, o si la secuencia tiene
+                valores inválidos
+        """
+        if block_size < 0:
+            raise ValueError("El tamaño de bloque no puede ser negativo.")
+        if seed is not None and rng is not None:
+            raise ValueError("No se puede indicar una semilla y un generador a la vez.")
         self.__values__ = []
+        self.__block_size__ = block_size
+        self.__buffer__ = []
+        self.__cursor__ = 0
+        self.__replay__ = sequence is not None
+        self.__history__ = [] if record else None
+        if self.__replay__:
+            self.__buffer__ = [list(pair) for pair in sequence]
+            if any(len(pair) != 2 or not all(1 <= v <= 6 for v in pair) for pair in self.__buffer__):
+                raise ValueError("La secuencia de dados tiene valores inválidos.")
+            self.__rng__ = None
+        elif rng is not None:
+            # Los generadores de NumPy se reconocen por ``integers`` sin importar NumPy.
+            numpy_rng = hasattr(rng, "integers")
+            if block_size and not numpy_rng:
+                raise ValueError("La generación por bloques requiere un generador de NumPy.")
+            self.__rng__ = rng
+            if numpy_rng and not block_size:
+                self.__block_size__ = DEFAULT_BLOCK_SIZE
+        elif block_size:
+            import numpy as np
+            self.__rng__ = np.random.default_rng(seed)
+        elif seed is not None:
+            self.__rng__ = random.Random(seed)
+        else:
+            self.__rng__ = None
+
+    def _next_pair(self) -> List[int]:
+        """Devuelve los dos valores de la próxima tirada según el modo de los dados."""
+        if self.__cursor__ < len(self.__buffer__):
+            pair = self.__buffer__[self.__cursor__]
+            self.__cursor__ += 1
+            return pair
+        if self.__replay__:
+            raise IndexError("La secuencia de dados se agotó.")
+        if self.__block_size__:
+            self.__buffer__ = self.__rng__.integers(1, 7, size=(self.__block_size__, 2)).tolist()
+            self.__cursor__ = 1
+            return self.__buffer__[0]
+        if self.__rng__ is not None:
+            return [self.__rng__.randint(1, 6), self.__rng__.randint(1, 6)]
+        return [random.randint(1, 6), random.randint(1, 6)]
 
     def roll(self):
         """Lanza los dados y guarda el resultado."""
-        d1, d2 = random.randint(1, 6), random.randint(1, 6)
+        d1, d2 = self._next_pair()
+        if self.__history__ is not None:
+            self.__history__.append((d1, d2))
         self.__values__ = [d1, d2] * (2 if d1 == d2 else 1)
         return self.__values__
 
     def get_values(self):
         """Devuelve los valores de la última tirada."""
         return self.__values__
+
+    def get_history(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve las tiradas realizadas, en orden, para poder reproducirlas.
+
+        Returns:
+            List[Tuple[int, int]]: Pares de valores (vacía si no se registran)
+        """
+        return list(self.__history__ or [])
@@ -0,0 +1,274 @@
+from typing import List, Sequence
+import numpy as np
+from core.moves import Play
+from core.player import Player
+
+RAW_SIZE = 28
+FEATURE_NAMES = (
+    [f"own_{i}" for i in range(24)] + [f"opp_{i}" for i in range(24)] + [
+        "own_bar", "opp_bar", "own_off", "opp_off", "own_pips", "opp_pips",
+        "own_blots", "opp_blots", "own_points", "opp_points", "own_prime", "opp_prime",
+    ]
+)
+FEATURE_COUNT = len(FEATURE_NAMES)
+
+_DISTANCE = np.arange(24, 0, -1, dtype=np.float32)
+
+
+def encode_board(board) -> List[int]:
+    """
+    Codifica un tablero en 28 enteros: 24 conteos con signo, barras y retiradas.
+
+    Args:
+        board (Board): Tablero a codificar
+
+    Returns:
+        List[int]: Conteos (+Blancas, -Negras), barra W, barra B, fuera W, fuera B
+    """
+    return board.get_counts() + [
+        board.get_bar("W"), board.get_bar("B"),
+        board.get_borne_off("W"), board.get_borne_off("B"),
+    ]
+
+
+def encode_boards(boards: Sequence) -> np.ndarray:
+    """
+    Codifica varios tableros en un arreglo (N, 28) de enteros.
+
+    Args:
+        boards (Sequence[Board]): Tableros a codificar
+
+    Returns:
+        np.ndarray: Una fila por tablero con el formato de ``encode_board``
+    """
+    return np.array([encode_board(board) for board in boards], dtype=np.int8).reshape(-1, RAW_SIZE)
+
+
+def _longest_run(mask: np.ndarray) -> np.ndarray:
+    """Devuelve, por fila, la racha más larga de valores True consecutivos."""
+    run = np.zeros(mask.shape[0], dtype=np.int8)
+    best = np.zeros(mask.shape[0], dtype=np.int8)
+    for column in range(mask.shape[1]):
+        run = (run + 1) * mask[:, column]
+        np.maximum(best, run, out=best)
+    return best
+
+
+def extract_features(raw: np.ndarray, color: str) -> np.ndarray:
+    """
+    Calcula las características de cada posición desde el punto de vista de un color.
+
+    Los puntos se ordenan desde el más lejano a la salida del jugador (índice 0)
+    hasta el más cercano (índice 23), para ambos colores.
+
+    Args:
+        raw (np.ndarray): Arreglo (N, 28) producido por ``encode_boards``
+        color (str): Color desde cuyo punto de vista se evalúa ("W" o "B")
+
+    Returns:
+        np.ndarray: Arreglo (N, FEATURE_COUNT) de float32
+    """
+    raw = raw.astype(np.int16)
+    counts = raw[:, :24]
+    if color == "W":
+        own = np.clip(counts, 0, None)
+        opp = np.clip(-counts, 0, None)[:, ::-1]
+        own_bar, opp_bar, own_off, opp_off = raw[:, 24], raw[:, 25], raw[:, 26], raw[:, 27]
+    else:
+        own = np.clip(-counts, 0, None)[:, ::-1]
+        opp = np.clip(counts, 0, None)
+        own_bar, opp_bar, own_off, opp_off = raw[:, 25], raw[:, 24], raw[:, 27], raw[:, 26]
+
+    own_made, opp_made = own >= 2, opp >= 2
+    features = np.empty((raw.shape[0], FEATURE_COUNT), dtype=np.float32)
+    features[:, 0:24] = own / 15.0
+    features[:, 24:48] = opp / 15.0
+    features[:, 48] = own_bar / 15.0
+    features[:, 49] = opp_bar / 15.0
+    features[:, 50] = own_off / 15.0
+    features[:, 51] = opp_off / 15.0
+    features[:, 52] = (own @ _DISTANCE + 25 * own_bar) / 167.0
+    features[:, 53] = (opp @ _DISTANCE + 25 * opp_bar) / 167.0
+    features[:, 54] = (own == 1).sum(axis=1) / 15.0
+    features[:, 55] = (opp == 1).sum(axis=1) / 15.0
+    features[:, 56] = own_made.sum(axis=1) / 12.0
+    features[:, 57] = opp_made.sum(axis=1) / 12.0
+    features[:, 58] = _longest_run(own_made) / 6.0
+    features[:, 59] = _longest_run(opp_made) / 6.0
+    return features
+
+
+class LinearEvaluator:
+    """
+    Evaluador lineal: equity = tanh(características · pesos + sesgo).
+
+    Attributes:
+        __weights__ (np.ndarray): Pesos (FEATURE_COUNT,)
+        __bias__ (float): Sesgo
+    """
+
+    def __init__(self, weights: np.ndarray, bias: float = 0.0):
+        """
+        Args:
+            weights (np.ndarray): Un peso por característica
+            bias (float): Sesgo
+
+        Raises:
+            ValueError: Si la cantidad de pesos no coincide con FEATURE_COUNT
+        """
+        weights = np.asarray(weights, dtype=np.float32)
+        if weights.shape != (FEATURE_COUNT,):
+            raise ValueError(f"Se esperaban {FEATURE_COUNT} pesos.")
+        self.__weights__ = weights
+        self.__bias__ = float(bias)
+
+    def evaluate(self, features: np.ndarray) -> np.ndarray:
+        """
+        Evalúa un lote de posiciones.
+
+        Args:
+            features (np.ndarray): Arreglo (N, FEATURE_COUNT)
+
+        Returns:
+            np.ndarray: Equity estimada (N,) entre -1 y 1
+        """
+        return np.tanh(features @ self.__weights__ + self.__bias__)
+
+
+class HeuristicEvaluator(LinearEvaluator):
+    """Evaluador lineal con pesos elegidos a mano: carrera, blots, puntos y primes."""
+
+    def __init__(self):
+        weights = np.zeros(FEATURE_COUNT, dtype=np.float32)
+        weights[FEATURE_NAMES.index("own_pips")] = -2.0
+        weights[FEATURE_NAMES.index("opp_pips")] = 2.0
+        weights[FEATURE_NAMES.index("own_bar")] = -1.5
+        weights[FEATURE_NAMES.index("opp_bar")] = 1.5
+        weights[FEATURE_NAMES.index("own_off")] = 1.0
+        weights[FEATURE_NAMES.index("opp_off")] = -1.0
+        weights[FEATURE_NAMES.index("own_blots")] = -1.5
+        weights[FEATURE_NAMES.index("opp_blots")] = 0.3
+        weights[FEATURE_NAMES.index("own_points")] = 0.8
+        weights[FEATURE_NAMES.index("opp_points")] = -0.8
+        weights[FEATURE_NAMES.index("own_prime")] = 0.6
+        weights[FEATURE_NAMES.index("opp_prime")] = -0.6
+        super().__init__(weights)
+
+
+class MLPEvaluator:
+    """
+    Evaluador de red neuronal de una capa oculta con activación tanh.
+
+    Attributes:
+        __w1__ (np.ndarray): Pesos de entrada (FEATURE_COUNT, H)
+        __b1__ (np.ndarray): Sesgos ocultos (H,)
+        __w2__ (np.ndarray): Pesos de salida (H,)
+        __b2__ (float): Sesgo de salida
+    """
+
+    def __init__(self, w1: np.ndarray, b1: np.ndarray, w2: np.ndarray, b2: float = 0.0):
+        """
+        Args:
+            w1 (np.ndarray): Pesos de entrada (FEATURE_COUNT, H)
+            b1 (np.ndarray): Sesgos ocultos (H,)
+            w2 (np.ndarray): Pesos de salida (H,)
+            b2 (float): Sesgo de salida
+
+        Raises:
+            ValueError: Si la capa de entrada no tiene FEATURE_COUNT filas
+        """
+        self.__w1__ = np.asarray(w1, dtype=np.float32)
+        self.__b1__ = np.asarray(b1, dtype=np.float32)
+        self.__w2__ = np.asarray(w2, dtype=np.float32)
+        self.__b2__ = float(b2)
+        if self.__w1__.shape[0] != FEATURE_COUNT:
+            raise ValueError(f"La capa de entrada debe tener {FEATURE_COUNT} filas.")
+
+    @classmethod
+    def random(cls, hidden: int = 40, seed: int = 0) -> "MLPEvaluator":
+        """
+        Crea una red con pesos aleatorios pequeños (sin entrenar).
+
+        Args:
+            hidden (int): Neuronas de la capa oculta
+            seed (int): Semilla de los pesos
+
+        Returns:
+            MLPEvaluator: Red inicializada
+        """
+        rng = np.random.default_rng(seed)
+        return cls(rng.normal(0, 0.1, (FEATURE_COUNT, hidden)), np.zeros(hidden),
+                   rng.normal(0, 0.1, hidden))
+
+    @classmethod
+    def load(cls, path: str) -> "MLPEvaluator":
+        """
+        Carga una red guardada con ``save``.
+
+        Args:
+            path (str): Archivo .npz con los arreglos w1, b1, w2 y b2
+
+        Returns:
+            MLPEvaluator: Red cargada
+        """
+        data = np.load(path)
+        return cls(data["w1"], data["b1"], data["w2"], float(data["b2"]))
+
+    def save(self, path: str):
+        """Guarda los pesos de la red en un archivo .npz."""
+        np.savez(path, w1=self.__w1__, b1=self.__b1__, w2=self.__w2__, b2=self.__b2__)
+
+    def evaluate(self, features: np.ndarray) -> np.ndarray:
+        """
+        Evalúa un lote de posiciones.
+
+        Args:
+            features (np.ndarray): Arreglo (N, FEATURE_COUNT)
+
+        Returns:
+            np.ndarray: Equity estimada (N,) entre -1 y 1
+        """
+        hidden = np.tanh(features @ self.__w1__ + self.__b1__)
+        return np.tanh(hidden @ self.__w2__ + self.__b2__)
+
+
+def evaluate_boards(boards: Sequence, color: str, evaluator) -> np.ndarray:
+    """
+    Evalúa varios tableros en una sola llamada vectorizada.
+
+    Args:
+        boards (Sequence[Board]): Tableros a evaluar
+        color (str): Color desde cuyo punto de vista se evalúa
+        evaluator: Objeto con método ``evaluate(features)``
+
+    Returns:
+        np.ndarray: Equity de cada tablero
+    """
+    return evaluator.evaluate(extract_features(encode_boards(boards), color))
+
+
+def evaluate_plays(board, player: Player, plays: List[Play], evaluator) -> np.ndarray:
+    """
+    Evalúa todas las jugadas candidatas de una tirada en una sola llamada.
+
+    Cada jugada se aplica con ``make_move``, se codifica la posición resultante
+    y se deshace; luego se evalúa el lote completo de una vez.
+
+    Args:
+        board (Board): Tablero antes de mover (queda sin cambios)
+        player (Player): Jugador que mueve
+        plays (List[Play]): Jugadas legales
+        evaluator: Objeto con método ``evaluate(features)``
+
+    Returns:
+        np.ndarray: Equity de cada jugada para el jugador que mueve
+    """
+    rows = []
+    for play in plays:
+        records = [board.make_move(player, *move) for move in play]
+        rows.append(encode_board(board))
+        for record in reversed(records):
+            board.unmake_move(player, record)
+    raw = np.array(rows, dtype=np.int8).reshape(-1, RAW_SIZE)
+    return evaluator.evaluate(extract_features(raw, player.get_color()))
+
@@ -1,7 +1,32 @@
 from core.board import Board
+from core.compact_board import CompactBoard
 from core.dice import Dice
+from core.moves import LegalMoveCache, Play, generate_plays
 from core.player import Player
-from typing import List
+from core.zobrist import side_to_move_key
+from typing import Iterator, List, Tuple
+
+
+def game_points(board, winner_color: str) -> int:
+    """
+    Devuelve los puntos de una partida ganada: 1 simple, 2 gammon, 3 backgammon.
+
+    Args:
+        board (Board): Tablero final
+        winner_color (str): Color del ganador
+
+    Returns:
+        int: Multiplicador de la victoria
+    """
+    loser = "B" if winner_color == "W" else "W"
+    if board.get_borne_off(loser) > 0:
+        return 1
+    winner_home = range(18, 24) if winner_color == "W" else range(0, 6)
+    loser_sign = 1 if loser == "W" else -1
+    counts = board.get_counts()
+    if board.get_bar(loser) > 0 or any(counts[i] * loser_sign > 0 for i in winner_home):
+        return 3
+    return 2
 
 
 class BackgammonGame:
@@ -18,14 +43,29 @@ class BackgammonGame:
         __player2__ (Player): Segundo jugador (Negras)
         __current_player__ (Player): Jugador con el turno actual
         __remaining_moves__ (List[int]): Movimientos restantes en el turno actual
+        __move_cache__ (LegalMoveCache): Caché de movimientos legales por posición y dados
+        __recorder__ (GameRecordWriter | None): Destino de los eventos de la partida
     """
 
-    def __init__(self):
+    def __init__(self, board: Board | CompactBoard | None = None, dice: Dice | None = None,
+                 move_cache: LegalMoveCache | None = None, recorder=None):
         """
         Inicializa el juego, creando el tablero, los dados y los jugadores.
+
+        Args:
+            board (Board | CompactBoard | None): Motor de tablero a utilizar.
+                Si no se indica, se crea un ``Board``.
+            dice (Dice | None): Dados a utilizar (por ejemplo con semilla o una
+                secuencia grabada). Si no se indican, se crean unos ``Dice()``.
+            move_cache (LegalMoveCache | None): Caché de movimientos legales, que
+                puede compartirse entre partidas. Si no se indica, se crea una.
+            recorder (GameRecordWriter | None): Registro donde se anotan las
+                partidas nuevas, tiradas, movimientos y cambios de turno.
         """
-        self.__board__ = Board()
-        self.__dice__ = Dice()
+        self.__board__ = board if board is not None else Board()
+        self.__dice__ = dice if dice is not None else Dice()
+        self.__move_cache__ = move_cache if move_cache is not None else LegalMoveCache()
+        self.__recorder__ = recorder
         self.__player1__ = Player("Player 1", "W")
         self.__player2__ = Player("Player 2", "B")
         self.__current_player__ = self.__player1__
@@ -50,6 +90,8 @@ class BackgammonGame:
             else self.__player1__
         )
         self.__remaining_moves__ = []
+        if self.__recorder__ is not None:
+            self.__recorder__.on_switch()
 
     def check_winner(self) -> Player | None:
         """
@@ -64,6 +106,16 @@ class BackgammonGame:
             return self.__player2__
         return None
 
+    def get_game_points(self) -> int:
+        """
+        Devuelve los puntos de la partida terminada, sin contar el cubo.
+
+        Returns:
+            int: 1 simple, 2 gammon, 3 backgammon, o 0 si nadie ganó todavía
+        """
+        winner = self.check_winner()
+        return game_points(self.__board__, winner.get_color()) if winner else 0
+
     def roll_dice(self) -> List[int]:
         """
         Lanza los dados y devuelve los valores.
@@ -72,6 +124,8 @@ class BackgammonGame:
             List[int]: Lista con los valores de los dados (2 o 4 elementos si hay dobles)
         """
         self.__remaining_moves__ = self.__dice__.roll()
+        if self.__recorder__ is not None:
+            self.__recorder__.on_roll(self.__remaining_moves__)
         return self.__remaining_moves__
 
     def get_remaining_moves(self) -> List[int]:
@@ -100,40 +154,128 @@ class BackgammonGame:
         player = self.get_current_player()
         
         try:
-            if from_point == 25:
-                self.__board__.move_checker_from_bar(player, die_value)
-            else:
-                self.__board__.move_checker(player, from_point - 1, die_value)
-            
-            self.__remaining_moves__.remove(die_value)
-            return True
+            record = self.__board__.make_move(player, 25 if from_point == 25 else from_point - 1, die_value)
         except ValueError:
             return False
 
+        self.__remaining_moves__.remove(die_value)
+        if self.__recorder__ is not None:
+            self.__recorder__.on_move(from_point, die_value, record.hit)
+            if self.__board__.has_won(player):
+                self.__recorder__.on_game_over(player.get_color())
+        return True
+
+    def iter_legal_moves(self, from_point: int | None = None) -> Iterator[Tuple[int, int]]:
+        """
+        Genera de a uno los movimientos de una ficha válidos con los dados restantes.
+
+        Sigue el orden de ``Board.iter_legal_moves`` (la barra primero y después
+        desde el punto más alejado de la salida), así que quien busca el primer
+        movimiento, o uno desde un punto dado, no valida el resto del tablero.
+
+        Args:
+            from_point (int | None): Origen al que limitar la búsqueda (1-24, 25
+                para la barra); None para todos
+
+        Yields:
+            Tuple[int, int]: Pares (origen, dado) con el origen en la numeración
+                de ``make_move``
+        """
+        if not self.__remaining_moves__:
+            return
+        origin = None if from_point is None else (25 if from_point == 25 else from_point - 1)
+        for point, die_value in self.__board__.iter_legal_moves(self.get_current_player(),
+                                                                 self.__remaining_moves__, origin):
+            yield (25 if point == 25 else point + 1), die_value
+
     def has_valid_moves(self) -> bool:
         """
         Verifica si el jugador actual tiene movimientos válidos.
-        
+
+        Usa la lista de la caché si ya está calculada; si no, se detiene en el
+        primer movimiento válido.
+
         Returns:
             bool: True si hay movimientos válidos, False en caso contrario
         """
-        player = self.get_current_player()
-
         if not self.__remaining_moves__:
             return False
+        key = LegalMoveCache.make_key(self.__board__, self.get_current_player(), self.__remaining_moves__)
+        moves = self.__move_cache__.peek(key)
+        if moves is not None:
+            return bool(moves)
+        return next(self.iter_legal_moves(), None) is not None
+
+    def get_legal_moves(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve los movimientos de una ficha válidos con los dados restantes.
+
+        El resultado se guarda en la caché de movimientos, por lo que repetir la
+        consulta sobre la misma posición y los mismos dados no vuelve a validar
+        cada punto.
+
+        Returns:
+            List[Tuple[int, int]]: Pares (origen, dado) con el origen en la
+                numeración de ``make_move`` (1-24, 25 para la barra), en el
+                orden de ``iter_legal_moves``
+        """
+        if not self.__remaining_moves__:
+            return []
+        key = LegalMoveCache.make_key(self.__board__, self.get_current_player(), self.__remaining_moves__)
+        return list(self.__move_cache__.get_or_compute(key, lambda: tuple(self.iter_legal_moves())))
 
-        if self.__board__.get_bar(player.get_color()) > 0:
-            return any(
-                self.__board__.is_valid_move(player, 25, die)
-                for die in self.__remaining_moves__
-            )
+    def play_turn(self, policy) -> Play:
+        """
+        Juega los dados restantes del jugador actual con la jugada que elija una política.
+
+        No lanza los dados ni cambia el turno, para que la interfaz o el bucle
+        de partidas decidan cuándo hacerlo.
+
+        Args:
+            policy (Policy): Política del bot que mueve (ver ``core.policies``)
+
+        Returns:
+            Play: Jugada realizada; vacía si no había movimientos posibles
+
+        Raises:
+            RuntimeError: Si la política elige un movimiento inválido
+        """
+        player = self.get_current_player()
+        plays = generate_plays(self.__board__, player, self.__remaining_moves__, self.__move_cache__)
+        if not plays:
+            return ()
+        play = policy.choose_play(self.__board__, player, plays)
+        for from_point, die_value in play:
+            if not self.make_move(25 if from_point == 25 else from_point + 1, die_value):
+                raise RuntimeError("La política eligió un movimiento inválido.")
+        return play
 
-        for point_idx, point in enumerate(self.__board__.get_all_points()):
-            if point and point[0] == player:
-                if any(self.__board__.is_valid_move(player, point_idx, die) for die in self.__remaining_moves__):
-                    return True
+    def get_recorder(self):
+        """
+        Devuelve el registro de la partida.
+
+        Returns:
+            GameRecordWriter | None: Registro, o None si no se anota la partida
+        """
+        return self.__recorder__
+
+    def get_move_cache(self) -> LegalMoveCache:
+        """
+        Devuelve la caché de movimientos legales de la partida.
+
+        Returns:
+            LegalMoveCache: Caché con sus estadísticas de uso
+        """
+        return self.__move_cache__
 
-        return False
+    def get_position_hash(self) -> int:
+        """
+        Devuelve el hash Zobrist de la posición incluyendo el jugador con el turno.
+        
+        Returns:
+            int: Hash de 64 bits del tablero combinado con el turno
+        """
+        return self.__board__.get_hash() ^ side_to_move_key(self.__current_player__.get_color())
 
     def get_board(self) -> Board:
         """
@@ -144,6 +286,15 @@ class BackgammonGame:
         """
         return self.__board__
 
+    def get_dice(self) -> Dice:
+        """
+        Devuelve los dados de la partida.
+
+        Returns:
+            Dice: Dados del juego
+        """
+        return self.__dice__
+
     def get_player1(self) -> Player:
         """
         Devuelve al jugador 1.
@@ -174,3 +325,28 @@ class BackgammonGame:
         self.__player2__ = Player(name2, "B")
         self.__current_player__ = self.__player1__
         self.__board__.setup_initial_checkers(self.__player1__, self.__player2__)
+        self.__remaining_moves__ = []
+        if self.__recorder__ is not None:
+            self.__recorder__.on_new_game(self)
+
+    def setup_position(self, counts: List[int], bar: Tuple[int, int] = (0, 0), color: str = "W",
+                       remaining_moves: List[int] | None = None):
+        """
+        Carga una posición arbitraria conservando a los jugadores actuales.
+
+        Args:
+            counts (List[int]): 24 conteos, positivos para Blancas y negativos para Negras
+            bar (Tuple[int, int]): Fichas en la barra de Blancas y Negras
+            color (str): Color del jugador con el turno
+            remaining_moves (List[int] | None): Dados por usar en el turno
+
+        Raises:
+            ValueError: Si la posición o el color son inválidos
+        """
+        if color not in ("W", "B"):
+            raise ValueError("Color inválido.")
+        self.__board__.setup_position(self.__player1__, self.__player2__, counts, bar)
+        self.__current_player__ = self.__player1__ if color == "W" else self.__player2__
+        self.__remaining_moves__ = list(remaining_moves or [])
+        if self.__recorder__ is not None:
+            self.__recorder__.on_new_game(self)
@@ -0,0 +1,271 @@
+"""
+Instrumentación opcional de los métodos críticos del motor.
+
+``EngineProfiler.enable()`` reemplaza en sus clases los métodos de
+``DEFAULT_TARGETS`` por envoltorios que cuentan llamadas y acumulan tiempo, y
+``disable()`` restaura los originales, por lo que la instrumentación no cuesta
+nada mientras está desactivada. Además de los totales por método, arma un
+histograma del tiempo de motor de cada turno (las llamadas anidadas se
+cuentan una sola vez) y puede perfilar con ``cProfile`` y volcar estadísticas
+compatibles con ``pstats``.
+
+Uso:
+    with EngineProfiler(profile=True) as profiler:
+        ...
+    print(profiler.report())
+    profiler.dump_profile("engine.pstats")
+"""
+import cProfile
+import functools
+import time
+from typing import Dict, List, Tuple
+
+from core.board import Board
+from core.game import BackgammonGame
+
+DEFAULT_TARGETS: List[Tuple[type, str]] = [
+    (Board, "is_valid_move"),
+    (Board, "is_ready_to_bear_off"),
+    (Board, "move_checker"),
+    (Board, "move_checker_from_bar"),
+    (Board, "make_move"),
+    (Board, "unmake_move"),
+    (BackgammonGame, "has_valid_moves"),
+    (BackgammonGame, "get_legal_moves"),
+    (BackgammonGame, "make_move"),
+]
+
+# Métodos que cierran el turno en curso al ser llamados.
+TURN_BOUNDARIES: List[Tuple[type, str]] = [
+    (BackgammonGame, "switch_player"),
+    (BackgammonGame, "start_new_game"),
+]
+
+
+class Histogram:
+    """
+    Histograma de duraciones con intervalos que se duplican desde 1 µs.
+
+    Attributes:
+        __counts__ (Dict[int, int]): Cantidad por límite superior del intervalo, en µs
+        __total__ (float): Suma de las duraciones en segundos
+        __count__ (int): Cantidad de duraciones registradas
+    """
+
+    def __init__(self):
+        self.__counts__: Dict[int, int] = {}
+        self.__total__ = 0.0
+        self.__count__ = 0
+
+    def add(self, seconds: float):
+        """Registra una duración."""
+        bound = 1
+        while bound < seconds * 1e6:
+            bound *= 2
+        self.__counts__[bound] = self.__counts__.get(bound, 0) + 1
+        self.__total__ += seconds
+        self.__count__ += 1
+
+    def get_buckets(self) -> List[Tuple[int, int]]:
+        """
+        Devuelve los intervalos no vacíos.
+
+        Returns:
+            List[Tuple[int, int]]: Pares (límite superior en µs, cantidad), en orden
+        """
+        return sorted(self.__counts__.items())
+
+    def get_count(self) -> int:
+        """Devuelve la cantidad de duraciones registradas."""
+        return self.__count__
+
+    def get_total(self) -> float:
+        """Devuelve la suma de las duraciones en segundos."""
+        return self.__total__
+
+    def percentile(self, fraction: float) -> float:
+        """
+        Devuelve una cota superior del percentil indicado.
+
+        Args:
+            fraction (float): Percentil entre 0 y 1
+
+        Returns:
+            float: Límite superior, en segundos, del intervalo que contiene el percentil
+        """
+        if not self.__count__:
+            return 0.0
+        seen = 0
+        for bound, count in self.get_buckets():
+            seen += count
+            if seen >= fraction * self.__count__:
+                return bound / 1e6
+        return self.get_buckets()[-1][0] / 1e6
+
+
+class EngineProfiler:
+    """
+    Instrumentación de los métodos del motor que se activa y desactiva a pedido.
+
+    Attributes:
+        __targets__ (List[Tuple[type, str]]): Métodos a medir
+        __profile__ (bool): Si es True, también perfila con ``cProfile``
+        __originals__ (Dict[Tuple[type, str], object]): Métodos reemplazados
+        __calls__ (Dict[str, List]): Llamadas y segundos acumulados por método
+        __turns__ (Histogram): Tiempo de motor por turno
+        __depth__ (int): Llamadas instrumentadas en curso (para no contar las anidadas)
+        __turn_time__ (float): Tiempo de motor del turno en curso
+        __turn_calls__ (int): Llamadas de primer nivel del turno en curso
+        __profiler__ (cProfile.Profile | None): Perfilador de la última activación
+    """
+
+    def __init__(self, targets: List[Tuple[type, str]] | None = None, profile: bool = False):
+        """
+        Args:
+            targets (List[Tuple[type, str]] | None): Pares (clase, método) a medir;
+                por defecto ``DEFAULT_TARGETS``
+            profile (bool): Si es True, perfila con ``cProfile`` mientras está activa
+        """
+        self.__targets__ = list(targets if targets is not None else DEFAULT_TARGETS)
+        self.__profile__ = profile
+        self.__originals__: Dict[Tuple[type, str], object] = {}
+        self.__profiler__ = None
+        self.reset()
+
+    def reset(self):
+        """Pone a cero los contadores y el histograma."""
+        self.__calls__: Dict[str, List] = {
+            f"{owner.__name__}.{name}": [0, 0.0] for owner, name in self.__targets__
+        }
+        self.__turns__ = Histogram()
+        self.__depth__ = 0
+        self.__turn_time__ = 0.0
+        self.__turn_calls__ = 0
+
+    def is_enabled(self) -> bool:
+        """Devuelve True si los métodos están instrumentados."""
+        return bool(self.__originals__)
+
+    def enable(self):
+        """
+        Reemplaza los métodos por sus envoltorios y empieza a perfilar si corresponde.
+
+        Raises:
+            RuntimeError: Si algún método ya está instrumentado
+        """
+        if self.is_enabled():
+            return
+        for owner, name in self.__targets__ + TURN_BOUNDARIES:
+            if getattr(owner.__dict__.get(name), "__instrumented__", False):
+                raise RuntimeError(f"{owner.__name__}.{name} ya está instrumentado.")
+        for owner, name in self.__targets__:
+            self._patch(owner, name, self._timed(f"{owner.__name__}.{name}", owner.__dict__[name]))
+        for owner, name in TURN_BOUNDARIES:
+            self._patch(owner, name, self._turn_boundary(owner.__dict__[name]))
+        if self.__profile__:
+            self.__profiler__ = cProfile.Profile()
+            self.__profiler__.enable()
+
+    def disable(self):
+        """Restaura los métodos originales y detiene el perfilado."""
+        if self.__profiler__ is not None:
+            self.__profiler__.disable()
+        self._end_turn()
+        for (owner, name), original in self.__originals__.items():
+            setattr(owner, name, original)
+        self.__originals__ = {}
+
+    def _patch(self, owner: type, name: str, wrapper):
+        self.__originals__[(owner, name)] = owner.__dict__[name]
+        wrapper.__instrumented__ = True
+        setattr(owner, name, wrapper)
+
+    def _timed(self, key: str, function):
+        totals = self.__calls__[key]
+
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self.__depth__ += 1
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                self.__depth__ -= 1
+                totals[0] += 1
+                totals[1] += elapsed
+                if self.__depth__ == 0:
+                    self.__turn_time__ += elapsed
+                    self.__turn_calls__ += 1
+        return wrapper
+
+    def _turn_boundary(self, function):
+        @functools.wraps(function)
+        def wrapper(*args, **kwargs):
+            self._end_turn()
+            return function(*args, **kwargs)
+        return wrapper
+
+    def _end_turn(self):
+        """Registra el tiempo de motor del turno en curso, si hubo llamadas."""
+        if self.__turn_calls__:
+            self.__turns__.add(self.__turn_time__)
+        self.__turn_time__ = 0.0
+        self.__turn_calls__ = 0
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """
+        Devuelve las estadísticas por método.
+
+        Returns:
+            Dict[str, Dict[str, float]]: Por "Clase.método", llamadas, segundos
+                totales y microsegundos por llamada
+        """
+        return {
+            key: {"calls": calls, "seconds": seconds, "us_per_call": seconds / calls * 1e6 if calls else 0.0}
+            for key, (calls, seconds) in self.__calls__.items()
+        }
+
+    def get_turn_histogram(self) -> Histogram:
+        """Devuelve el histograma del tiempo de motor por turno."""
+        return self.__turns__
+
+    def report(self) -> str:
+        """
+        Arma un informe de texto con los totales por método y el histograma por turno.
+
+        Returns:
+            str: Informe listo para imprimir
+        """
+        lines = [f"{'método':36} {'llamadas':>10} {'total ms':>10} {'µs/llamada':>11}"]
+        for key, stats in sorted(self.get_stats().items(), key=lambda item: -item[1]["seconds"]):
+            if stats["calls"]:
+                lines.append(f"{key:36} {stats['calls']:10d} {stats['seconds'] * 1000:10.2f} {stats['us_per_call']:11.2f}")
+        turns = self.__turns__
+        lines.append("")
+        lines.append(f"Turnos: {turns.get_count()}, tiempo de motor {turns.get_total() * 1000:.2f} ms, "
+                     f"p50 ≤ {turns.percentile(0.5) * 1e6:.0f} µs, p99 ≤ {turns.percentile(0.99) * 1e6:.0f} µs")
+        for bound, count in turns.get_buckets():
+            lines.append(f"  ≤ {bound:>8} µs  {count:6d}")
+        return "\n".join(lines)
+
+    def dump_profile(self, path: str):
+        """
+        Guarda las estadísticas de ``cProfile`` en un archivo legible con ``pstats``.
+
+        Args:
+            path (str): Archivo de destino
+
+        Raises:
+            RuntimeError: Si no se perfiló con ``cProfile``
+        """
+        if self.__profiler__ is None:
+            raise RuntimeError("No se perfiló con cProfile.")
+        self.__profiler__.dump_stats(path)
+
+    def __enter__(self) -> "EngineProfiler":
+        self.enable()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.disable()
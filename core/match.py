@@ -0,0 +1,420 @@
+"""
+Partidos a N puntos con cubo de doblaje, regla Crawford y gammons.
+
+``Match`` lleva el marcador, el valor y el dueño del cubo y el estado de la
+regla Crawford sobre un ``BackgammonGame``: al terminar cada juego suma los
+puntos (simple, gammon o backgammon, multiplicados por el cubo). Las
+decisiones de cubo son consultas a la ``MatchEquityTable``: con la
+probabilidad de ganar el juego y la fracción de gammons del modelo se
+comparan no doblar, doblar y aceptar, y doblar y abandonar, sin recalcular
+la tabla.
+
+Uso:
+    python -m core.match --length 7 --matches 100 --white heuristic --black pipcount
+"""
+import argparse
+import time
+from typing import Dict
+
+import numpy as np
+
+from core.bearoff import BearoffDatabase
+from core.dice import Dice
+from core.evaluation import HeuristicEvaluator, evaluate_boards
+from core.game import BackgammonGame
+from core.met import MatchEquityTable
+from core.policies import POLICIES, Policy
+from core.race import has_contact, race_win_probability
+from core.selfplay import DICE_BLOCK_SIZE, MAX_TURNS, derive_seed
+
+
+def _other(color: str) -> str:
+    return "B" if color == "W" else "W"
+
+
+class Match:
+    """
+    Partido a ``length`` puntos entre las Blancas y las Negras de un juego.
+
+    Attributes:
+        __length__ (int): Puntos para ganar el partido
+        __game__ (BackgammonGame): Juego en curso
+        __table__ (MatchEquityTable): Tabla de equity para las decisiones de cubo
+        __score__ (Dict[str, int]): Puntos de cada color
+        __cube__ (int): Valor del cubo
+        __cube_owner__ (str | None): Color dueño del cubo, o None si está centrado
+        __pending__ (str | None): Color que dobló y espera respuesta
+        __crawford_rule__ (bool): Si se aplica la regla Crawford
+        __crawford_game__ (bool): True durante el juego Crawford (sin cubo)
+        __post_crawford__ (bool): True después del juego Crawford
+        __winner__ (str | None): Color ganador del partido
+        __games__ (int): Juegos terminados
+    """
+
+    def __init__(self, length: int, game: BackgammonGame | None = None, table: MatchEquityTable | None = None,
+                 crawford: bool = True):
+        """
+        Args:
+            length (int): Puntos para ganar el partido
+            game (BackgammonGame | None): Juego a usar; si no se indica, se crea uno
+            table (MatchEquityTable | None): Tabla de equity; por defecto la compartida
+            crawford (bool): Si se aplica la regla Crawford
+
+        Raises:
+            ValueError: Si el largo no es positivo o supera el de la tabla
+        """
+        self.__table__ = table if table is not None else MatchEquityTable.default()
+        if not 1 <= length <= self.__table__.get_length():
+            raise ValueError(f"El largo del partido debe estar entre 1 y {self.__table__.get_length()}.")
+        self.__length__ = length
+        self.__game__ = game if game is not None else BackgammonGame()
+        self.__score__: Dict[str, int] = {"W": 0, "B": 0}
+        self.__crawford_rule__ = crawford
+        self.__crawford_game__ = False
+        self.__post_crawford__ = False
+        self.__winner__ = None
+        self.__games__ = 0
+        self._reset_cube()
+
+    def _reset_cube(self):
+        self.__cube__ = 1
+        self.__cube_owner__ = None
+        self.__pending__ = None
+
+    def get_game(self) -> BackgammonGame:
+        """Devuelve el juego en curso."""
+        return self.__game__
+
+    def get_length(self) -> int:
+        """Devuelve los puntos para ganar el partido."""
+        return self.__length__
+
+    def get_score(self, color: str) -> int:
+        """Devuelve los puntos de un color."""
+        return self.__score__[color]
+
+    def get_away(self, color: str) -> int:
+        """Devuelve los puntos que le faltan a un color para ganar el partido."""
+        return self.__length__ - self.__score__[color]
+
+    def get_cube(self) -> int:
+        """Devuelve el valor del cubo."""
+        return self.__cube__
+
+    def get_cube_owner(self) -> str | None:
+        """Devuelve el color dueño del cubo, o None si está centrado."""
+        return self.__cube_owner__
+
+    def get_pending_double(self) -> str | None:
+        """Devuelve el color que dobló y espera respuesta, si lo hay."""
+        return self.__pending__
+
+    def get_games(self) -> int:
+        """Devuelve la cantidad de juegos terminados."""
+        return self.__games__
+
+    def is_crawford_game(self) -> bool:
+        """Indica si el juego en curso es el juego Crawford (sin cubo)."""
+        return self.__crawford_game__
+
+    def is_post_crawford(self) -> bool:
+        """Indica si ya se jugó el juego Crawford."""
+        return self.__post_crawford__
+
+    def get_winner(self) -> str | None:
+        """Devuelve el color ganador del partido, o None si sigue en juego."""
+        return self.__winner__
+
+    def is_over(self) -> bool:
+        """Indica si el partido terminó."""
+        return self.__winner__ is not None
+
+    def can_double(self, color: str) -> bool:
+        """
+        Indica si un color puede doblar ahora.
+
+        Se dobla antes de tirar, en el turno propio, con el cubo centrado o
+        propio, fuera del juego Crawford.
+
+        Args:
+            color (str): Color que quiere doblar
+
+        Returns:
+            bool: True si puede ofrecer el doble
+        """
+        game = self.__game__
+        return (self.__winner__ is None and self.__pending__ is None and not self.__crawford_game__
+                and self.__cube_owner__ in (None, color) and game.get_current_player().get_color() == color
+                and not game.get_remaining_moves() and game.check_winner() is None)
+
+    def double(self, color: str):
+        """
+        Ofrece el doble.
+
+        Args:
+            color (str): Color que dobla
+
+        Raises:
+            ValueError: Si no puede doblar (ver ``can_double``)
+        """
+        if not self.can_double(color):
+            raise ValueError("No se puede doblar.")
+        self.__pending__ = color
+
+    def take(self):
+        """
+        Acepta el doble pendiente: el cubo duplica su valor y pasa al rival de quien dobló.
+
+        Raises:
+            ValueError: Si no hay un doble pendiente
+        """
+        if self.__pending__ is None:
+            raise ValueError("No hay un doble pendiente.")
+        self.__cube__ *= 2
+        self.__cube_owner__ = _other(self.__pending__)
+        self.__pending__ = None
+
+    def drop(self) -> int:
+        """
+        Abandona ante el doble pendiente: quien dobló gana el valor actual del cubo.
+
+        Returns:
+            int: Puntos ganados por quien dobló
+
+        Raises:
+            ValueError: Si no hay un doble pendiente
+        """
+        if self.__pending__ is None:
+            raise ValueError("No hay un doble pendiente.")
+        points = self.__cube__
+        self._award(self.__pending__, points)
+        return points
+
+    def finish_game(self) -> int:
+        """
+        Suma los puntos del juego terminado: 1, 2 o 3 por el valor del cubo.
+
+        Returns:
+            int: Puntos ganados
+
+        Raises:
+            ValueError: Si el juego todavía no tiene ganador
+        """
+        winner = self.__game__.check_winner()
+        if winner is None:
+            raise ValueError("El juego no terminó.")
+        points = self.__game__.get_game_points() * self.__cube__
+        self._award(winner.get_color(), points)
+        return points
+
+    def _award(self, color: str, points: int):
+        """Suma los puntos, cierra el juego y actualiza el estado de la regla Crawford."""
+        self.__score__[color] += points
+        self.__games__ += 1
+        self.__pending__ = None
+        if self.__score__[color] >= self.__length__:
+            self.__winner__ = color
+            return
+        if self.__crawford_game__:
+            self.__crawford_game__ = False
+            self.__post_crawford__ = True
+        elif not self.__post_crawford__ and self.get_away(color) == 1:
+            if self.__crawford_rule__:
+                self.__crawford_game__ = True
+            else:
+                self.__post_crawford__ = True
+
+    def new_game(self):
+        """
+        Empieza el siguiente juego del partido con el cubo centrado.
+
+        Raises:
+            ValueError: Si el partido terminó
+        """
+        if self.__winner__ is not None:
+            raise ValueError("El partido terminó.")
+        self._reset_cube()
+        game = self.__game__
+        game.start_new_game(game.get_player1().get_name(), game.get_player2().get_name())
+
+    def get_match_equity(self, color: str) -> float:
+        """
+        Devuelve la probabilidad de ganar el partido de un color al empezar un juego con el marcador actual.
+
+        Args:
+            color (str): Color
+
+        Returns:
+            float: Valor de la tabla de equity
+        """
+        return self.__table__.equity(self.get_away(color), self.get_away(_other(color)),
+                                     self.__post_crawford__)
+
+    def cube_decision(self, color: str, win_probability: float) -> Dict[str, float | bool]:
+        """
+        Valora el doble de un color con consultas a la tabla de equity.
+
+        Se comparan, desde el punto de vista de ``color``, las equities de
+        partido de no doblar, de doblar y que acepten (el juego sigue con el
+        cubo al doble, sin más dobles) y de doblar y que abandonen.
+
+        Args:
+            color (str): Color que considera doblar
+            win_probability (float): Probabilidad de que ``color`` gane el juego
+
+        Returns:
+            Dict[str, float | bool]: Equity de "no_double", "double_take" y
+                "double_pass", y si conviene doblar ("double") y aceptar ("take")
+        """
+        table = self.__table__
+        away, opponent_away = self.get_away(color), self.get_away(_other(color))
+        post = self.__post_crawford__ or self.__crawford_game__
+        gammon, backgammon = table.get_gammon_rate(), table.get_backgammon_rate()
+        single = 1 - gammon - backgammon
+
+        def game_equity(cube):
+            win = (single * table.equity(away - cube, opponent_away, post)
+                   + gammon * table.equity(away - 2 * cube, opponent_away, post)
+                   + backgammon * table.equity(away - 3 * cube, opponent_away, post))
+            lose = (single * table.equity(away, opponent_away - cube, post)
+                    + gammon * table.equity(away, opponent_away - 2 * cube, post)
+                    + backgammon * table.equity(away, opponent_away - 3 * cube, post))
+            return win_probability * win + (1 - win_probability) * lose
+
+        cube = self.__cube__
+        no_double, double_take = game_equity(cube), game_equity(2 * cube)
+        double_pass = table.equity(away - cube, opponent_away, post)
+        return {
+            "no_double": no_double,
+            "double_take": double_take,
+            "double_pass": double_pass,
+            "double": min(double_take, double_pass) > no_double,
+            "take": double_take <= double_pass,
+        }
+
+    def should_take(self, color: str, win_probability: float) -> bool:
+        """
+        Indica si un color debería aceptar el doble pendiente.
+
+        Args:
+            color (str): Color que recibe el doble
+            win_probability (float): Probabilidad de que ``color`` gane el juego
+
+        Returns:
+            bool: True si aceptar da más equity de partido que abandonar
+        """
+        return self.cube_decision(_other(color), 1 - win_probability)["take"]
+
+
+def win_probability(board, color: str, evaluator=None, bearoff: BearoffDatabase | None = None) -> float:
+    """
+    Estima la probabilidad de ganar el juego del color que va a tirar.
+
+    En las carreras usa ``core.race``; con contacto convierte la equity del
+    evaluador (entre -1 y 1) en probabilidad.
+
+    Args:
+        board (Board): Tablero
+        color (str): Color que va a tirar
+        evaluator: Objeto con método ``evaluate(features)``; HeuristicEvaluator por defecto
+        bearoff (BearoffDatabase | None): Base para las carreras
+
+    Returns:
+        float: Probabilidad de ganar el juego
+    """
+    if not has_contact(board):
+        return race_win_probability(board, color, bearoff)
+    evaluator = evaluator if evaluator is not None else HeuristicEvaluator()
+    equity = float(evaluate_boards([board], color, evaluator)[0])
+    return float(np.clip((equity + 1) / 2, 0.0, 1.0))
+
+
+def play_match(white: Policy, black: Policy, length: int, seed: int, table: MatchEquityTable | None = None,
+               max_turns: int = MAX_TURNS) -> Dict[str, int | str | None]:
+    """
+    Juega un partido completo entre dos políticas que doblan y aceptan según la tabla de equity.
+
+    Args:
+        white (Policy): Política de las Blancas
+        black (Policy): Política de las Negras
+        length (int): Puntos para ganar el partido
+        seed (int): Semilla de los dados del partido
+        table (MatchEquityTable | None): Tabla de equity; por defecto la compartida
+        max_turns (int): Límite de turnos de seguridad por juego
+
+    Returns:
+        Dict: Ganador ("W", "B" o None), puntos de cada color, juegos, dobles y abandonos
+    """
+    game = BackgammonGame(dice=Dice(seed=seed, block_size=DICE_BLOCK_SIZE))
+    game.start_new_game("Bot W", "Bot B")
+    match = Match(length, game, table)
+    board = game.get_board()
+    policies = {"W": white, "B": black}
+    evaluator, bearoff = HeuristicEvaluator(), BearoffDatabase.default()
+    doubles = drops = 0
+    while not match.is_over():
+        for _ in range(max_turns):
+            color = game.get_current_player().get_color()
+            if match.can_double(color):
+                probability = win_probability(board, color, evaluator, bearoff)
+                if match.cube_decision(color, probability)["double"]:
+                    match.double(color)
+                    doubles += 1
+                    if match.should_take(_other(color), 1 - probability):
+                        match.take()
+                    else:
+                        match.drop()
+                        drops += 1
+                        break
+            game.roll_dice()
+            game.play_turn(policies[color])
+            if game.check_winner():
+                match.finish_game()
+                break
+            game.switch_player()
+        else:
+            break
+        if not match.is_over():
+            match.new_game()
+    return {
+        "winner": match.get_winner(),
+        "white_score": match.get_score("W"),
+        "black_score": match.get_score("B"),
+        "games": match.get_games(),
+        "doubles": doubles,
+        "drops": drops,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partidos automáticos entre bots con cubo de doblaje.")
+    parser.add_argument("--length", type=int, default=7)
+    parser.add_argument("--matches", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--white", choices=sorted(POLICIES), default="heuristic")
+    parser.add_argument("--black", choices=sorted(POLICIES), default="pipcount")
+    args = parser.parse_args()
+
+    table = MatchEquityTable.default()
+    totals = {"W": 0, "B": 0, None: 0}
+    games = doubles = drops = 0
+    start = time.perf_counter()
+    for index in range(args.matches):
+        match_seed = derive_seed(args.seed, index)
+        result = play_match(POLICIES[args.white](match_seed), POLICIES[args.black](match_seed + 1),
+                            args.length, match_seed, table)
+        totals[result["winner"]] += 1
+        games += result["games"]
+        doubles += result["doubles"]
+        drops += result["drops"]
+    elapsed = time.perf_counter() - start
+    played = max(args.matches, 1)
+    print(f"Partidos a {args.length}: {args.matches} en {elapsed:.2f} s ({args.matches / elapsed:.2f} partidos/s)")
+    print(f"Victorias Blancas:  {totals['W'] / played:.1%} ({args.white} vs {args.black})")
+    print(f"Juegos por partido: {games / played:.1f}, dobles {doubles}, abandonos {drops}")
+    if totals[None]:
+        print(f"Sin terminar:       {totals[None]}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,297 @@
+"""
+Tabla de equity de partido (MET): probabilidad de ganar un partido a N puntos
+según cuántos puntos le faltan a cada jugador.
+
+La tabla se genera una sola vez con un modelo continuo del cubo (Keeler y
+Spencer): dentro de cada juego la probabilidad de ganar se mueve sin saltos,
+cada jugador dobla justo en el punto de aceptación del rival y la equity es
+lineal entre los puntos de doblar. Los puntos de aceptación de cada nivel del
+cubo se calculan desde el cubo muerto hacia abajo, usando la propia tabla para
+los marcadores siguientes. Una fracción fija de las victorias son gammons y
+backgammons. El juego en que alguien queda a 1 punto se juega sin cubo
+(regla Crawford) y los siguientes con cubo.
+
+La tabla se genera al arrancar (unos milisegundos para 25 puntos) o se carga
+de un archivo binario generado con:
+    python -m core.met --length 25 --output assets/met.bin
+"""
+import argparse
+import os
+import struct
+import time
+from array import array
+from typing import Callable, Dict, Tuple
+
+DEFAULT_LENGTH = 25
+GAMMON_RATE = 0.26
+BACKGAMMON_RATE = 0.01
+MAGIC = b"BGME"
+HEADER = struct.Struct("<4sBBxxff")
+DEFAULT_PATH = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "assets", "met.bin")
+
+# Tramo lineal de equity: (p inferior, equity inferior, p superior, equity superior).
+Line = Tuple[float, float, float, float]
+
+
+def _at(line: Line, p: float) -> float:
+    low_p, low_v, high_p, high_v = line
+    if p <= low_p:
+        return low_v
+    if p >= high_p:
+        return high_v
+    return low_v + (high_v - low_v) * (p - low_p) / (high_p - low_p)
+
+
+def _solve(line: Line, target: float) -> float:
+    """Devuelve la probabilidad en la que un tramo creciente alcanza ``target``."""
+    low_p, low_v, high_p, high_v = line
+    if target <= low_v:
+        return low_p
+    if target >= high_v:
+        return high_p
+    return low_p + (target - low_v) * (high_p - low_p) / (high_v - low_v)
+
+
+def game_value(away: int, opponent_away: int, after: Callable[[int, int], float],
+               gammon_rate: float = GAMMON_RATE, backgammon_rate: float = BACKGAMMON_RATE,
+               cube: bool = True) -> float:
+    """
+    Equity de partido al empezar un juego con el cubo centrado en 1.
+
+    Args:
+        away (int): Puntos que le faltan al jugador
+        opponent_away (int): Puntos que le faltan al rival
+        after (Callable[[int, int], float]): Equity del jugador al terminar el
+            juego, según los puntos que les falten a ambos
+        gammon_rate (float): Fracción de victorias por gammon
+        backgammon_rate (float): Fracción de victorias por backgammon
+        cube (bool): Si es False el juego se juega sin cubo (juego Crawford)
+
+    Returns:
+        float: Probabilidad de ganar el partido
+    """
+    single = 1 - gammon_rate - backgammon_rate
+
+    def win(c):
+        return (single * after(away - c, opponent_away) + gammon_rate * after(away - 2 * c, opponent_away)
+                + backgammon_rate * after(away - 3 * c, opponent_away))
+
+    def lose(c):
+        return (single * after(away, opponent_away - c) + gammon_rate * after(away, opponent_away - 2 * c)
+                + backgammon_rate * after(away, opponent_away - 3 * c))
+
+    if not cube:
+        return 0.5 * win(1) + 0.5 * lose(1)
+    top = 1
+    while top < max(away, opponent_away):
+        top *= 2
+    # Por nivel del cubo, tramo de equity según quién lo tiene: el jugador, el rival o nadie.
+    lines: Dict[str, Line] = {}
+    c = top
+    while c >= 1:
+        full = (0.0, lose(c), 1.0, win(c))
+        if c == top:
+            lines = {owner: full for owner in ("own", "opp", "center")}
+        else:
+            cash, dropped = after(away - c, opponent_away), after(away, opponent_away - c)
+            # Se dobla en el punto de aceptación del rival, que pasaría a tener el cubo en 2c.
+            own_double = (_solve(lines["opp"], cash), cash)
+            opp_double = (_solve(lines["own"], dropped), dropped)
+
+            def upper(low_p, low_v):
+                keep = low_v + (full[3] - low_v) * (own_double[0] - low_p) / (1 - low_p) if low_p < 1 else low_v
+                return own_double if own_double[1] > keep else (1.0, full[3])
+
+            def lower(high_p, high_v):
+                keep = full[1] + (high_v - full[1]) * opp_double[0] / high_p if high_p > 0 else high_v
+                return opp_double if opp_double[1] < keep else (0.0, full[1])
+
+            own_line = (0.0, full[1]) + upper(0.0, full[1])
+            opp_line = lower(1.0, full[3]) + (1.0, full[3])
+            # Con el cubo centrado cada uno decide si dobla según el tramo del otro.
+            high = own_double
+            low = lower(*high)
+            high = upper(*low)
+            low = lower(*high)
+            lines = {"own": own_line, "opp": opp_line, "center": low + high}
+        c //= 2
+    return _at(lines["center"], 0.5)
+
+
+def build_table(length: int = DEFAULT_LENGTH, gammon_rate: float = GAMMON_RATE,
+                backgammon_rate: float = BACKGAMMON_RATE) -> Tuple[array, array]:
+    """
+    Genera la tabla de un partido de hasta ``length`` puntos.
+
+    Args:
+        length (int): Puntos máximos que le pueden faltar a cada jugador
+        gammon_rate (float): Fracción de victorias por gammon
+        backgammon_rate (float): Fracción de victorias por backgammon
+
+    Returns:
+        Tuple[array, array]: Equity antes del Crawford, con índice
+            ``away * (length + 1) + opponent_away`` (con alguno a 1 es el juego
+            Crawford), y equity post-Crawford de quien está a 1 punto, por
+            puntos que le faltan al rival
+    """
+    size = length + 1
+    post = array("d", [0.0] * size)
+
+    def post_after(away, opponent_away):
+        if away <= 0:
+            return 1.0
+        if opponent_away <= 0:
+            return 0.0
+        return post[opponent_away] if away == 1 else 1 - post[away]
+
+    post[1] = 0.5
+    for away in range(2, size):
+        post[away] = game_value(1, away, post_after, gammon_rate, backgammon_rate)
+
+    pre = array("d", [0.0] * size * size)
+
+    def pre_after(away, opponent_away):
+        if away <= 0:
+            return 1.0
+        if opponent_away <= 0:
+            return 0.0
+        return pre[away * size + opponent_away]
+
+    pre[1 * size + 1] = 0.5
+    for away in range(2, size):
+        pre[1 * size + away] = game_value(1, away, post_after, gammon_rate, backgammon_rate, cube=False)
+        pre[away * size + 1] = 1 - pre[1 * size + away]
+    for total in range(4, 2 * length + 1):
+        for away in range(max(2, total - length), min(length, total - 2) + 1):
+            pre[away * size + total - away] = game_value(away, total - away, pre_after, gammon_rate, backgammon_rate)
+    return pre, post
+
+
+def save_table(path: str, length: int = DEFAULT_LENGTH, gammon_rate: float = GAMMON_RATE,
+               backgammon_rate: float = BACKGAMMON_RATE):
+    """Genera la tabla y la guarda en un archivo binario de floats."""
+    pre, post = build_table(length, gammon_rate, backgammon_rate)
+    with open(path, "wb") as handle:
+        handle.write(HEADER.pack(MAGIC, 1, length, gammon_rate, backgammon_rate))
+        array("f", pre).tofile(handle)
+        array("f", post).tofile(handle)
+
+
+class MatchEquityTable:
+    """
+    Consulta la equity de partido por marcador sin recalcular.
+
+    Attributes:
+        __length__ (int): Puntos máximos que le pueden faltar a cada jugador
+        __pre__ (array): Equity antes del Crawford y del juego Crawford
+        __post__ (array): Equity post-Crawford de quien está a 1 punto
+        __gammon_rate__ (float): Fracción de victorias por gammon del modelo
+        __backgammon_rate__ (float): Fracción de victorias por backgammon del modelo
+    """
+
+    _default = None
+
+    def __init__(self, length: int = DEFAULT_LENGTH, gammon_rate: float = GAMMON_RATE,
+                 backgammon_rate: float = BACKGAMMON_RATE, tables: Tuple[array, array] | None = None):
+        """
+        Args:
+            length (int): Puntos máximos que le pueden faltar a cada jugador
+            gammon_rate (float): Fracción de victorias por gammon
+            backgammon_rate (float): Fracción de victorias por backgammon
+            tables (Tuple[array, array] | None): Tablas ya generadas o leídas; si
+                no se indican, se generan
+        """
+        self.__length__ = length
+        self.__gammon_rate__ = gammon_rate
+        self.__backgammon_rate__ = backgammon_rate
+        self.__pre__, self.__post__ = tables if tables is not None else build_table(length, gammon_rate,
+                                                                                    backgammon_rate)
+
+    @classmethod
+    def load(cls, path: str) -> "MatchEquityTable":
+        """
+        Carga una tabla guardada con ``save_table``.
+
+        Args:
+            path (str): Archivo binario
+
+        Returns:
+            MatchEquityTable: Tabla leída
+
+        Raises:
+            ValueError: Si el archivo no tiene el formato esperado
+        """
+        with open(path, "rb") as handle:
+            magic, version, length, gammon_rate, backgammon_rate = HEADER.unpack(handle.read(HEADER.size))
+            if magic != MAGIC or version != 1:
+                raise ValueError("Archivo de tabla de equity inválido.")
+            pre, post = array("f"), array("f")
+            pre.fromfile(handle, (length + 1) ** 2)
+            post.fromfile(handle, length + 1)
+        return cls(length, gammon_rate, backgammon_rate, (array("d", pre), array("d", post)))
+
+    @classmethod
+    def default(cls) -> "MatchEquityTable":
+        """
+        Devuelve la tabla compartida: la de ``DEFAULT_PATH`` si existe o una generada al vuelo.
+
+        Returns:
+            MatchEquityTable: Tabla de hasta ``DEFAULT_LENGTH`` puntos
+        """
+        if cls._default is None:
+            cls._default = cls.load(DEFAULT_PATH) if os.path.exists(DEFAULT_PATH) else cls()
+        return cls._default
+
+    def get_length(self) -> int:
+        """Devuelve los puntos máximos que le pueden faltar a cada jugador."""
+        return self.__length__
+
+    def get_gammon_rate(self) -> float:
+        """Devuelve la fracción de victorias por gammon del modelo."""
+        return self.__gammon_rate__
+
+    def get_backgammon_rate(self) -> float:
+        """Devuelve la fracción de victorias por backgammon del modelo."""
+        return self.__backgammon_rate__
+
+    def equity(self, away: int, opponent_away: int, post_crawford: bool = False) -> float:
+        """
+        Devuelve la probabilidad de ganar el partido al empezar un juego.
+
+        Args:
+            away (int): Puntos que le faltan al jugador (0 o menos si ya ganó)
+            opponent_away (int): Puntos que le faltan al rival
+            post_crawford (bool): True si ya se jugó el juego Crawford
+
+        Returns:
+            float: Probabilidad de ganar el partido
+
+        Raises:
+            IndexError: Si algún marcador supera el largo de la tabla
+        """
+        if away <= 0:
+            return 1.0
+        if opponent_away <= 0:
+            return 0.0
+        if away > self.__length__ or opponent_away > self.__length__:
+            raise IndexError("Marcador fuera de la tabla.")
+        if post_crawford and (away == 1 or opponent_away == 1):
+            return self.__post__[opponent_away] if away == 1 else 1 - self.__post__[away]
+        return self.__pre__[away * (self.__length__ + 1) + opponent_away]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Genera la tabla de equity de partido.")
+    parser.add_argument("--length", type=int, default=DEFAULT_LENGTH)
+    parser.add_argument("--gammon-rate", type=float, default=GAMMON_RATE)
+    parser.add_argument("--backgammon-rate", type=float, default=BACKGAMMON_RATE)
+    parser.add_argument("--output", default=DEFAULT_PATH)
+    args = parser.parse_args()
+    start = time.perf_counter()
+    save_table(args.output, args.length, args.gammon_rate, args.backgammon_rate)
+    print(f"Tabla generada en {args.output}: {os.path.getsize(args.output)} bytes "
+          f"en {(time.perf_counter() - start) * 1000:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
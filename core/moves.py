@@ -0,0 +1,259 @@
+from collections import OrderedDict
+from typing import Callable, Dict, Hashable, List, Tuple
+from core.player import Player
+
+Move = Tuple[int, int]
+Play = Tuple[Move, ...]
+
+
+def position_key(board) -> tuple:
+    """
+    Devuelve una clave inmutable que identifica la posición de un tablero.
+
+    Args:
+        board (Board): Tablero a identificar
+
+    Returns:
+        tuple: Conteos con signo de los puntos, barras y fichas retiradas
+    """
+    return (
+        tuple(board.get_counts()),
+        board.get_bar("W"), board.get_bar("B"),
+        board.get_borne_off("W"), board.get_borne_off("B"),
+    )
+
+
+class LegalMoveCache:
+    """
+    Caché LRU acotada para resultados de generación de movimientos.
+
+    La clave combina el hash Zobrist del tablero, el color que mueve, los dados
+    ordenados y el tipo de resultado. Como ``move_checker``,
+    ``move_checker_from_bar``, ``make_move`` y ``setup_initial_checkers``
+    actualizan el hash, una posición modificada nunca reutiliza resultados de
+    la anterior y no hace falta invalidar entradas a mano.
+
+    Attributes:
+        __max_size__ (int): Cantidad máxima de entradas
+        __entries__ (OrderedDict): Entradas desde la menos a la más usada
+        __stats__ (Dict[str, int]): Contadores de aciertos, fallos y desalojos
+    """
+
+    def __init__(self, max_size: int = 4096):
+        """
+        Args:
+            max_size (int): Cantidad máxima de entradas
+
+        Raises:
+            ValueError: Si el tamaño no es positivo
+        """
+        if max_size < 1:
+            raise ValueError("El tamaño de la caché debe ser positivo.")
+        self.__max_size__ = max_size
+        self.__entries__: OrderedDict = OrderedDict()
+        self.__stats__: Dict[str, int] = {"hits": 0, "misses": 0, "evictions": 0}
+
+    @staticmethod
+    def make_key(board, player: Player, dice: List[int], kind: str = "moves") -> tuple:
+        """
+        Devuelve la clave de una posición y una tirada.
+
+        Args:
+            board (Board): Tablero
+            player (Player): Jugador que mueve
+            dice (List[int]): Dados disponibles, en cualquier orden
+            kind (str): Tipo de resultado guardado ("moves" o "plays")
+
+        Returns:
+            tuple: Clave para ``get``/``put``
+        """
+        return board.get_hash(), player.get_color(), tuple(sorted(dice)), kind
+
+    def get(self, key: Hashable):
+        """
+        Devuelve el valor guardado y lo marca como el más reciente.
+
+        Args:
+            key (Hashable): Clave creada con ``make_key``
+
+        Returns:
+            object | None: Valor guardado, o None si no está
+        """
+        value = self.__entries__.get(key)
+        if value is None:
+            self.__stats__["misses"] += 1
+            return None
+        self.__entries__.move_to_end(key)
+        self.__stats__["hits"] += 1
+        return value
+
+    def peek(self, key: Hashable):
+        """
+        Devuelve el valor guardado sin contarlo en las estadísticas ni reordenarlo.
+
+        Args:
+            key (Hashable): Clave creada con ``make_key``
+
+        Returns:
+            object | None: Valor guardado, o None si no está
+        """
+        return self.__entries__.get(key)
+
+    def put(self, key: Hashable, value):
+        """
+        Guarda un valor, desalojando el menos usado si la caché está llena.
+
+        Args:
+            key (Hashable): Clave creada con ``make_key``
+            value (object): Valor a guardar (no puede ser None)
+        """
+        self.__entries__[key] = value
+        self.__entries__.move_to_end(key)
+        if len(self.__entries__) > self.__max_size__:
+            self.__entries__.popitem(last=False)
+            self.__stats__["evictions"] += 1
+
+    def get_or_compute(self, key: Hashable, compute: Callable[[], object]):
+        """
+        Devuelve el valor guardado o lo calcula y lo guarda.
+
+        Args:
+            key (Hashable): Clave creada con ``make_key``
+            compute (Callable): Función que calcula el valor si no está
+
+        Returns:
+            object: Valor guardado o recién calculado
+        """
+        value = self.get(key)
+        if value is None:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    def clear(self):
+        """Vacía la caché sin reiniciar las estadísticas."""
+        self.__entries__.clear()
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Devuelve las estadísticas de uso de la caché.
+
+        Returns:
+            Dict[str, int]: Aciertos, fallos, desalojos, tamaño actual y máximo
+        """
+        return {**self.__stats__, "size": len(self.__entries__), "max_size": self.__max_size__}
+
+    def __len__(self) -> int:
+        return len(self.__entries__)
+
+
+def legal_single_moves(board, player: Player, die_value: int) -> List[Move]:
+    """
+    Devuelve los movimientos de una ficha válidos para un único dado.
+
+    Si el jugador tiene fichas en la barra, sólo puede reingresarlas.
+
+    Args:
+        board (Board): Tablero sobre el que se mueve
+        player (Player): Jugador que mueve
+        die_value (int): Valor del dado
+
+    Returns:
+        List[Move]: Pares (origen, dado), con 25 como origen para la barra
+    """
+    return list(board.iter_legal_moves(player, [die_value]))
+
+
+def apply_move(board, player: Player, move: Move):
+    """
+    Ejecuta un movimiento (origen, dado) sobre el tablero.
+
+    Args:
+        board (Board): Tablero a modificar
+        player (Player): Jugador que mueve
+        move (Move): Par (origen, dado), con 25 como origen para la barra
+    """
+    from_point, die_value = move
+    if from_point == 25:
+        board.move_checker_from_bar(player, die_value)
+    else:
+        board.move_checker(player, from_point, die_value)
+
+
+def _dice_orders(dice: List[int]) -> List[Tuple[int, ...]]:
+    """Devuelve los órdenes en que pueden usarse los dados restantes."""
+    values = list(dice)
+    if len(set(values)) == 1:
+        return [tuple(values)]
+    return [tuple(values), tuple(reversed(values))]
+
+
+def generate_plays(board, player: Player, dice: List[int], cache: LegalMoveCache | None = None) -> List[Play]:
+    """
+    Genera todas las jugadas completas legales para una tirada.
+
+    Una jugada es la secuencia de movimientos (origen, dado) que usa la mayor
+    cantidad posible de dados; si sólo puede usarse un dado de una tirada no
+    doble, se exige el mayor cuando sea jugable. Las jugadas que llevan a la
+    misma posición final (igual hash Zobrist) se devuelven una sola vez.
+
+    Args:
+        board (Board): Tablero de partida; se explora con ``make_move`` y
+            ``unmake_move`` y queda en su estado original al terminar
+        player (Player): Jugador que mueve
+        dice (List[int]): Dados por usar, exactamente los movimientos que
+            quedan: una tirada doble debe venir con sus 4 valores, y [3, 3]
+            son los dos movimientos que quedan a mitad de un doble
+        cache (LegalMoveCache | None): Caché donde buscar y guardar el resultado
+
+    Returns:
+        List[Play]: Jugadas legales distintas, o lista vacía si no puede mover
+    """
+    if cache is not None:
+        key = LegalMoveCache.make_key(board, player, dice, "plays")
+        return list(cache.get_or_compute(key, lambda: tuple(generate_plays(board, player, dice))))
+
+    plays = {}
+    best_length = 0
+    visited = set()
+
+    def record(position, play):
+        nonlocal best_length
+        if len(play) > best_length:
+            best_length = len(play)
+            plays.clear()
+        if len(play) == best_length:
+            kept = plays.setdefault(position, play)
+            # Con un solo movimiento se conserva el dado mayor, que es el que exige la regla.
+            if len(play) == 1 and play[0][1] > kept[0][1]:
+                plays[position] = play
+
+    def search(remaining, play):
+        moves = legal_single_moves(board, player, remaining[0])
+        if not moves:
+            record(board.get_hash(), play)
+            return
+        rest = remaining[1:]
+        for move in moves:
+            undo = board.make_move(player, *move)
+            key = board.get_hash()
+            if (key, rest) not in visited:
+                visited.add((key, rest))
+                if rest:
+                    search(rest, play + (move,))
+                else:
+                    record(key, play + (move,))
+            board.unmake_move(player, undo)
+
+    if not dice:
+        return []
+    for order in _dice_orders(dice):
+        search(order, ())
+
+    if best_length == 0:
+        return []
+    result = list(plays.values())
+    if best_length == 1 and len(_dice_orders(dice)) == 2:
+        largest = max(play[0][1] for play in result)
+        result = [play for play in result if play[0][1] == largest]
+    return result
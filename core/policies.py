@@ -0,0 +1,268 @@
+import random
+import time
+from multiprocessing import Pool
+from typing import Dict, List, Tuple, Type
+import numpy as np
+from core.bearoff import BearoffDatabase, home_counts, is_pure_bear_off
+from core.dice import ROLLS
+from core.evaluation import HeuristicEvaluator, evaluate_plays
+from core.moves import Play
+from core.player import Player
+from core.position_id import encode_position
+from core.race import has_contact, race_play_values
+from core.search import WIN_VALUE, Searcher, init_worker, load_board, other_color, roll_task
+
+
+class Policy:
+    """
+    Política de un bot: elige una jugada entre las jugadas legales de una tirada.
+
+    Las subclases implementan ``choose_play``. El constructor recibe una semilla
+    para que las elecciones al azar sean reproducibles.
+    """
+
+    def __init__(self, seed: int | None = None):
+        self.__rng__ = random.Random(seed)
+
+    def get_rng(self) -> random.Random:
+        """Devuelve el generador aleatorio propio de la política."""
+        return self.__rng__
+
+    def choose_play(self, board, player: Player, plays: List[Play]) -> Play:
+        """
+        Elige una jugada.
+
+        Args:
+            board (Board): Tablero antes de mover (no debe quedar modificado)
+            player (Player): Jugador que mueve
+            plays (List[Play]): Jugadas legales (al menos una)
+
+        Returns:
+            Play: Jugada elegida
+        """
+        raise NotImplementedError
+
+
+class RandomPolicy(Policy):
+    """Elige una jugada legal al azar."""
+
+    def choose_play(self, board, player: Player, plays: List[Play]) -> Play:
+        return self.get_rng().choice(plays)
+
+
+class PipCountPolicy(Policy):
+    """
+    Elige la jugada que maximiza la diferencia de pip count a su favor.
+
+    Premia avanzar y golpear fichas rivales; desempata al azar.
+    """
+
+    def choose_play(self, board, player: Player, plays: List[Play]) -> Play:
+        color = player.get_color()
+        opponent = "B" if color == "W" else "W"
+        best_score, best_plays = None, []
+        for play in plays:
+            records = [board.make_move(player, *move) for move in play]
+            score = board.pip_count(opponent) - board.pip_count(color)
+            for record in reversed(records):
+                board.unmake_move(player, record)
+            if best_score is None or score > best_score:
+                best_score, best_plays = score, [play]
+            elif score == best_score:
+                best_plays.append(play)
+        return self.get_rng().choice(best_plays)
+
+
+class EvaluatorPolicy(Policy):
+    """
+    Elige la jugada con mayor equity según un evaluador por lotes.
+
+    En retiradas puras (ambos jugadores en su home board, sin contacto) usa la
+    base de datos de bear-off y elige la jugada con menos tiradas esperadas; en
+    el resto de las carreras elige con ``core.race``.
+    """
+
+    def __init__(self, seed: int | None = None, evaluator=None, bearoff: BearoffDatabase | None = None):
+        """
+        Args:
+            seed (int | None): Semilla para los desempates
+            evaluator: Objeto con método ``evaluate(features)``; HeuristicEvaluator por defecto
+            bearoff (BearoffDatabase | None): Base de retirada; por defecto la
+                de ``DEFAULT_PATH`` si fue generada
+        """
+        super().__init__(seed)
+        self.__evaluator__ = evaluator if evaluator is not None else HeuristicEvaluator()
+        self.__bearoff__ = bearoff if bearoff is not None else BearoffDatabase.default()
+
+    def get_evaluator(self):
+        """Devuelve el evaluador usado por la política."""
+        return self.__evaluator__
+
+    def choose_play(self, board, player: Player, plays: List[Play]) -> Play:
+        if self.__bearoff__ is not None and is_pure_bear_off(board):
+            play = self._choose_bear_off(board, player, plays)
+            if play is not None:
+                return play
+        if not has_contact(board):
+            return plays[int(np.argmax(race_play_values(board, player, plays, self.__bearoff__)))]
+        scores = evaluate_plays(board, player, plays, self.__evaluator__)
+        return plays[int(np.argmax(scores))]
+
+    def _choose_bear_off(self, board, player: Player, plays: List[Play]) -> Play | None:
+        """Devuelve la jugada con menos tiradas esperadas, o None si la base no la cubre."""
+        color = player.get_color()
+        if not self.__bearoff__.covers(home_counts(board, color)):
+            return None
+        best_rolls, best_play = None, None
+        for play in plays:
+            records = [board.make_move(player, *move) for move in play]
+            rolls = self.__bearoff__.expected_rolls(home_counts(board, color))
+            for record in reversed(records):
+                board.unmake_move(player, record)
+            if best_rolls is None or rolls < best_rolls:
+                best_rolls, best_play = rolls, play
+        return best_play
+
+
+class ExpectiminimaxPolicy(Policy):
+    """
+    Política que elige la jugada con mejor valor esperado a ``depth`` plies.
+
+    ``depth=1`` elige la mejor posición inmediata; ``depth=2`` promedia además
+    la mejor respuesta del rival a cada una de sus 21 tiradas, y así
+    sucesivamente. En las carreras no busca: elige a 1 ply con ``core.race``.
+    Con ``workers > 1`` las ramas de azar de la raíz se evalúan en paralelo;
+    hay que llamar a ``close()`` (o usar ``with``) al terminar.
+
+    Attributes:
+        __depth__ (int): Plies de búsqueda
+        __workers__ (int): Procesos del pool (1 busca en el proceso actual)
+        __searcher__ (Searcher): Buscador local
+        __bearoff__ (BearoffDatabase | None): Base de retirada para las carreras
+        __pool__ (Pool | None): Pool de procesos, creado al primer uso
+        __stats__ (Dict[str, float]): Decisiones, nodos y segundos acumulados
+    """
+
+    def __init__(self, seed: int | None = None, depth: int = 2, workers: int = 1,
+                 evaluator=None, candidates: int = 8):
+        """
+        Args:
+            seed (int | None): Semilla de la política
+            depth (int): Plies de búsqueda (al menos 1)
+            workers (int): Procesos para las ramas de azar de la raíz
+            evaluator: Evaluador de hojas; HeuristicEvaluator por defecto
+            candidates (int): Jugadas exploradas más allá de 1 ply por nodo
+
+        Raises:
+            ValueError: Si la profundidad o la cantidad de candidatas no son positivas
+        """
+        if depth < 1 or candidates < 1:
+            raise ValueError("La profundidad y las candidatas deben ser positivas.")
+        super().__init__(seed)
+        self.__depth__ = depth
+        self.__workers__ = workers
+        self.__searcher__ = Searcher(evaluator, candidates)
+        self.__bearoff__ = BearoffDatabase.default()
+        self.__evaluator__ = evaluator
+        self.__candidates__ = candidates
+        self.__pool__ = None
+        self.__stats__: Dict[str, float] = {"decisions": 0, "nodes": 0, "seconds": 0.0}
+
+    def choose_play(self, board, player: Player, plays: List[Play]) -> Play:
+        start = time.perf_counter()
+        if not has_contact(board):
+            values = race_play_values(board, player, plays, self.__bearoff__)
+            self._record(len(plays), start)
+            return plays[int(np.argmax(values))]
+        root = player.get_color()
+        local, players = load_board(board.get_counts(), (board.get_bar("W"), board.get_bar("B")))
+        searcher = self.__searcher__
+        values = searcher.play_values(local, players[root], plays, root)
+        remote_nodes = 0
+        if self.__depth__ > 1 and len(plays) > 1:
+            searched = searcher.best_indices(values, True)
+            candidates = [index for index in searched if values[index] != WIN_VALUE]
+            deep_values, remote_nodes = self._deep_values(local, players, plays, candidates, root)
+            values[candidates] = deep_values
+            # Sólo se comparan las jugadas buscadas: las demás tienen valores de 1 ply.
+            values = searcher.restrict(values, searched, True)
+        self._record(searcher.take_nodes() + remote_nodes, start)
+        return plays[int(np.argmax(values))]
+
+    def _record(self, nodes: int, start: float):
+        """Suma una decisión a las métricas."""
+        self.__stats__["decisions"] += 1
+        self.__stats__["nodes"] += nodes
+        self.__stats__["seconds"] += time.perf_counter() - start
+
+    def _deep_values(self, board, players, plays: List[Play], candidates: List[int],
+                     root: str) -> Tuple[List[float], int]:
+        """Valora las jugadas candidatas promediando las 21 tiradas del rival; devuelve también los nodos remotos."""
+        opponent, depth = other_color(root), self.__depth__ - 1
+        player = players[root]
+        if self.__workers__ <= 1:
+            values = []
+            for index in candidates:
+                records = [board.make_move(player, *move) for move in plays[index]]
+                values.append(self.__searcher__.chance_value(board, players, opponent, depth, root))
+                for record in reversed(records):
+                    board.unmake_move(player, record)
+            return values, 0
+
+        tasks = []
+        for index in candidates:
+            records = [board.make_move(player, *move) for move in plays[index]]
+            position_id = encode_position(board)
+            tasks.extend((position_id, opponent, a, b, depth, root) for a, b, _ in ROLLS)
+            for record in reversed(records):
+                board.unmake_move(player, record)
+        results = self._get_pool().map(roll_task, tasks, chunksize=max(1, len(tasks) // (4 * self.__workers__)))
+        values = []
+        for start in range(0, len(results), len(ROLLS)):
+            branch = results[start:start + len(ROLLS)]
+            values.append(sum(probability * value for (_, _, probability), (value, _) in zip(ROLLS, branch)))
+        return values, sum(nodes for _, nodes in results)
+
+    def _get_pool(self) -> Pool:
+        if self.__pool__ is None:
+            self.__pool__ = Pool(self.__workers__, initializer=init_worker,
+                                 initargs=(self.__evaluator__, self.__candidates__))
+        return self.__pool__
+
+    def get_stats(self) -> Dict[str, float]:
+        """
+        Devuelve las métricas acumuladas de la política.
+
+        Returns:
+            Dict[str, float]: Decisiones, nodos, segundos, nodos por segundo y
+                segundos por decisión
+        """
+        decisions, nodes, seconds = (self.__stats__[key] for key in ("decisions", "nodes", "seconds"))
+        return {
+            "decisions": decisions,
+            "nodes": nodes,
+            "seconds": seconds,
+            "nodes_per_sec": nodes / seconds if seconds else 0.0,
+            "seconds_per_decision": seconds / decisions if decisions else 0.0,
+        }
+
+    def close(self):
+        """Cierra el pool de procesos, si se creó."""
+        if self.__pool__ is not None:
+            self.__pool__.close()
+            self.__pool__.join()
+            self.__pool__ = None
+
+    def __enter__(self) -> "ExpectiminimaxPolicy":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+POLICIES: Dict[str, Type[Policy]] = {
+    "random": RandomPolicy,
+    "pipcount": PipCountPolicy,
+    "heuristic": EvaluatorPolicy,
+    "expectiminimax": ExpectiminimaxPolicy,
+}
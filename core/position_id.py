@@ -0,0 +1,213 @@
+"""
+Identificadores compactos de posiciones y turnos.
+
+El ID de posición sigue el esquema del position ID de GNU Backgammon: para
+cada color se escribe, por cada uno de sus 24 puntos (desde el más cercano a
+la salida) y luego la barra, un bit 1 por ficha seguido de un bit 0. Se
+escriben primero las Blancas y luego las Negras, siempre en ese orden; el
+turno va aparte, en el ID de turno. El flujo ocupa como máximo 80 bits, que
+se guardan en 10 bytes (bit menos significativo primero) y se muestran en
+base64 sin relleno (14 caracteres).
+
+El ID de turno guarda en 2 bytes el color que mueve y los dados restantes.
+"""
+import base64
+from typing import List, Tuple
+
+from core.game import BackgammonGame
+
+POSITION_BYTES = 10
+TURN_BYTES = 2
+_SLOTS = 25
+
+_WHITE_ORDER = list(range(23, -1, -1))
+_BLACK_ORDER = list(range(24))
+
+
+def _slot_counts(counts: List[int], bar: Tuple[int, int]) -> List[int]:
+    """Devuelve las 50 cantidades del flujo: puntos y barra de Blancas, luego de Negras."""
+    return (
+        [max(counts[point], 0) for point in _WHITE_ORDER] + [bar[0]]
+        + [max(-counts[point], 0) for point in _BLACK_ORDER] + [bar[1]]
+    )
+
+
+def encode_position_bytes(counts: List[int], bar: Tuple[int, int] = (0, 0)) -> bytes:
+    """
+    Codifica una posición en 10 bytes.
+
+    Args:
+        counts (List[int]): 24 conteos, positivos para Blancas y negativos para Negras
+        bar (Tuple[int, int]): Fichas en la barra de Blancas y Negras
+
+    Returns:
+        bytes: Flujo de bits de la posición
+
+    Raises:
+        ValueError: Si algún color tiene más de 15 fichas en el tablero y la barra
+    """
+    slots = _slot_counts(counts, bar)
+    if sum(slots[:_SLOTS]) > 15 or sum(slots[_SLOTS:]) > 15:
+        raise ValueError("Posición inválida: más de 15 fichas de un color.")
+    stream = "".join("1" * count + "0" for count in slots)
+    return int(stream[::-1], 2).to_bytes(POSITION_BYTES, "little")
+
+
+def decode_position_bytes(data: bytes) -> Tuple[List[int], Tuple[int, int]]:
+    """
+    Decodifica 10 bytes producidos por ``encode_position_bytes``.
+
+    Args:
+        data (bytes): Flujo de bits de la posición
+
+    Returns:
+        Tuple[List[int], Tuple[int, int]]: Conteos con signo y fichas en la barra
+
+    Raises:
+        ValueError: Si los datos no representan una posición válida
+    """
+    if len(data) != POSITION_BYTES:
+        raise ValueError("ID de posición inválido.")
+    stream = format(int.from_bytes(data, "little"), f"0{POSITION_BYTES * 8}b")[::-1]
+    groups = stream.split("0")
+    if len(groups) < 2 * _SLOTS or any(groups[2 * _SLOTS:]):
+        raise ValueError("ID de posición inválido.")
+    slots = [len(group) for group in groups[:2 * _SLOTS]]
+    white, black = slots[:_SLOTS], slots[_SLOTS:]
+    if sum(white) > 15 or sum(black) > 15:
+        raise ValueError("ID de posición inválido.")
+    counts = [0] * 24
+    for point, count in zip(_WHITE_ORDER, white):
+        counts[point] = count
+    for point, count in zip(_BLACK_ORDER, black):
+        if count and counts[point]:
+            raise ValueError("ID de posición inválido.")
+        counts[point] -= count
+    return counts, (white[-1], black[-1])
+
+
+def encode_position(board) -> str:
+    """
+    Devuelve el ID de posición de un tablero.
+
+    Args:
+        board (Board): Tablero (``Board`` o ``CompactBoard``)
+
+    Returns:
+        str: 14 caracteres base64
+    """
+    data = encode_position_bytes(board.get_counts(), (board.get_bar("W"), board.get_bar("B")))
+    return base64.b64encode(data).decode("ascii").rstrip("=")
+
+
+def decode_position(position_id: str) -> Tuple[List[int], Tuple[int, int]]:
+    """
+    Decodifica un ID de posición.
+
+    El resultado puede cargarse con ``Board.setup_position`` o
+    ``BackgammonGame.setup_position``.
+
+    Args:
+        position_id (str): ID producido por ``encode_position``
+
+    Returns:
+        Tuple[List[int], Tuple[int, int]]: Conteos con signo y fichas en la barra
+
+    Raises:
+        ValueError: Si el ID no es válido
+    """
+    try:
+        data = base64.b64decode(position_id + "=" * (-len(position_id) % 4), validate=True)
+    except ValueError as error:
+        raise ValueError("ID de posición inválido.") from error
+    return decode_position_bytes(data)
+
+
+def encode_turn(color: str, remaining_moves: List[int]) -> str:
+    """
+    Devuelve el ID de turno: color que mueve y dados por usar.
+
+    Bits (menos significativo primero): 1 de color, 3 con la cantidad de
+    dados restantes y 3 por cada uno de los dos valores distintos posibles,
+    en el orden en que aparecen, así que una tirada (2, 5) vuelve como (2, 5).
+
+    Args:
+        color (str): Color del jugador con el turno
+        remaining_moves (List[int]): Dados por usar (0 a 4 valores)
+
+    Returns:
+        str: 3 caracteres base64
+
+    Raises:
+        ValueError: Si los dados no pueden quedar en un turno
+    """
+    values = list(dict.fromkeys(remaining_moves))
+    if len(remaining_moves) > 4 or len(values) > 2 or (len(values) == 2 and len(remaining_moves) != 2) \
+            or any(not 1 <= value <= 6 for value in values):
+        raise ValueError("Dados restantes inválidos.")
+    values += [0] * (2 - len(values))
+    value = (color == "B") | len(remaining_moves) << 1 | values[0] << 4 | values[1] << 7
+    return base64.b64encode(value.to_bytes(TURN_BYTES, "little")).decode("ascii").rstrip("=")
+
+
+def decode_turn(turn_id: str) -> Tuple[str, List[int]]:
+    """
+    Decodifica un ID de turno.
+
+    Args:
+        turn_id (str): ID producido por ``encode_turn``
+
+    Returns:
+        Tuple[str, List[int]]: Color que mueve y dados por usar
+
+    Raises:
+        ValueError: Si el ID no es válido
+    """
+    try:
+        value = int.from_bytes(base64.b64decode(turn_id + "=" * (-len(turn_id) % 4), validate=True), "little")
+    except ValueError as error:
+        raise ValueError("ID de turno inválido.") from error
+    count, first, second = value >> 1 & 7, value >> 4 & 7, value >> 7 & 7
+    if value >> 10 or count > 4 or first > 6 or second > 6 or (count and not first) \
+            or (second and count != 2) or (not count and (first or second)):
+        raise ValueError("ID de turno inválido.")
+    remaining = [first, second] if second else [first] * count
+    return ("B" if value & 1 else "W"), remaining
+
+
+def encode_game(game: BackgammonGame) -> Tuple[str, str]:
+    """
+    Devuelve los IDs de posición y de turno de una partida.
+
+    Args:
+        game (BackgammonGame): Partida
+
+    Returns:
+        Tuple[str, str]: ID de posición e ID de turno
+    """
+    return (
+        encode_position(game.get_board()),
+        encode_turn(game.get_current_player().get_color(), game.get_remaining_moves()),
+    )
+
+
+def decode_game(position_id: str, turn_id: str, game: BackgammonGame | None = None) -> BackgammonGame:
+    """
+    Carga en una partida la posición y el turno de sus IDs.
+
+    Args:
+        position_id (str): ID de posición
+        turn_id (str): ID de turno
+        game (BackgammonGame | None): Partida a reutilizar; si no se indica, se crea una
+
+    Returns:
+        BackgammonGame: Partida en la posición indicada
+
+    Raises:
+        ValueError: Si algún ID no es válido
+    """
+    counts, bar = decode_position(position_id)
+    color, remaining = decode_turn(turn_id)
+    game = game if game is not None else BackgammonGame()
+    game.setup_position(counts, bar, color, remaining)
+    return game
@@ -0,0 +1,214 @@
+"""
+Registro de partidas en texto, una línea por evento, y su reproducción.
+
+Formato de cada línea:
+    N <id de posición> <id de turno>   partida nueva o posición cargada
+    R <d1><d2>                         tirada (por ejemplo ``R 31``)
+    M <origen> <dado> <golpe>          movimiento (origen 1-24, 25 la barra; golpe 0 o 1)
+    S                                  cambio de turno
+    E <color>                          fin de la partida y color ganador
+
+Los archivos terminados en ``.gz`` se escriben y leen comprimidos. La lectura
+es perezosa: los eventos se procesan de a una línea, sin cargar el archivo.
+"""
+import gzip
+import io
+from typing import Iterator, NamedTuple, Tuple
+
+from core.board import Board
+from core.player import Player
+from core.position_id import decode_position, decode_turn, encode_game
+
+
+def open_record(path: str, mode: str = "r") -> io.TextIOBase:
+    """
+    Abre un archivo de registro en modo texto, comprimido si termina en ``.gz``.
+
+    Args:
+        path (str): Ruta del archivo
+        mode (str): "r" para leer o "a" para agregar al final
+
+    Returns:
+        io.TextIOBase: Archivo abierto
+    """
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="ascii")
+    return open(path, mode, encoding="ascii")
+
+
+class GameRecordWriter:
+    """
+    Escritor de registros de partidas que sólo agrega líneas al final.
+
+    Se conecta a ``BackgammonGame`` con su argumento ``recorder``; la partida
+    llama a los métodos ``on_*`` en cada evento. La línea de partida nueva se
+    escribe recién con el evento siguiente, así una partida reiniciada antes
+    de jugarse (por ejemplo al crear ``BackgammonGame`` y llamar luego a
+    ``start_new_game``) queda anotada una sola vez.
+
+    Attributes:
+        __stream__ (io.TextIOBase): Destino de las líneas
+        __owns_stream__ (bool): True si el escritor abrió el archivo y debe cerrarlo
+        __pending__ (str | None): Línea de partida nueva aún no escrita
+        __records__ (int): Líneas escritas
+    """
+
+    def __init__(self, target):
+        """
+        Args:
+            target (str | io.TextIOBase): Ruta del archivo (se abre para agregar)
+                o un flujo de texto ya abierto
+        """
+        self.__owns_stream__ = isinstance(target, str)
+        self.__stream__ = open_record(target, "a") if self.__owns_stream__ else target
+        self.__pending__ = None
+        self.__records__ = 0
+
+    def _write(self, line: str):
+        self._write_pending()
+        self.__stream__.write(line + "\n")
+        self.__records__ += 1
+
+    def _write_pending(self):
+        if self.__pending__ is not None:
+            self.__stream__.write(self.__pending__ + "\n")
+            self.__records__ += 1
+            self.__pending__ = None
+
+    def on_new_game(self, game):
+        """Anota el comienzo de una partida (o una posición cargada) con sus IDs."""
+        position_id, turn_id = encode_game(game)
+        self.__pending__ = f"N {position_id} {turn_id}"
+
+    def on_roll(self, values):
+        """Anota una tirada de dados."""
+        self._write(f"R {values[0]}{values[1]}")
+
+    def on_move(self, from_point: int, die_value: int, hit: bool):
+        """Anota un movimiento (origen en la numeración de ``BackgammonGame.make_move``)."""
+        self._write(f"M {from_point} {die_value} {int(hit)}")
+
+    def on_switch(self):
+        """Anota un cambio de turno."""
+        self._write("S")
+
+    def on_game_over(self, color: str):
+        """Anota el final de la partida con el color ganador."""
+        self._write(f"E {color}")
+
+    def get_record_count(self) -> int:
+        """Devuelve la cantidad de líneas escritas."""
+        return self.__records__
+
+    def flush(self):
+        """Vacía el buffer del archivo."""
+        self.__stream__.flush()
+
+    def close(self):
+        """Escribe la partida nueva pendiente y cierra el archivo si lo abrió el escritor."""
+        self._write_pending()
+        if self.__owns_stream__:
+            self.__stream__.close()
+        else:
+            self.__stream__.flush()
+
+    def __enter__(self) -> "GameRecordWriter":
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+class ReplayStep(NamedTuple):
+    """Estado de la reproducción después de aplicar un evento."""
+    game_index: int
+    event: Tuple
+    color: str
+    dice: Tuple[int, ...]
+    board: object
+
+
+def read_events(source) -> Iterator[Tuple]:
+    """
+    Lee los eventos de un registro de a uno.
+
+    Args:
+        source (str | Iterable[str]): Ruta del archivo o un iterable de líneas
+
+    Yields:
+        Tuple: ("N", id de posición, id de turno), ("R", d1, d2),
+            ("M", origen, dado, golpe), ("S",) o ("E", color)
+
+    Raises:
+        ValueError: Si alguna línea no tiene el formato esperado
+    """
+    if isinstance(source, str):
+        with open_record(source) as handle:
+            yield from read_events(handle)
+        return
+    for number, line in enumerate(source, start=1):
+        fields = line.split()
+        if not fields:
+            continue
+        kind = fields[0]
+        try:
+            if kind == "N" and len(fields) == 3:
+                yield "N", fields[1], fields[2]
+            elif kind == "R" and len(fields) == 2 and len(fields[1]) == 2:
+                yield "R", int(fields[1][0]), int(fields[1][1])
+            elif kind == "M" and len(fields) == 4:
+                yield "M", int(fields[1]), int(fields[2]), fields[3] == "1"
+            elif kind == "S" and len(fields) == 1:
+                yield ("S",)
+            elif kind == "E" and len(fields) == 2:
+                yield "E", fields[1]
+            else:
+                raise ValueError(kind)
+        except ValueError as error:
+            raise ValueError(f"Línea {number} inválida en el registro.") from error
+
+
+def replay(source, board_class=Board) -> Iterator[ReplayStep]:
+    """
+    Reproduce un registro sobre un tablero, de a un evento por vez.
+
+    El tablero devuelto en cada paso es siempre el mismo objeto, modificado
+    en el lugar; si se necesita conservar una posición, hay que copiarla.
+
+    Args:
+        source (str | Iterable[str]): Ruta del archivo o un iterable de líneas
+        board_class (type): Motor de tablero a utilizar
+
+    Yields:
+        ReplayStep: Evento aplicado, color con el turno, dados todavía sin
+            usar y tablero
+
+    Raises:
+        ValueError: Si un movimiento es inválido o su golpe no coincide con el registro
+    """
+    players = {"W": Player("Player 1", "W"), "B": Player("Player 2", "B")}
+    board = board_class()
+    game_index = -1
+    color, dice = "W", ()
+    for event in read_events(source):
+        kind = event[0]
+        if kind == "N":
+            counts, bar = decode_position(event[1])
+            color, remaining = decode_turn(event[2])
+            board.setup_position(players["W"], players["B"], counts, bar)
+            dice = tuple(remaining)
+            game_index += 1
+        elif kind == "R":
+            dice = (event[1], event[2]) * (2 if event[1] == event[2] else 1)
+        elif kind == "M":
+            _, from_point, die_value, hit = event
+            record = board.make_move(players[color], 25 if from_point == 25 else from_point - 1, die_value)
+            if record.hit != hit:
+                raise ValueError("El golpe registrado no coincide con el movimiento.")
+            if die_value in dice:
+                # Como en ``BackgammonGame.make_move``, el dado usado deja de estar disponible.
+                index = dice.index(die_value)
+                dice = dice[:index] + dice[index + 1:]
+        elif kind == "S":
+            color, dice = ("B" if color == "W" else "W"), ()
+        yield ReplayStep(game_index, event, color, dice, board)
@@ -0,0 +1,209 @@
+"""
+Bot de búsqueda expectiminimax a n plies.
+
+Para elegir una jugada de la tirada actual, cada jugada candidata se valora
+como el promedio, sobre las 21 tiradas distintas del rival (1/36 los dobles y
+2/36 el resto), de la mejor respuesta del rival; a más profundidad se alterna
+de la misma forma. Las hojas se valoran con un evaluador por lotes de
+``core.evaluation`` desde el punto de vista del jugador que decide.
+
+``ExpectiminimaxPolicy`` (en ``core.policies``) puede repartir los nodos de
+azar de la raíz (jugada candidata × tirada del rival) en un pool de procesos
+con ``init_worker`` y ``roll_task``; las posiciones viajan como IDs de
+posición de ``core.position_id``.
+"""
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from core.board import Board
+from core.dice import ROLLS
+from core.evaluation import RAW_SIZE, HeuristicEvaluator, encode_board, extract_features
+from core.moves import Play, generate_plays
+from core.player import Player
+from core.position_id import decode_position, encode_position
+
+WIN_VALUE = 1.0
+
+
+def other_color(color: str) -> str:
+    return "B" if color == "W" else "W"
+
+
+def _dice(a: int, b: int) -> List[int]:
+    return [a] * 4 if a == b else [a, b]
+
+
+def load_board(counts: List[int], bar: Tuple[int, int]) -> Tuple[Board, Dict[str, Player]]:
+    """
+    Crea un tablero propio de la búsqueda con jugadores nuevos.
+
+    Args:
+        counts (List[int]): 24 conteos con signo
+        bar (Tuple[int, int]): Fichas en la barra de Blancas y Negras
+
+    Returns:
+        Tuple[Board, Dict[str, Player]]: Tablero y jugadores por color
+    """
+    players = {"W": Player("W", "W"), "B": Player("B", "B")}
+    board = Board()
+    board.setup_position(players["W"], players["B"], counts, bar)
+    return board, players
+
+
+class Searcher:
+    """
+    Búsqueda expectiminimax desde el punto de vista de un color.
+
+    En cada nodo de decisión todas las jugadas se valoran primero a 1 ply en un
+    solo lote; sólo las ``candidates`` mejores se exploran más profundo.
+
+    Attributes:
+        __evaluator__: Objeto con método ``evaluate(features)``
+        __candidates__ (int): Jugadas exploradas más allá de 1 ply por nodo
+        __nodes__ (int): Posiciones generadas desde la última puesta a cero
+    """
+
+    def __init__(self, evaluator=None, candidates: int = 8):
+        self.__evaluator__ = evaluator if evaluator is not None else HeuristicEvaluator()
+        self.__candidates__ = candidates
+        self.__nodes__ = 0
+
+    def take_nodes(self) -> int:
+        """Devuelve los nodos contados y reinicia el contador."""
+        nodes, self.__nodes__ = self.__nodes__, 0
+        return nodes
+
+    def static_value(self, board, root: str) -> float:
+        """Valor de una posición sin mirar adelante, para el color ``root``."""
+        self.__nodes__ += 1
+        if board.get_borne_off(root) == 15:
+            return WIN_VALUE
+        if board.get_borne_off(other_color(root)) == 15:
+            return -WIN_VALUE
+        raw = np.array([encode_board(board)], dtype=np.int8).reshape(-1, RAW_SIZE)
+        return float(self.__evaluator__.evaluate(extract_features(raw, root))[0])
+
+    def play_values(self, board, player: Player, plays: List[Play], root: str) -> np.ndarray:
+        """
+        Valora a 1 ply todas las jugadas en un lote, para el color ``root``.
+
+        Args:
+            board (Board): Tablero (queda sin cambios)
+            player (Player): Jugador que mueve
+            plays (List[Play]): Jugadas legales
+            root (str): Color desde cuyo punto de vista se valora
+
+        Returns:
+            np.ndarray: Valor de cada jugada
+        """
+        color = player.get_color()
+        rows, finished = [], []
+        for play in plays:
+            records = [board.make_move(player, *move) for move in play]
+            rows.append(encode_board(board))
+            finished.append(board.get_borne_off(color) == 15)
+            for record in reversed(records):
+                board.unmake_move(player, record)
+        self.__nodes__ += len(plays)
+        raw = np.array(rows, dtype=np.int8).reshape(-1, RAW_SIZE)
+        values = self.__evaluator__.evaluate(extract_features(raw, root)).astype(np.float64)
+        values[np.array(finished)] = WIN_VALUE if color == root else -WIN_VALUE
+        return values
+
+    def best_indices(self, values: np.ndarray, maximize: bool) -> np.ndarray:
+        """Devuelve los índices de las ``candidates`` mejores jugadas para quien mueve."""
+        order = np.argsort(-values if maximize else values, kind="stable")
+        return order[:self.__candidates__]
+
+    @staticmethod
+    def restrict(values: np.ndarray, indices: np.ndarray, maximize: bool) -> np.ndarray:
+        """
+        Descarta las jugadas fuera de ``indices`` para quien mueve.
+
+        Las jugadas no exploradas quedan con su valor a 1 ply, que no es
+        comparable con el de las exploradas; se reemplazan por el peor valor
+        posible para que la elección sea sólo entre las buscadas.
+
+        Args:
+            values (np.ndarray): Valor de cada jugada
+            indices (np.ndarray): Jugadas buscadas
+            maximize (bool): Si quien mueve maximiza el valor
+
+        Returns:
+            np.ndarray: Copia de ``values`` con ±inf fuera de ``indices``
+        """
+        restricted = np.full_like(values, -np.inf if maximize else np.inf)
+        restricted[indices] = values[indices]
+        return restricted
+
+    def roll_value(self, board, players: Dict[str, Player], to_move: str, roll: Tuple[int, int],
+                   depth: int, root: str) -> float:
+        """
+        Valor para ``root`` si ``to_move`` saca ``roll`` y juega su mejor jugada.
+
+        Args:
+            board (Board): Tablero (queda sin cambios)
+            players (Dict[str, Player]): Jugadores del tablero por color
+            to_move (str): Color que tira
+            roll (Tuple[int, int]): Tirada
+            depth (int): Plies restantes, contando este (al menos 1)
+            root (str): Color desde cuyo punto de vista se valora
+
+        Returns:
+            float: Valor de la posición tras la mejor jugada
+        """
+        player = players[to_move]
+        plays = generate_plays(board, player, _dice(*roll))
+        if not plays:
+            return self.chance_value(board, players, other_color(to_move), depth - 1, root)
+        values = self.play_values(board, player, plays, root)
+        maximize = to_move == root
+        if depth > 1:
+            searched = self.best_indices(values, maximize)
+            for index in searched:
+                records = [board.make_move(player, *move) for move in plays[index]]
+                if board.get_borne_off(to_move) < 15:
+                    values[index] = self.chance_value(board, players, other_color(to_move), depth - 1, root)
+                for record in reversed(records):
+                    board.unmake_move(player, record)
+            values = self.restrict(values, searched, maximize)
+        return float(values.max() if maximize else values.min())
+
+    def chance_value(self, board, players: Dict[str, Player], to_move: str, depth: int, root: str) -> float:
+        """
+        Valor esperado para ``root`` antes de que ``to_move`` tire los dados.
+
+        Args:
+            board (Board): Tablero (queda sin cambios)
+            players (Dict[str, Player]): Jugadores del tablero por color
+            to_move (str): Color que va a tirar
+            depth (int): Plies restantes (0 evalúa la posición directamente)
+            root (str): Color desde cuyo punto de vista se valora
+
+        Returns:
+            float: Promedio ponderado sobre las 21 tiradas
+        """
+        if depth <= 0 or board.get_borne_off("W") == 15 or board.get_borne_off("B") == 15:
+            return self.static_value(board, root)
+        return sum(
+            probability * self.roll_value(board, players, to_move, (a, b), depth, root)
+            for a, b, probability in ROLLS
+        )
+
+
+_worker_searcher: Searcher | None = None
+
+
+def init_worker(evaluator, candidates: int):
+    """Crea el buscador propio de cada proceso del pool."""
+    global _worker_searcher
+    _worker_searcher = Searcher(evaluator, candidates)
+
+
+def roll_task(task: Tuple[str, str, int, int, int, str]) -> Tuple[float, int]:
+    """Valora una rama de azar (posición, tirada del rival) dentro de un proceso."""
+    position_id, to_move, a, b, depth, root = task
+    board, players = load_board(*decode_position(position_id))
+    value = _worker_searcher.roll_value(board, players, to_move, (a, b), depth, root)
+    return value, _worker_searcher.take_nodes()
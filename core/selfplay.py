@@ -0,0 +1,185 @@
+"""
+Partidas automáticas entre bots, sin interfaz y repartidas en varios procesos.
+
+Uso:
+    python -m core.selfplay --games 100000 --workers 8 --seed 42 --white pipcount --black random
+"""
+import argparse
+import time
+from multiprocessing import Pool
+from typing import Dict, Iterator, List, Tuple
+
+from core.dice import Dice
+from core.game import BackgammonGame, game_points
+from core.moves import LegalMoveCache
+from core.policies import POLICIES, Policy
+
+MAX_TURNS = 2000
+DICE_BLOCK_SIZE = 256
+
+
+def derive_seed(seed: int, index: int) -> int:
+    """
+    Deriva la semilla de una partida a partir de la semilla global y su índice.
+
+    Args:
+        seed (int): Semilla de la corrida
+        index (int): Número de partida
+
+    Returns:
+        int: Semilla de 64 bits propia de esa partida
+    """
+    return (seed * 0x9E3779B97F4A7C15 + index * 0xBF58476D1CE4E5B9 + 1) % (1 << 64)
+
+
+def play_game(white: Policy, black: Policy, seed: int, max_turns: int = MAX_TURNS,
+              move_cache: LegalMoveCache | None = None, recorder=None) -> Dict[str, int | str | None]:
+    """
+    Juega una partida completa entre dos políticas.
+
+    Args:
+        white (Policy): Política de las Blancas
+        black (Policy): Política de las Negras
+        seed (int): Semilla de los dados de la partida
+        max_turns (int): Límite de turnos de seguridad
+        move_cache (LegalMoveCache | None): Caché de jugadas, compartible entre partidas
+        recorder (GameRecordWriter | None): Registro donde anotar la partida
+
+    Returns:
+        Dict: Ganador ("W", "B" o None), puntos, turnos y movimientos jugados
+    """
+    game = BackgammonGame(dice=Dice(seed=seed, block_size=DICE_BLOCK_SIZE), move_cache=move_cache,
+                          recorder=recorder)
+    game.start_new_game("Bot W", "Bot B")
+    policies = {"W": white, "B": black}
+    turns = moves = 0
+    winner = None
+    while turns < max_turns:
+        game.roll_dice()
+        turns += 1
+        moves += len(game.play_turn(policies[game.get_current_player().get_color()]))
+        winner = game.check_winner()
+        if winner:
+            break
+        game.switch_player()
+    color = winner.get_color() if winner else None
+    return {
+        "winner": color,
+        "points": game.get_game_points(),
+        "turns": turns,
+        "moves": moves,
+    }
+
+
+def _play_chunk(task: Tuple[str, str, int, int, int, int]) -> List[Dict]:
+    """Juega un bloque de partidas consecutivas dentro de un proceso."""
+    white_name, black_name, seed, start, stop, max_turns = task
+    results = []
+    move_cache = LegalMoveCache()
+    for index in range(start, stop):
+        game_seed = derive_seed(seed, index)
+        white = POLICIES[white_name](game_seed)
+        black = POLICIES[black_name](game_seed + 1)
+        results.append(play_game(white, black, game_seed, max_turns, move_cache))
+    return results
+
+
+def _chunks(games: int, chunk_size: int) -> Iterator[Tuple[int, int]]:
+    for start in range(0, games, chunk_size):
+        yield start, min(start + chunk_size, games)
+
+
+def run_selfplay(games: int, workers: int = 1, seed: int = 0, white: str = "pipcount",
+                 black: str = "random", chunk_size: int = 50, max_turns: int = MAX_TURNS) -> Dict[str, float]:
+    """
+    Juega muchas partidas entre bots y devuelve estadísticas agregadas.
+
+    Cada partida usa una semilla derivada de ``seed`` y de su índice, por lo
+    que el resultado no depende de la cantidad de procesos.
+
+    Args:
+        games (int): Cantidad de partidas
+        workers (int): Procesos a utilizar (1 juega en el proceso actual)
+        seed (int): Semilla de la corrida
+        white (str): Nombre de la política de las Blancas (ver ``POLICIES``)
+        black (str): Nombre de la política de las Negras
+        chunk_size (int): Partidas por tarea enviada a cada proceso
+        max_turns (int): Límite de turnos por partida
+
+    Returns:
+        Dict[str, float]: Partidas, movimientos, tasas y velocidades
+
+    Raises:
+        ValueError: Si alguna política no existe
+    """
+    for name in (white, black):
+        if name not in POLICIES:
+            raise ValueError(f"Política desconocida: {name}")
+    tasks = [(white, black, seed, start, stop, max_turns) for start, stop in _chunks(games, chunk_size)]
+    totals = {"games": 0, "moves": 0, "turns": 0, "white_wins": 0, "black_wins": 0,
+              "unfinished": 0, "gammons": 0, "backgammons": 0, "white_points": 0, "black_points": 0}
+
+    start_time = time.perf_counter()
+    if workers <= 1:
+        _aggregate(totals, map(_play_chunk, tasks))
+    else:
+        with Pool(workers) as pool:
+            _aggregate(totals, pool.imap_unordered(_play_chunk, tasks))
+    elapsed = time.perf_counter() - start_time
+
+    played = max(totals["games"], 1)
+    return {
+        **totals,
+        "seconds": elapsed,
+        "games_per_sec": totals["games"] / elapsed if elapsed else 0.0,
+        "moves_per_sec": totals["moves"] / elapsed if elapsed else 0.0,
+        "avg_turns": totals["turns"] / played,
+        "avg_moves": totals["moves"] / played,
+        "white_win_rate": totals["white_wins"] / played,
+        "gammon_rate": totals["gammons"] / played,
+        "backgammon_rate": totals["backgammons"] / played,
+    }
+
+
+def _aggregate(totals: Dict[str, int], chunk_results):
+    """Suma los resultados de cada bloque de partidas."""
+    for results in chunk_results:
+        for result in results:
+            totals["games"] += 1
+            totals["moves"] += result["moves"]
+            totals["turns"] += result["turns"]
+            if result["winner"] is None:
+                totals["unfinished"] += 1
+                continue
+            totals["white_wins" if result["winner"] == "W" else "black_wins"] += 1
+            totals["white_points" if result["winner"] == "W" else "black_points"] += result["points"]
+            totals["gammons"] += result["points"] == 2
+            totals["backgammons"] += result["points"] == 3
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Partidas automáticas entre bots.")
+    parser.add_argument("--games", type=int, default=1000)
+    parser.add_argument("--workers", type=int, default=1)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--white", choices=sorted(POLICIES), default="pipcount")
+    parser.add_argument("--black", choices=sorted(POLICIES), default="random")
+    parser.add_argument("--chunk-size", type=int, default=50)
+    parser.add_argument("--max-turns", type=int, default=MAX_TURNS)
+    args = parser.parse_args()
+
+    stats = run_selfplay(args.games, args.workers, args.seed, args.white, args.black,
+                         args.chunk_size, args.max_turns)
+    print(f"Partidas:           {stats['games']} en {stats['seconds']:.2f} s")
+    print(f"Partidas/s:         {stats['games_per_sec']:.1f}")
+    print(f"Movimientos/s:      {stats['moves_per_sec']:.0f}")
+    print(f"Turnos promedio:    {stats['avg_turns']:.1f} ({stats['avg_moves']:.1f} movimientos)")
+    print(f"Victorias Blancas:  {stats['white_win_rate']:.1%} ({args.white} vs {args.black})")
+    print(f"Gammons:            {stats['gammon_rate']:.1%}")
+    print(f"Backgammons:        {stats['backgammon_rate']:.1%}")
+    if stats["unfinished"]:
+        print(f"Sin terminar:       {stats['unfinished']}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,180 @@
+import random
+from typing import Dict, List
+
+MAX_CHECKERS = 32
+
+
+def _random_keys(rng: random.Random, *shape: int):
+    """Genera claves aleatorias de 64 bits con la forma pedida."""
+    if len(shape) == 1:
+        return [rng.getrandbits(64) for _ in range(shape[0])]
+    return [_random_keys(rng, *shape[1:]) for _ in range(shape[0])]
+
+
+_rng = random.Random(0x8ACC6A33)
+POINT_KEYS: Dict[str, List[List[int]]] = dict(zip("WB", _random_keys(_rng, 2, 24, MAX_CHECKERS + 1)))
+BAR_KEYS: Dict[str, List[int]] = dict(zip("WB", _random_keys(_rng, 2, MAX_CHECKERS + 1)))
+OFF_KEYS: Dict[str, List[int]] = dict(zip("WB", _random_keys(_rng, 2, MAX_CHECKERS + 1)))
+SIDE_KEY: int = _rng.getrandbits(64)
+del _rng
+
+
+def compute_hash(board) -> int:
+    """
+    Calcula desde cero el hash Zobrist de un tablero.
+
+    Cada ficha aporta la clave de su ordinal dentro del punto, la barra o las
+    fichas retiradas, por lo que el resultado coincide con el hash que
+    ``Board`` mantiene de forma incremental.
+
+    Args:
+        board (Board): Tablero a identificar
+
+    Returns:
+        int: Hash de 64 bits de la posición (sin turno)
+    """
+    value = 0
+    for point, count in enumerate(board.get_counts()):
+        color = "W" if count > 0 else "B"
+        for ordinal in range(1, abs(count) + 1):
+            value ^= POINT_KEYS[color][point][ordinal]
+    for color in ("W", "B"):
+        for ordinal in range(1, board.get_bar(color) + 1):
+            value ^= BAR_KEYS[color][ordinal]
+        for ordinal in range(1, board.get_borne_off(color) + 1):
+            value ^= OFF_KEYS[color][ordinal]
+    return value
+
+
+def side_to_move_key(color: str) -> int:
+    """
+    Devuelve la clave a combinar con el hash del tablero según quién mueve.
+
+    Args:
+        color (str): Color del jugador con el turno ("W" o "B")
+
+    Returns:
+        int: 0 si mueven las Blancas, ``SIDE_KEY`` si mueven las Negras
+    """
+    return SIDE_KEY if color == "B" else 0
+
+
+class TranspositionTable:
+    """
+    Tabla de transposición acotada indexada por hash Zobrist.
+
+    Cada índice tiene dos entradas: una que prefiere la mayor profundidad (o la
+    búsqueda más reciente) y otra que siempre se reemplaza. Al desplazar una
+    entrada de la primera, pasa a la segunda, por lo que la tabla nunca supera
+    ``2 * size`` entradas.
+
+    Attributes:
+        __mask__ (int): Máscara para obtener el índice desde el hash
+        __keys__ (List[int | None]): Hash completo guardado en cada entrada
+        __depths__ (List[int]): Profundidad con la que se calculó cada valor
+        __ages__ (List[int]): Generación de búsqueda de cada entrada
+        __values__ (List[object]): Valores guardados
+        __generation__ (int): Generación de búsqueda actual
+        __stats__ (Dict[str, int]): Contadores de aciertos, fallos y reemplazos
+    """
+
+    def __init__(self, size: int = 1 << 16):
+        """
+        Crea una tabla vacía.
+
+        Args:
+            size (int): Cantidad de índices; se redondea a la potencia de 2 inferior
+
+        Raises:
+            ValueError: Si el tamaño no es positivo
+        """
+        if size < 1:
+            raise ValueError("El tamaño de la tabla debe ser positivo.")
+        size = 1 << (size.bit_length() - 1)
+        self.__mask__ = size - 1
+        self.__keys__: List[int | None] = [None] * (2 * size)
+        self.__depths__: List[int] = [0] * (2 * size)
+        self.__ages__: List[int] = [0] * (2 * size)
+        self.__values__: List[object] = [None] * (2 * size)
+        self.__generation__ = 0
+        self.__stats__: Dict[str, int] = {"hits": 0, "misses": 0, "stores": 0, "replacements": 0}
+
+    def new_search(self):
+        """Comienza una nueva generación: las entradas viejas pasan a ser reemplazables."""
+        self.__generation__ += 1
+
+    def _write(self, slot: int, key: int, value, depth: int):
+        """Escribe una entrada; sobrescribir otra clave en la segunda entrada la descarta."""
+        if slot & 1 and self.__keys__[slot] is not None and self.__keys__[slot] != key:
+            self.__stats__["replacements"] += 1
+        self.__keys__[slot] = key
+        self.__values__[slot] = value
+        self.__depths__[slot] = depth
+        self.__ages__[slot] = self.__generation__
+
+    def store(self, key: int, value, depth: int = 0):
+        """
+        Guarda un valor asociado a un hash.
+
+        Args:
+            key (int): Hash Zobrist de la posición
+            value (object): Valor a guardar
+            depth (int): Profundidad de búsqueda con la que se obtuvo el valor
+        """
+        self.__stats__["stores"] += 1
+        preferred = (key & self.__mask__) << 1
+        keys = self.__keys__
+        if keys[preferred] == key:
+            if depth >= self.__depths__[preferred]:
+                self._write(preferred, key, value, depth)
+            else:
+                self._write(preferred + 1, key, value, depth)
+            return
+        if (keys[preferred] is None or depth >= self.__depths__[preferred]
+                or self.__ages__[preferred] != self.__generation__):
+            if keys[preferred] is not None:
+                self._write(preferred + 1, keys[preferred], self.__values__[preferred], self.__depths__[preferred])
+                self.__ages__[preferred + 1] = self.__ages__[preferred]
+            self._write(preferred, key, value, depth)
+        else:
+            self._write(preferred + 1, key, value, depth)
+
+    def probe(self, key: int, min_depth: int = 0):
+        """
+        Busca el valor guardado para un hash.
+
+        Args:
+            key (int): Hash Zobrist de la posición
+            min_depth (int): Profundidad mínima aceptable del valor guardado
+
+        Returns:
+            object | None: Valor guardado o None si no hay uno válido
+        """
+        slot = (key & self.__mask__) << 1
+        for candidate in (slot, slot + 1):
+            if self.__keys__[candidate] == key and self.__depths__[candidate] >= min_depth:
+                self.__stats__["hits"] += 1
+                return self.__values__[candidate]
+        self.__stats__["misses"] += 1
+        return None
+
+    def clear(self):
+        """Vacía la tabla y reinicia las estadísticas."""
+        size = len(self.__keys__)
+        self.__keys__ = [None] * size
+        self.__values__ = [None] * size
+        self.__depths__ = [0] * size
+        self.__ages__ = [0] * size
+        self.__stats__ = {"hits": 0, "misses": 0, "stores": 0, "replacements": 0}
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Devuelve las estadísticas de uso de la tabla.
+
+        Returns:
+            Dict[str, int]: Aciertos, fallos, guardados y reemplazos
+        """
+        return dict(self.__stats__)
+
+    def __len__(self) -> int:
+        return sum(1 for key in self.__keys__ if key is not None)
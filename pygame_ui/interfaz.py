@@ -1,173 +1,49 @@
+import argparse
 import pygame
 import sys
 from core.game import BackgammonGame
-"""constantes""" 
-WIDTH, HEIGHT = 1000, 700 
-MARGIN = 40 
-POINT_WIDTH = 60 
-POINT_HEIGHT = 200 
-CHECKER_RADIUS = 25 
-"""colores""" 
-BG = (210, 180, 140) 
-BROWN_DARK = (139, 69, 19) 
-BROWN_LIGHT = (205, 133, 63) 
-WHITE = (255, 255, 255) 
-BLACK = (30, 30, 30) 
-RED = (220, 20, 60) 
+from core.instrumentation import EngineProfiler
+from core.policies import ExpectiminimaxPolicy
+from pygame_ui.renderer import (
+    BAR_B, BAR_W, BG, BLACK, HEIGHT, OFF_B, OFF_W, WIDTH, BoardRenderer, HitGrid, board_origin, destination,
+)
 
-def render_board(screen, game, font):
-    """Dibuja el tablero y retorna hitmap para clicks"""
-    screen.fill(BG)
-    board = game.get_board()
-    hitmap = {}
-    for visual_idx in range(12):
-        board_idx = 11 - visual_idx
-        x = MARGIN + visual_idx * POINT_WIDTH
-        if visual_idx >= 6:
-            x += 40
-        y_base = HEIGHT - MARGIN - POINT_HEIGHT
-        draw_point(screen, x, y_base, board_idx, board, False, hitmap)
-        num_text_bottom = font.render(str(12 - visual_idx), True, BLACK)
-        screen.blit(num_text_bottom, (x + POINT_WIDTH//2 - 10, HEIGHT - MARGIN + 5))
-    for visual_idx in range(12):
-        board_idx = 12 + visual_idx
-        x = MARGIN + visual_idx * POINT_WIDTH
-        if visual_idx >= 6:
-            x += 40
-        draw_point(screen, x, MARGIN, board_idx, board, True, hitmap)
-        num_text = font.render(str(13 + visual_idx), True, BLACK)
-        screen.blit(num_text, (x + POINT_WIDTH//2 - 10, MARGIN - 25))
-    bar_x = MARGIN + 6 * POINT_WIDTH
-    pygame.draw.rect(screen, BROWN_DARK, (bar_x, MARGIN, 40, HEIGHT - 2*MARGIN))
-    white_bar = board.get_bar("W")
-    black_bar = board.get_bar("B")
-    if white_bar > 0:
-        for i in range(white_bar):
-            cx = bar_x + 20
-            cy = HEIGHT - MARGIN - 30 - i * (CHECKER_RADIUS * 2 + 3)
-            pygame.draw.circle(screen, WHITE, (cx, cy), CHECKER_RADIUS)
-            pygame.draw.circle(screen, BLACK, (cx, cy), CHECKER_RADIUS, 2)
-        hitmap[24] = pygame.Rect(bar_x, HEIGHT // 2, 40, HEIGHT // 2 - MARGIN)
-    if black_bar > 0:
-        for i in range(black_bar):
-            cx = bar_x + 20
-            cy = MARGIN + 30 + i * (CHECKER_RADIUS * 2 + 3)
-            pygame.draw.circle(screen, BLACK, (cx, cy), CHECKER_RADIUS)
-            pygame.draw.circle(screen, WHITE, (cx, cy), CHECKER_RADIUS, 2)
-        hitmap[24] = pygame.Rect(bar_x, MARGIN, 40, HEIGHT // 2 - MARGIN)
-    bear_off_x = MARGIN + 12 * POINT_WIDTH + 40
-    bear_off_width = 100
-    pygame.draw.rect(screen, (100, 100, 100), (bear_off_x, HEIGHT // 2, bear_off_width, HEIGHT // 2 - MARGIN), 2)
-    bear_off_text = font.render("OFF", True, BLACK)
-    screen.blit(bear_off_text, (bear_off_x + 35, HEIGHT - MARGIN - 20))
-    white_off = board.get_borne_off("W")
-    if white_off > 0:
-        off_text = font.render(f"W:{white_off}", True, WHITE)
-        screen.blit(off_text, (bear_off_x + 35, HEIGHT // 2 + 10))
-    hitmap[25] = pygame.Rect(bear_off_x, HEIGHT // 2, bear_off_width, HEIGHT // 2 - MARGIN)
-    pygame.draw.rect(screen, (100, 100, 100), (bear_off_x, MARGIN, bear_off_width, HEIGHT // 2 - MARGIN), 2)
-    screen.blit(bear_off_text, (bear_off_x + 35, MARGIN + 5))
-    black_off = board.get_borne_off("B")
-    if black_off > 0:
-        off_text = font.render(f"B:{black_off}", True, BLACK)
-        screen.blit(off_text, (bear_off_x + 35, HEIGHT // 2 - 30))
-    hitmap[26] = pygame.Rect(bear_off_x, MARGIN, bear_off_width, HEIGHT // 2 - MARGIN)
-    draw_info(screen, game, font)
-    return hitmap
 
-def draw_point(screen, x, y_base, board_idx, board, is_top, hitmap):
-    """Dibuja un triángulo y las fichas"""
-    visual_pos = board_idx + 1
-    color = BROWN_DARK if ((visual_pos - 1) // 6 + visual_pos) % 2 == 0 else BROWN_LIGHT
-    if is_top:
-        points = [(x, y_base),
-                  (x + POINT_WIDTH, y_base),
-                  (x + POINT_WIDTH//2, y_base + POINT_HEIGHT)]
-    else:
-        points = [(x, y_base + POINT_HEIGHT),
-                  (x + POINT_WIDTH, y_base + POINT_HEIGHT),
-                  (x + POINT_WIDTH//2, y_base)]
-    pygame.draw.polygon(screen, color, points)
-    pygame.draw.polygon(screen, BLACK, points, 2)
-    hitmap[board_idx] = pygame.Rect(x, y_base if not is_top else y_base, POINT_WIDTH, POINT_HEIGHT)
-    point = board.get_point(board_idx)
-    if point:
-        checker_color = WHITE if point[0].get_color() == "W" else BLACK
-        border_color = BLACK if point[0].get_color() == "W" else WHITE
-        count = len(point)
-        for i in range(count):
-            cx = x + POINT_WIDTH // 2
-            if is_top:
-                cy = y_base + 20 + i * (CHECKER_RADIUS * 2 + 5)
-            else:
-                cy = y_base + POINT_HEIGHT - 20 - i * (CHECKER_RADIUS * 2 + 5)
-            pygame.draw.circle(screen, checker_color, (cx, cy), CHECKER_RADIUS)
-            pygame.draw.circle(screen, border_color, (cx, cy), CHECKER_RADIUS, 2)
-
-def draw_info(screen, game, font):
-    """Dibuja información del juego en el lado derecho"""
-    info_x = MARGIN + 12 * POINT_WIDTH + 150
-    small_font = pygame.font.SysFont(None, 18)
-    player = game.get_current_player()
-    info = f"Turno: {player.get_name()}"
-    text = small_font.render(info, True, BLACK)
-    screen.blit(text, (info_x, HEIGHT // 2 - 60))
-    color_text = f"({player.get_color()})"
-    text = small_font.render(color_text, True, BLACK)
-    screen.blit(text, (info_x, HEIGHT // 2 - 40))
-    moves = game.get_remaining_moves()
-    if moves:
-        dice_text = f"Dados: {moves}"
-        text = small_font.render(dice_text, True, BLACK)
-        screen.blit(text, (info_x, HEIGHT // 2 - 15))
-        board = game.get_board()
-        color = player.get_color()
-        if board.get_bar(color) > 0:
-            tiny_font = pygame.font.SysFont(None, 16)
-            warn1 = tiny_font.render("¡FICHA EN", True, RED)
-            warn2 = tiny_font.render("EL BAR!", True, RED)
-            warn3 = tiny_font.render("Debes", True, RED)
-            warn4 = tiny_font.render("sacarla", True, RED)
-            warn5 = tiny_font.render("primero", True, RED)
-            screen.blit(warn1, (info_x, HEIGHT // 2 + 15))
-            screen.blit(warn2, (info_x, HEIGHT // 2 + 30))
-            screen.blit(warn3, (info_x, HEIGHT // 2 + 45))
-            screen.blit(warn4, (info_x, HEIGHT // 2 + 60))
-            screen.blit(warn5, (info_x, HEIGHT // 2 + 75))
-    else:
-        text = small_font.render("Presiona", True, RED)
-        screen.blit(text, (info_x, HEIGHT // 2 - 10))
-        text2 = small_font.render("ESPACIO", True, RED)
-        screen.blit(text2, (info_x, HEIGHT // 2 + 5))
-        text3 = small_font.render("para tirar", True, RED)
-        screen.blit(text3, (info_x, HEIGHT // 2 + 20))
-
-def hit_test(hitmap, pos):
-    """Detecta qué punto fue clickeado"""
-    for idx, rect in hitmap.items():
-        if rect.collidepoint(pos):
-            return idx
-    return None
+def legal_destinations(game, target):
+    """Devuelve los destinos legales de las fichas en ``target`` para el jugador en turno"""
+    if target is None or target in (OFF_W, OFF_B):
+        return frozenset()
+    color = game.get_current_player().get_color()
+    from_point = 25 if target in (BAR_W, BAR_B) else target + 1
+    return frozenset(destination(color, from_point, die_value)
+                     for _, die_value in game.iter_legal_moves(from_point))
 
 def main():
+    parser = argparse.ArgumentParser(description="Backgammon con pygame")
+    parser.add_argument("--profile-output", default="pygame.pstats", help="Archivo de cProfile al detener el perfilado con F9")
+    parser.add_argument("--bot", type=int, metavar="PLIES", help="Las Negras juegan con el bot expectiminimax a PLIES de profundidad")
+    args = parser.parse_args()
+    bot = ExpectiminimaxPolicy(depth=args.bot) if args.bot else None
     pygame.init()
     pygame.display.set_caption("Backgammon")
-    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.RESIZABLE)
     clock = pygame.time.Clock()
-    font = pygame.font.SysFont(None, 24)
+    origin = board_origin(screen.get_size())
+    renderer = BoardRenderer(screen, origin)
+    grid = HitGrid(origin)
     names = []
-    for prompt in ["Jugador 1 (Blancas)", "Jugador 2 (Negras)"]:
+    for prompt in ["Jugador 1 (Blancas)"] + ([] if bot else ["Jugador 2 (Negras)"]):
         name = ""
         entering = True
         while entering:
             screen.fill(BG)
-            title_font = pygame.font.SysFont(None, 36)
-            title = title_font.render(prompt, True, BLACK)
-            screen.blit(title, title.get_rect(center=(WIDTH//2, HEIGHT//2 - 50)))
-            name_text = title_font.render(name + "_", True, BLACK)
-            screen.blit(name_text, name_text.get_rect(center=(WIDTH//2, HEIGHT//2)))
-            instr = font.render("Presiona ENTER para continuar", True, BLACK)
-            screen.blit(instr, instr.get_rect(center=(WIDTH//2, HEIGHT//2 + 60)))
+            center_x, center_y = screen.get_width() // 2, screen.get_height() // 2
+            title = renderer.get_text(prompt, 36, BLACK)
+            screen.blit(title, title.get_rect(center=(center_x, center_y - 50)))
+            name_text = renderer.get_text(name + "_", 36, BLACK)
+            screen.blit(name_text, name_text.get_rect(center=(center_x, center_y)))
+            instr = renderer.get_text("Presiona ENTER para continuar", 24, BLACK)
+            screen.blit(instr, instr.get_rect(center=(center_x, center_y + 60)))
             pygame.display.flip()
             for e in pygame.event.get():
                 if e.type == pygame.QUIT:
@@ -181,20 +57,47 @@ def main():
                     elif e.unicode.isprintable() and len(name) < 20:
                         name += e.unicode
         names.append(name if name else f"Player {len(names) + 1}")
+    if bot:
+        names.append(f"Bot ({args.bot} plies)")
     game = BackgammonGame()
     game.start_new_game(names[0], names[1])
-    hitmap = {}
+    renderer.invalidate()
     selected = None
+    hovered = None
+    highlights = frozenset()
+    highlights_key = None
     no_moves_message = None
     message_timer = 0
+    profiler = None
     running = True
     while running:
         for e in pygame.event.get():
             if e.type == pygame.QUIT:
                 running = False
+            elif e.type == pygame.VIDEORESIZE:
+                # La grilla de clicks sólo depende del diseño: se rearma al cambiar la ventana.
+                screen = pygame.display.set_mode((max(e.w, WIDTH), max(e.h, HEIGHT)), pygame.RESIZABLE)
+                origin = board_origin(screen.get_size())
+                renderer = BoardRenderer(screen, origin)
+                grid = HitGrid(origin)
+            elif e.type == pygame.MOUSEMOTION:
+                hovered = grid.locate(e.pos)
+            elif bot and game.get_current_player().get_color() == "B":
+                continue
             elif e.type == pygame.KEYDOWN:
                 if e.key in (pygame.K_ESCAPE, pygame.K_q):
                     running = False
+                elif e.key == pygame.K_F9:
+                    if profiler is None:
+                        profiler = EngineProfiler(profile=True)
+                        profiler.enable()
+                        print("Perfilado del motor activado (F9 para detener)")
+                    else:
+                        profiler.disable()
+                        print(profiler.report())
+                        profiler.dump_profile(args.profile_output)
+                        print(f"Estadísticas de cProfile guardadas en {args.profile_output}")
+                        profiler = None
                 elif e.key == pygame.K_SPACE and not game.get_remaining_moves():
                     game.roll_dice()
                     if not game.has_valid_moves():
@@ -204,16 +107,21 @@ def main():
                         game.switch_player()
             elif e.type == pygame.MOUSEBUTTONDOWN and e.button == 1:
                 if game.get_remaining_moves():
-                    idx = hit_test(hitmap, e.pos)
+                    idx = grid.locate(e.pos)
                     if idx is not None:
-                        from_pos = 25 if idx == 24 else idx + 1
+                        from_pos = 25 if idx in (BAR_W, BAR_B) else idx + 1
                         if selected is None:
+                            if idx in (OFF_W, OFF_B):
+                                continue
+                            if next(game.iter_legal_moves(from_pos), None) is None:
+                                print(f"Sin movimientos desde {from_pos}")
+                                continue
                             selected = from_pos
                             print(f"Origen: {from_pos}" + (" (BAR)" if from_pos == 25 else ""))
                         else:
-                            if idx == 24:
+                            if idx in (BAR_W, BAR_B):
                                 to_pos = 25
-                            elif idx == 25 or idx == 26:
+                            elif idx in (OFF_W, OFF_B):
                                 to_pos = 0
                             else:
                                 to_pos = idx + 1
@@ -224,17 +132,14 @@ def main():
                                 else:
                                     die_value = 25 - to_pos
                             elif to_pos == 0:
-                                current_player = game.get_current_player()
-                                remaining_moves = game.get_remaining_moves()
-                                success = False
-                                for die_value in remaining_moves:
-                                    if game.make_move(selected, die_value):
-                                        print(f"Movimiento: {selected} -> OFF (dado {die_value})")
-                                        if not game.get_remaining_moves():
-                                            game.switch_player()
-                                        success = True
-                                        break
-                                if not success:
+                                color = game.get_current_player().get_color()
+                                die_value = next((die for _, die in game.iter_legal_moves(selected)
+                                                  if destination(color, selected, die) in (OFF_W, OFF_B)), None)
+                                if die_value is not None and game.make_move(selected, die_value):
+                                    print(f"Movimiento: {selected} -> OFF (dado {die_value})")
+                                    if not game.get_remaining_moves():
+                                        game.switch_player()
+                                else:
                                     print("Movimiento inválido")
                                 selected = None
                                 continue
@@ -248,25 +153,27 @@ def main():
                             else:
                                 print("Movimiento inválido")
                             selected = None
-        hitmap = render_board(screen, game, font)
+        if bot and running and game.get_current_player().get_color() == "B" and not game.check_winner():
+            game.roll_dice()
+            play = game.play_turn(bot)
+            print(f"Bot: {play if play else 'sin movimientos'}")
+            if not game.check_winner():
+                game.switch_player()
+        source = hovered if selected is None else (BAR_W if selected == 25 else selected - 1)
+        key = (source, game.get_current_player().get_color(), tuple(game.get_remaining_moves()))
+        if key != highlights_key:
+            # Los destinos sólo se recalculan cuando cambia el origen, el turno o los dados.
+            highlights_key = key
+            highlights = legal_destinations(game, source) if key[2] else frozenset()
+        dirty = renderer.draw(game, no_moves_message if message_timer > 0 else None, highlights)
         if message_timer > 0:
             message_timer -= 1
-            title_font = pygame.font.SysFont(None, 36)
-            text = title_font.render(no_moves_message, True, RED)
-            text_rect = text.get_rect(center=(WIDTH//2, HEIGHT//2))
-            bg_rect = text_rect.inflate(40, 20)
-            bg_surface = pygame.Surface((bg_rect.width, bg_rect.height))
-            bg_surface.fill(WHITE)
-            bg_surface.set_alpha(220)
-            screen.blit(bg_surface, bg_rect)
-            screen.blit(text, text_rect)
-        winner = game.check_winner()
-        if winner:
-            title_font = pygame.font.SysFont(None, 48)
-            text = title_font.render(f"¡{winner.get_name()} GANÓ!", True, RED)
-            screen.blit(text, text.get_rect(center=(WIDTH//2, HEIGHT//2)))
-        pygame.display.flip()
+        if dirty:
+            pygame.display.update(dirty)
         clock.tick(60)
+    if profiler is not None:
+        profiler.disable()
+        print(profiler.report())
     pygame.quit()
     sys.exit()
 
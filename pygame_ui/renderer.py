@@ -0,0 +1,377 @@
+"""
+Dibujo del tablero con capas precalculadas y actualización por regiones.
+
+``BoardRenderer`` dibuja una sola vez la capa estática (fondo, triángulos,
+barra, bandejas y números), crea las fuentes una sola vez, guarda los textos
+ya renderizados y pega las fichas desde sprites. En cada cuadro compara el
+estado de cada región (cada punto, cada mitad de la barra, cada bandeja y el
+panel de información) con el del cuadro anterior y sólo redibuja las que
+cambiaron, devolviendo sus rectángulos para ``pygame.display.update``.
+
+``HitGrid`` resuelve en O(1) qué punto, mitad de la barra o bandeja hay bajo
+el mouse, con una tabla por columna de píxeles armada a partir de las
+constantes de diseño; sólo se reconstruye al cambiar el tamaño de la ventana.
+"""
+from typing import Dict, Iterable, List, Tuple
+
+import pygame
+
+WIDTH, HEIGHT = 1000, 700
+MARGIN = 40
+POINT_WIDTH = 60
+POINT_HEIGHT = 200
+CHECKER_RADIUS = 25
+BAR_WIDTH = 40
+BEAR_OFF_WIDTH = 100
+CHECKER_SPACING = CHECKER_RADIUS * 2 + 5
+BAR_SPACING = CHECKER_RADIUS * 2 + 3
+BG = (210, 180, 140)
+BROWN_DARK = (139, 69, 19)
+BROWN_LIGHT = (205, 133, 63)
+WHITE = (255, 255, 255)
+BLACK = (30, 30, 30)
+RED = (220, 20, 60)
+GREY = (100, 100, 100)
+HIGHLIGHT = (255, 215, 0, 110)
+
+# Destinos de ``HitGrid.locate`` además de los puntos 0-23.
+BAR_W = 24
+OFF_W = 25
+OFF_B = 26
+BAR_B = 27
+
+BAR_X = MARGIN + 6 * POINT_WIDTH
+BEAR_OFF_X = MARGIN + 12 * POINT_WIDTH + BAR_WIDTH
+INFO_X = MARGIN + 12 * POINT_WIDTH + 150
+HALF_HEIGHT = HEIGHT // 2 - MARGIN
+STACK_START = 20
+TEXT_CACHE_SIZE = 256
+
+
+def point_column(board_idx: int) -> Tuple[int, bool]:
+    """
+    Devuelve la posición de un punto en pantalla.
+
+    Args:
+        board_idx (int): Índice del punto en el tablero (0-23)
+
+    Returns:
+        Tuple[int, bool]: Coordenada x del borde izquierdo y si está en la mitad de arriba
+    """
+    is_top = board_idx >= 12
+    visual_idx = board_idx - 12 if is_top else 11 - board_idx
+    x = MARGIN + visual_idx * POINT_WIDTH + (BAR_WIDTH if visual_idx >= 6 else 0)
+    return x, is_top
+
+
+def point_region(board_idx: int) -> pygame.Rect:
+    """
+    Devuelve el rectángulo de la mitad del tablero ocupada por un punto y sus fichas.
+
+    Incluye los píxeles en los que la primera ficha sobresale del borde del tablero.
+    """
+    x, is_top = point_column(board_idx)
+    overhang = CHECKER_RADIUS - STACK_START
+    return pygame.Rect(x, MARGIN - overhang if is_top else HEIGHT // 2, POINT_WIDTH, HALF_HEIGHT + overhang)
+
+
+def _stack_spacing(count: int, room: int, spacing: int) -> float:
+    """Separación entre fichas apiladas para que ``count`` entren en ``room`` píxeles."""
+    if count <= 1:
+        return spacing
+    return min(spacing, (room - 2 * CHECKER_RADIUS) / (count - 1))
+
+
+def board_origin(window_size: Tuple[int, int]) -> Tuple[int, int]:
+    """Devuelve la esquina del tablero para centrarlo en una ventana de ese tamaño."""
+    return max((window_size[0] - WIDTH) // 2, 0), max((window_size[1] - HEIGHT) // 2, 0)
+
+
+class HitGrid:
+    """
+    Traduce posiciones del mouse a destinos del tablero en tiempo constante.
+
+    Cada columna de píxeles del tablero se asocia de antemano a una columna de
+    puntos, a la barra o a las bandejas; la fila se decide comparando con la
+    mitad de la altura.
+
+    Attributes:
+        __origin__ (Tuple[int, int]): Esquina del tablero en la ventana
+        __columns__ (List[Tuple[int, int] | None]): Por columna de píxeles, el
+            destino de arriba y el de abajo, o None si no hay nada
+    """
+
+    def __init__(self, origin: Tuple[int, int] = (0, 0)):
+        self.__origin__ = origin
+        self.__columns__: List[Tuple[int, int] | None] = [None] * WIDTH
+        for board_idx in range(12, 24):
+            x, _ = point_column(board_idx)
+            for px in range(x, x + POINT_WIDTH):
+                self.__columns__[px] = (board_idx, 23 - board_idx)
+        for px in range(BAR_X, BAR_X + BAR_WIDTH):
+            self.__columns__[px] = (BAR_B, BAR_W)
+        for px in range(BEAR_OFF_X, BEAR_OFF_X + BEAR_OFF_WIDTH):
+            self.__columns__[px] = (OFF_B, OFF_W)
+
+    def locate(self, pos: Tuple[int, int]) -> int | None:
+        """
+        Devuelve el destino bajo una posición de la ventana.
+
+        Args:
+            pos (Tuple[int, int]): Posición del mouse en la ventana
+
+        Returns:
+            int | None: Punto (0-23), ``BAR_W``, ``BAR_B``, ``OFF_W``, ``OFF_B``
+                o None fuera del tablero
+        """
+        x, y = pos[0] - self.__origin__[0], pos[1] - self.__origin__[1]
+        if not (0 <= x < WIDTH and MARGIN <= y < HEIGHT - MARGIN):
+            return None
+        column = self.__columns__[x]
+        if column is None:
+            return None
+        return column[0] if y < HEIGHT // 2 else column[1]
+
+
+def destination(color: str, from_point: int, die_value: int) -> int:
+    """
+    Devuelve el destino de un movimiento en la numeración de ``HitGrid``.
+
+    Args:
+        color (str): Color que mueve
+        from_point (int): Origen en la numeración de ``BackgammonGame.make_move``
+            (1-24, 25 para la barra)
+        die_value (int): Dado usado
+
+    Returns:
+        int: Punto de llegada (0-23) u ``OFF_W``/``OFF_B`` si la ficha sale
+    """
+    start = (-1 if color == "W" else 24) if from_point == 25 else from_point - 1
+    target = start + die_value if color == "W" else start - die_value
+    if target > 23:
+        return OFF_W
+    if target < 0:
+        return OFF_B
+    return target
+
+
+class BoardRenderer:
+    """
+    Dibuja una partida sobre una superficie actualizando sólo lo que cambió.
+
+    Attributes:
+        __screen__ (pygame.Surface): Superficie de destino
+        __origin__ (Tuple[int, int]): Esquina del tablero en la superficie
+        __canvas__ (pygame.Surface): Parte de la superficie ocupada por el tablero
+        __static__ (pygame.Surface): Capa estática del tablero
+        __fonts__ (Dict[int, pygame.font.Font]): Fuentes por tamaño
+        __texts__ (Dict[Tuple, pygame.Surface]): Textos ya renderizados
+        __sprites__ (Dict[str, pygame.Surface]): Fichas por color
+        __highlights__ (Dict[str, pygame.Surface]): Resaltado semitransparente por región
+        __regions__ (Dict[str, pygame.Rect]): Regiones actualizables por nombre
+        __drawn__ (Dict[str, Tuple] | None): Estado dibujado de cada región; None fuerza
+            a redibujar todo
+    """
+
+    def __init__(self, screen: pygame.Surface, origin: Tuple[int, int] = (0, 0)):
+        """
+        Args:
+            screen (pygame.Surface): Superficie de destino (la ventana)
+            origin (Tuple[int, int]): Esquina del tablero (ver ``board_origin``)
+        """
+        self.__screen__ = screen
+        self.__origin__ = origin
+        self.__canvas__ = screen.subsurface(pygame.Rect(origin, (WIDTH, HEIGHT)))
+        self.__fonts__: Dict[int, pygame.font.Font] = {}
+        self.__texts__: Dict[Tuple, pygame.Surface] = {}
+        self.__sprites__ = {"W": self._checker_sprite(WHITE, BLACK), "B": self._checker_sprite(BLACK, WHITE)}
+        self.__regions__: Dict[str, pygame.Rect] = {
+            **{f"point{idx}": point_region(idx) for idx in range(24)},
+            "barW": pygame.Rect(BAR_X, HEIGHT // 2, BAR_WIDTH, HALF_HEIGHT),
+            "barB": pygame.Rect(BAR_X, MARGIN, BAR_WIDTH, HALF_HEIGHT),
+            "offW": pygame.Rect(BEAR_OFF_X, HEIGHT // 2, BEAR_OFF_WIDTH, HALF_HEIGHT),
+            "offB": pygame.Rect(BEAR_OFF_X, MARGIN, BEAR_OFF_WIDTH, HALF_HEIGHT),
+            "info": pygame.Rect(INFO_X, 0, WIDTH - INFO_X, HEIGHT),
+        }
+        self.__highlights__ = {}
+        for name, region in self.__regions__.items():
+            surface = pygame.Surface(region.size, pygame.SRCALPHA)
+            surface.fill(HIGHLIGHT)
+            self.__highlights__[name] = surface
+        self.__static__ = self._render_static()
+        self.__drawn__ = None
+
+    def get_font(self, size: int) -> pygame.font.Font:
+        """Devuelve la fuente por defecto del tamaño indicado, creándola una sola vez."""
+        if size not in self.__fonts__:
+            self.__fonts__[size] = pygame.font.SysFont(None, size)
+        return self.__fonts__[size]
+
+    def get_text(self, text: str, size: int, color: Tuple[int, int, int]) -> pygame.Surface:
+        """Devuelve un texto renderizado, reutilizando el de cuadros anteriores."""
+        key = (text, size, color)
+        surface = self.__texts__.get(key)
+        if surface is None:
+            if len(self.__texts__) >= TEXT_CACHE_SIZE:
+                self.__texts__.clear()
+            surface = self.__texts__[key] = self.get_font(size).render(text, True, color)
+        return surface
+
+    def get_regions(self) -> Dict[str, pygame.Rect]:
+        """Devuelve las regiones actualizables por nombre."""
+        return dict(self.__regions__)
+
+    def invalidate(self):
+        """Fuerza a redibujar toda la pantalla en el próximo cuadro."""
+        self.__drawn__ = None
+
+    @staticmethod
+    def _checker_sprite(fill: Tuple[int, int, int], border: Tuple[int, int, int]) -> pygame.Surface:
+        sprite = pygame.Surface((CHECKER_RADIUS * 2, CHECKER_RADIUS * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, fill, (CHECKER_RADIUS, CHECKER_RADIUS), CHECKER_RADIUS)
+        pygame.draw.circle(sprite, border, (CHECKER_RADIUS, CHECKER_RADIUS), CHECKER_RADIUS, 2)
+        return sprite
+
+    def _render_static(self) -> pygame.Surface:
+        """Dibuja el fondo, los triángulos, la barra, las bandejas y los números."""
+        surface = pygame.Surface((WIDTH, HEIGHT))
+        surface.fill(BG)
+        for board_idx in range(24):
+            x, is_top = point_column(board_idx)
+            visual_pos = board_idx + 1
+            color = BROWN_DARK if ((visual_pos - 1) // 6 + visual_pos) % 2 == 0 else BROWN_LIGHT
+            if is_top:
+                points = [(x, MARGIN), (x + POINT_WIDTH, MARGIN), (x + POINT_WIDTH // 2, MARGIN + POINT_HEIGHT)]
+                label_y = MARGIN - 25
+            else:
+                base = HEIGHT - MARGIN
+                points = [(x, base), (x + POINT_WIDTH, base), (x + POINT_WIDTH // 2, base - POINT_HEIGHT)]
+                label_y = HEIGHT - MARGIN + 5
+            pygame.draw.polygon(surface, color, points)
+            pygame.draw.polygon(surface, BLACK, points, 2)
+            surface.blit(self.get_text(str(visual_pos), 24, BLACK), (x + POINT_WIDTH // 2 - 10, label_y))
+        pygame.draw.rect(surface, BROWN_DARK, (BAR_X, MARGIN, BAR_WIDTH, HEIGHT - 2 * MARGIN))
+        off_label = self.get_text("OFF", 24, BLACK)
+        pygame.draw.rect(surface, GREY, self.__regions__["offW"], 2)
+        surface.blit(off_label, (BEAR_OFF_X + 35, HEIGHT - MARGIN - 20))
+        pygame.draw.rect(surface, GREY, self.__regions__["offB"], 2)
+        surface.blit(off_label, (BEAR_OFF_X + 35, MARGIN + 5))
+        return surface
+
+    def _region_states(self, game, message: str | None, highlights: Iterable[int]) -> Dict[str, Tuple]:
+        """Devuelve, por región, los datos que determinan cómo se ve."""
+        board = game.get_board()
+        counts = board.get_counts()
+        player = game.get_current_player()
+        color = player.get_color()
+        moves = tuple(game.get_remaining_moves())
+        winner = game.check_winner()
+        lit = set(highlights)
+        return {
+            **{f"point{idx}": (counts[idx], idx in lit) for idx in range(24)},
+            "barW": (board.get_bar("W"), BAR_W in lit),
+            "barB": (board.get_bar("B"), BAR_B in lit),
+            "offW": (board.get_borne_off("W"), OFF_W in lit),
+            "offB": (board.get_borne_off("B"), OFF_B in lit),
+            "info": (player.get_name(), color, moves, bool(moves) and board.get_bar(color) > 0),
+            "overlay": (message, winner.get_name() if winner else None),
+        }
+
+    def draw(self, game, message: str | None = None, highlights: Iterable[int] = ()) -> List[pygame.Rect]:
+        """
+        Dibuja en pantalla las regiones que cambiaron desde el cuadro anterior.
+
+        Args:
+            game (BackgammonGame): Partida a mostrar
+            message (str | None): Aviso a superponer en el centro de la pantalla
+            highlights (Iterable[int]): Destinos a resaltar, en la numeración de ``HitGrid``
+
+        Returns:
+            List[pygame.Rect]: Rectángulos modificados, para ``pygame.display.update``;
+                vacía si no cambió nada
+        """
+        states = self._region_states(game, message, highlights)
+        drawn = self.__drawn__
+        changed = [name for name in self.__regions__ if drawn is None or drawn[name] != states[name]]
+        overlay = states["overlay"] != (None, None)
+        if drawn is None or drawn["overlay"] != states["overlay"] or (overlay and changed):
+            # El aviso semitransparente se superpone a varias regiones: se redibuja todo.
+            changed = list(self.__regions__)
+            self.__screen__.fill(BG)
+            self.__canvas__.blit(self.__static__, (0, 0))
+            dirty = [self.__screen__.get_rect()]
+        else:
+            dirty = [self.__canvas__.blit(self.__static__, self.__regions__[name], self.__regions__[name])
+                     .move(self.__origin__) for name in changed]
+        for name in changed:
+            self._draw_region(name, states[name])
+        if overlay and dirty:
+            self._draw_overlay(*states["overlay"])
+        self.__drawn__ = states
+        return dirty
+
+    def _draw_region(self, name: str, state: Tuple):
+        if len(state) == 2 and state[1]:
+            self.__canvas__.blit(self.__highlights__[name], self.__regions__[name])
+        if name.startswith("point"):
+            self._draw_point(int(name[5:]), state[0])
+        elif name.startswith("bar"):
+            self._draw_bar(name[3], state[0])
+        elif name.startswith("off"):
+            self._draw_off(name[3], state[0])
+        else:
+            self._draw_info(*state)
+
+    def _draw_point(self, board_idx: int, count: int):
+        if not count:
+            return
+        sprite = self.__sprites__["W" if count > 0 else "B"]
+        count = abs(count)
+        x, is_top = point_column(board_idx)
+        spacing = _stack_spacing(count, HALF_HEIGHT - STACK_START, CHECKER_SPACING)
+        for i in range(count):
+            offset = STACK_START + i * spacing - CHECKER_RADIUS
+            y = MARGIN + offset if is_top else HEIGHT - MARGIN - offset - 2 * CHECKER_RADIUS
+            self.__canvas__.blit(sprite, (x + POINT_WIDTH // 2 - CHECKER_RADIUS, round(y)))
+
+    def _draw_bar(self, color: str, count: int):
+        region = self.__regions__[f"bar{color}"]
+        spacing = _stack_spacing(count, region.height - 5, BAR_SPACING)
+        for i in range(count):
+            offset = 30 + i * spacing - CHECKER_RADIUS
+            y = region.bottom - offset - 2 * CHECKER_RADIUS if color == "W" else region.top + offset
+            self.__canvas__.blit(self.__sprites__[color], (BAR_X + BAR_WIDTH // 2 - CHECKER_RADIUS, round(y)))
+
+    def _draw_off(self, color: str, count: int):
+        if count:
+            text = self.get_text(f"{color}:{count}", 24, WHITE if color == "W" else BLACK)
+            self.__canvas__.blit(text, (BEAR_OFF_X + 35, HEIGHT // 2 + 10 if color == "W" else HEIGHT // 2 - 30))
+
+    def _draw_info(self, name: str, color: str, moves: Tuple[int, ...], bar_warning: bool):
+        screen = self.__canvas__
+        screen.blit(self.get_text(f"Turno: {name}", 18, BLACK), (INFO_X, HEIGHT // 2 - 60))
+        screen.blit(self.get_text(f"({color})", 18, BLACK), (INFO_X, HEIGHT // 2 - 40))
+        if moves:
+            screen.blit(self.get_text(f"Dados: {list(moves)}", 18, BLACK), (INFO_X, HEIGHT // 2 - 15))
+            if bar_warning:
+                for i, line in enumerate(["¡FICHA EN", "EL BAR!", "Debes", "sacarla", "primero"]):
+                    screen.blit(self.get_text(line, 16, RED), (INFO_X, HEIGHT // 2 + 15 + i * 15))
+        else:
+            for i, line in enumerate(["Presiona", "ESPACIO", "para tirar"]):
+                screen.blit(self.get_text(line, 18, RED), (INFO_X, HEIGHT // 2 - 10 + i * 15))
+
+    def _draw_overlay(self, message: str | None, winner: str | None):
+        """Dibuja el aviso y el ganador sobre el tablero."""
+        screen = self.__canvas__
+        if message:
+            text = self.get_text(message, 36, RED)
+            text_rect = text.get_rect(center=(WIDTH // 2, HEIGHT // 2))
+            background = text_rect.inflate(40, 20)
+            overlay = pygame.Surface(background.size)
+            overlay.fill(WHITE)
+            overlay.set_alpha(220)
+            screen.blit(overlay, background)
+            screen.blit(text, text_rect)
+        if winner:
+            text = self.get_text(f"¡{winner} GANÓ!", 48, RED)
+            screen.blit(text, text.get_rect(center=(WIDTH // 2, HEIGHT // 2)))
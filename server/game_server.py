@@ -0,0 +1,324 @@
+"""
+Servidor TCP con asyncio que aloja muchas partidas a la vez.
+
+Protocolo: cada línea que envía el cliente es un objeto JSON con un comando, y
+el servidor responde con una línea JSON por comando, en el mismo orden. Si la
+solicitud trae ``"id"``, la respuesta lo repite.
+
+    {"cmd": "new"}                                 crea una partida; acepta "seed",
+                                                   o "position" y "turn" para cargar IDs
+    {"cmd": "state", "game": "g1"}                 estado de la partida
+    {"cmd": "roll", "game": "g1"}                  lanza los dados
+    {"cmd": "moves", "game": "g1"}                 movimientos legales [[origen, dado], ...]
+    {"cmd": "move", "game": "g1", "from": 13, "die": 5}
+                                                   mueve (origen 1-24, 25 la barra)
+    {"cmd": "pass", "game": "g1"}                  pasa el turno si no hay movimientos
+    {"cmd": "close", "game": "g1"}                 termina la partida
+    {"cmd": "stats"}                               métricas del servidor
+
+Las respuestas tienen ``"ok": true`` y sus datos, u ``"ok": false`` y
+``"error"``. Al usar el último dado del turno (o si tras mover ya no quedan
+movimientos posibles) el turno pasa al rival automáticamente.
+
+Los comandos de una misma partida se ejecutan de a uno con un candado por
+partida; las partidas sin actividad durante ``idle_timeout`` segundos se
+descartan.
+
+Uso:
+    python -m server.game_server --port 8765 --idle-timeout 300
+"""
+import argparse
+import asyncio
+import json
+import time
+from typing import Callable, Dict
+
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.moves import LegalMoveCache
+from core.position_id import decode_game, encode_game, encode_turn
+
+DEFAULT_PORT = 8765
+DEFAULT_IDLE_TIMEOUT = 300.0
+DEFAULT_MAX_GAMES = 10000
+
+
+class GameSession:
+    """
+    Una partida alojada en el servidor.
+
+    Attributes:
+        __game__ (BackgammonGame): Partida
+        __lock__ (asyncio.Lock): Candado que serializa sus comandos
+        __last_used__ (float): Momento del último comando, según el reloj del servidor
+    """
+
+    def __init__(self, game: BackgammonGame, now: float):
+        self.__game__ = game
+        self.__lock__ = asyncio.Lock()
+        self.__last_used__ = now
+
+    def get_game(self) -> BackgammonGame:
+        """Devuelve la partida."""
+        return self.__game__
+
+    def get_lock(self) -> asyncio.Lock:
+        """Devuelve el candado de la partida."""
+        return self.__lock__
+
+    def get_last_used(self) -> float:
+        """Devuelve el momento del último comando."""
+        return self.__last_used__
+
+    def touch(self, now: float):
+        """Registra actividad en la partida."""
+        self.__last_used__ = now
+
+
+def game_state(game_id: str, game: BackgammonGame) -> Dict:
+    """
+    Devuelve el estado de una partida para enviarlo al cliente.
+
+    Args:
+        game_id (str): Identificador de la partida en el servidor
+        game (BackgammonGame): Partida
+
+    Returns:
+        Dict: IDs de posición y turno, color que mueve, dados restantes y ganador
+    """
+    position_id, turn_id = encode_game(game)
+    winner = game.check_winner()
+    return {
+        "game": game_id,
+        "position": position_id,
+        "turn": turn_id,
+        "color": game.get_current_player().get_color(),
+        "dice": list(game.get_remaining_moves()),
+        "winner": winner.get_color() if winner else None,
+    }
+
+
+class GameServer:
+    """
+    Servidor de partidas con protocolo de líneas JSON.
+
+    Attributes:
+        __sessions__ (Dict[str, GameSession]): Partidas alojadas por identificador
+        __move_cache__ (LegalMoveCache): Caché de movimientos compartida por todas las partidas
+        __idle_timeout__ (float): Segundos sin actividad tras los que se descarta una partida
+        __max_games__ (int): Partidas simultáneas permitidas
+        __clock__ (Callable[[], float]): Reloj monotónico
+        __next_id__ (int): Número de la próxima partida
+        __stats__ (Dict[str, int]): Contadores de partidas, comandos y movimientos
+        __server__ (asyncio.Server | None): Servidor TCP, si está escuchando
+        __sweeper__ (asyncio.Task | None): Tarea que descarta partidas inactivas
+    """
+
+    def __init__(self, idle_timeout: float = DEFAULT_IDLE_TIMEOUT, max_games: int = DEFAULT_MAX_GAMES,
+                 clock: Callable[[], float] = time.monotonic):
+        """
+        Args:
+            idle_timeout (float): Segundos sin actividad tras los que se descarta una partida
+            max_games (int): Partidas simultáneas permitidas
+            clock (Callable[[], float]): Reloj a usar (por ejemplo uno falso en los tests)
+        """
+        self.__sessions__: Dict[str, GameSession] = {}
+        self.__move_cache__ = LegalMoveCache()
+        self.__idle_timeout__ = idle_timeout
+        self.__max_games__ = max_games
+        self.__clock__ = clock
+        self.__next_id__ = 1
+        self.__stats__ = {"created": 0, "evicted": 0, "closed": 0, "commands": 0, "moves": 0, "errors": 0}
+        self.__server__ = None
+        self.__sweeper__ = None
+
+    def get_game_count(self) -> int:
+        """Devuelve la cantidad de partidas alojadas."""
+        return len(self.__sessions__)
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Devuelve las métricas del servidor.
+
+        Returns:
+            Dict[str, int]: Partidas alojadas, creadas, descartadas y cerradas;
+                comandos, movimientos y errores
+        """
+        return {"games": len(self.__sessions__), **self.__stats__}
+
+    def evict_idle(self) -> int:
+        """
+        Descarta las partidas sin actividad durante más de ``idle_timeout`` segundos.
+
+        Las partidas con un comando en curso se conservan.
+
+        Returns:
+            int: Partidas descartadas
+        """
+        limit = self.__clock__() - self.__idle_timeout__
+        idle = [game_id for game_id, session in self.__sessions__.items()
+                if session.get_last_used() < limit and not session.get_lock().locked()]
+        for game_id in idle:
+            del self.__sessions__[game_id]
+        self.__stats__["evicted"] += len(idle)
+        return len(idle)
+
+    async def handle_command(self, request: Dict) -> Dict:
+        """
+        Ejecuta un comando del protocolo.
+
+        Args:
+            request (Dict): Solicitud decodificada
+
+        Returns:
+            Dict: Respuesta a enviar
+        """
+        self.__stats__["commands"] += 1
+        try:
+            response = await self._dispatch(request)
+        except (KeyError, TypeError, ValueError) as error:
+            self.__stats__["errors"] += 1
+            response = {"ok": False, "error": str(error) if isinstance(error, ValueError) else "Solicitud inválida."}
+        if isinstance(request, dict) and "id" in request:
+            response["id"] = request["id"]
+        return response
+
+    async def _dispatch(self, request: Dict) -> Dict:
+        command = request["cmd"]
+        if command == "new":
+            return self._new_game(request)
+        if command == "stats":
+            return {"ok": True, **self.get_stats()}
+        game_id = request["game"]
+        session = self.__sessions__.get(game_id)
+        if session is None:
+            raise ValueError("Partida inexistente.")
+        async with session.get_lock():
+            session.touch(self.__clock__())
+            return self._game_command(command, game_id, session.get_game(), request)
+
+    def _new_game(self, request: Dict) -> Dict:
+        if len(self.__sessions__) >= self.__max_games__:
+            self.evict_idle()
+            if len(self.__sessions__) >= self.__max_games__:
+                raise ValueError("El servidor alcanzó el máximo de partidas.")
+        seed = request.get("seed")
+        game = BackgammonGame(dice=Dice(seed=seed) if seed is not None else None, move_cache=self.__move_cache__)
+        if "position" in request:
+            decode_game(request["position"], request.get("turn", encode_turn("W", [])), game)
+        game_id = f"g{self.__next_id__}"
+        self.__next_id__ += 1
+        self.__sessions__[game_id] = GameSession(game, self.__clock__())
+        self.__stats__["created"] += 1
+        return {"ok": True, **game_state(game_id, game)}
+
+    def _game_command(self, command: str, game_id: str, game: BackgammonGame, request: Dict) -> Dict:
+        if command == "state":
+            return {"ok": True, **game_state(game_id, game)}
+        if command == "moves":
+            return {"ok": True, "moves": [list(move) for move in game.get_legal_moves()]}
+        if command == "close":
+            del self.__sessions__[game_id]
+            self.__stats__["closed"] += 1
+            return {"ok": True}
+        if game.check_winner():
+            raise ValueError("La partida terminó.")
+        if command == "roll":
+            if game.get_remaining_moves():
+                raise ValueError("Quedan dados por usar.")
+            game.roll_dice()
+        elif command == "move":
+            from_point, die_value = int(request["from"]), int(request["die"])
+            if not 1 <= from_point <= 25 or not 1 <= die_value <= 6:
+                raise ValueError("Origen o dado fuera de rango.")
+            if not game.make_move(from_point, die_value):
+                raise ValueError("Movimiento inválido.")
+            self.__stats__["moves"] += 1
+            if not game.check_winner() and not game.has_valid_moves():
+                game.switch_player()
+        elif command == "pass":
+            if not game.get_remaining_moves():
+                raise ValueError("Primero hay que tirar los dados.")
+            if game.has_valid_moves():
+                raise ValueError("Hay movimientos posibles.")
+            game.switch_player()
+        else:
+            raise ValueError(f"Comando desconocido: {command}")
+        return {"ok": True, **game_state(game_id, game)}
+
+    async def _handle_client(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        """Atiende una conexión: una respuesta por cada línea recibida."""
+        try:
+            while line := await reader.readline():
+                try:
+                    request = json.loads(line)
+                except ValueError:
+                    self.__stats__["errors"] += 1
+                    response = {"ok": False, "error": "JSON inválido."}
+                else:
+                    response = await self.handle_command(request)
+                writer.write(json.dumps(response).encode() + b"\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+    async def _sweep(self):
+        """Descarta partidas inactivas periódicamente."""
+        while True:
+            await asyncio.sleep(max(self.__idle_timeout__ / 4, 0.01))
+            self.evict_idle()
+
+    async def start(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT) -> int:
+        """
+        Empieza a escuchar conexiones.
+
+        Args:
+            host (str): Dirección donde escuchar
+            port (int): Puerto (0 elige uno libre)
+
+        Returns:
+            int: Puerto en el que escucha
+        """
+        self.__server__ = await asyncio.start_server(self._handle_client, host, port)
+        self.__sweeper__ = asyncio.create_task(self._sweep())
+        return self.__server__.sockets[0].getsockname()[1]
+
+    async def close(self):
+        """Deja de escuchar y detiene la tarea de limpieza."""
+        if self.__sweeper__ is not None:
+            self.__sweeper__.cancel()
+            self.__sweeper__ = None
+        if self.__server__ is not None:
+            self.__server__.close()
+            await self.__server__.wait_closed()
+            self.__server__ = None
+
+
+async def serve(host: str, port: int, idle_timeout: float, max_games: int):
+    """Ejecuta el servidor hasta que se interrumpa el proceso."""
+    server = GameServer(idle_timeout, max_games)
+    port = await server.start(host, port)
+    print(f"Servidor de Backgammon escuchando en {host}:{port}")
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor de partidas de Backgammon.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--idle-timeout", type=float, default=DEFAULT_IDLE_TIMEOUT)
+    parser.add_argument("--max-games", type=int, default=DEFAULT_MAX_GAMES)
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args.host, args.port, args.idle_timeout, args.max_games))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
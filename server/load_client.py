@@ -0,0 +1,161 @@
+"""
+Generador de carga para el servidor de partidas.
+
+Abre varias conexiones y en cada una juega partidas completas con movimientos
+legales al azar, enviando un comando por vez y midiendo la latencia de cada
+respuesta. Al terminar informa movimientos y comandos por segundo sostenidos
+y las latencias p50 y p99.
+
+Uso:
+    python -m server.load_client --port 8765 --clients 200 --duration 10
+    python -m server.load_client --spawn --clients 200 --duration 10
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from typing import Dict, List
+
+from server.game_server import DEFAULT_PORT, GameServer
+
+
+class _Connection:
+    """Conexión del cliente que registra la latencia de cada comando."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, latencies: List[float]):
+        self.__reader__ = reader
+        self.__writer__ = writer
+        self.__latencies__ = latencies
+
+    async def send(self, request: Dict) -> Dict:
+        start = time.perf_counter()
+        self.__writer__.write(json.dumps(request).encode() + b"\n")
+        await self.__writer__.drain()
+        line = await self.__reader__.readline()
+        self.__latencies__.append(time.perf_counter() - start)
+        if not line:
+            raise ConnectionError("El servidor cerró la conexión.")
+        return json.loads(line)
+
+    async def close(self):
+        self.__writer__.close()
+        await self.__writer__.wait_closed()
+
+
+async def _play_games(host: str, port: int, deadline: float, rng: random.Random,
+                      latencies: List[float], totals: Dict[str, int]):
+    """Juega partidas con movimientos al azar en una conexión hasta ``deadline``."""
+    reader, writer = await asyncio.open_connection(host, port)
+    connection = _Connection(reader, writer, latencies)
+    try:
+        while time.perf_counter() < deadline:
+            state = await connection.send({"cmd": "new", "seed": rng.getrandbits(32)})
+            game_id = state["game"]
+            while state["winner"] is None and time.perf_counter() < deadline:
+                state = await connection.send({"cmd": "roll", "game": game_id})
+                color = state["color"]
+                while state["color"] == color and state["winner"] is None:
+                    moves = (await connection.send({"cmd": "moves", "game": game_id}))["moves"]
+                    if not moves:
+                        state = await connection.send({"cmd": "pass", "game": game_id})
+                        break
+                    from_point, die = rng.choice(moves)
+                    state = await connection.send({"cmd": "move", "game": game_id, "from": from_point, "die": die})
+                    if not state["ok"]:
+                        raise RuntimeError(state["error"])
+                    totals["moves"] += 1
+            totals["games"] += state["winner"] is not None
+            await connection.send({"cmd": "close", "game": game_id})
+    finally:
+        await connection.close()
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    Devuelve el percentil de una lista de valores (el más cercano por rango).
+
+    Args:
+        values (List[float]): Valores
+        fraction (float): Percentil entre 0 y 1
+
+    Returns:
+        float: Valor del percentil, o 0 si la lista está vacía
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(int(fraction * len(ordered)), len(ordered) - 1)]
+
+
+async def run_load(host: str = "127.0.0.1", port: int = DEFAULT_PORT, clients: int = 100,
+                   duration: float = 10.0, seed: int = 0) -> Dict[str, float]:
+    """
+    Genera carga sobre un servidor durante un tiempo.
+
+    Args:
+        host (str): Dirección del servidor
+        port (int): Puerto del servidor
+        clients (int): Conexiones simultáneas, cada una con una partida en curso
+        duration (float): Segundos de carga
+        seed (int): Semilla de las elecciones al azar
+
+    Returns:
+        Dict[str, float]: Comandos, movimientos y partidas terminadas, sus tasas
+            por segundo y las latencias p50 y p99 en milisegundos
+    """
+    latencies: List[float] = []
+    totals = {"moves": 0, "games": 0}
+    start = time.perf_counter()
+    deadline = start + duration
+    await asyncio.gather(*(
+        _play_games(host, port, deadline, random.Random(seed * 1000003 + index), latencies, totals)
+        for index in range(clients)
+    ))
+    elapsed = time.perf_counter() - start
+    return {
+        "clients": clients,
+        "seconds": elapsed,
+        "commands": len(latencies),
+        "moves": totals["moves"],
+        "games": totals["games"],
+        "commands_per_sec": len(latencies) / elapsed,
+        "moves_per_sec": totals["moves"] / elapsed,
+        "p50_ms": percentile(latencies, 0.50) * 1000,
+        "p99_ms": percentile(latencies, 0.99) * 1000,
+    }
+
+
+async def _spawn_and_load(clients: int, duration: float, seed: int) -> Dict[str, float]:
+    """Levanta un servidor en el mismo proceso y genera carga sobre él."""
+    server = GameServer()
+    port = await server.start("127.0.0.1", 0)
+    try:
+        return await run_load("127.0.0.1", port, clients, duration, seed)
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generador de carga para el servidor de partidas.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=DEFAULT_PORT)
+    parser.add_argument("--clients", type=int, default=100)
+    parser.add_argument("--duration", type=float, default=10.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--spawn", action="store_true", help="Levanta el servidor en este mismo proceso")
+    args = parser.parse_args()
+
+    if args.spawn:
+        stats = asyncio.run(_spawn_and_load(args.clients, args.duration, args.seed))
+    else:
+        stats = asyncio.run(run_load(args.host, args.port, args.clients, args.duration, args.seed))
+    print(f"Conexiones:         {stats['clients']} durante {stats['seconds']:.1f} s")
+    print(f"Comandos/s:         {stats['commands_per_sec']:.0f} ({stats['commands']} comandos)")
+    print(f"Movimientos/s:      {stats['moves_per_sec']:.0f} ({stats['moves']} movimientos)")
+    print(f"Partidas:           {stats['games']} terminadas")
+    print(f"Latencia p50/p99:   {stats['p50_ms']:.2f} / {stats['p99_ms']:.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import json
+
+import pytest
+
+from core.analysis import analyze_position, read_chunks, run_analysis
+from core.evaluation import HeuristicEvaluator
+from core.position_id import encode_position, encode_turn
+from core.search import load_board
+
+OPENING = "4HPwATDgc/ABMA"
+
+
+def _race_id():
+    counts = [0] * 24
+    counts[22], counts[23], counts[0] = 1, 1, -5
+    return encode_position(load_board(counts, (0, 0))[0])
+
+
+@pytest.fixture
+def positions(tmp_path):
+    """Fixture con un archivo de 25 líneas: posiciones, comentarios, una línea vacía y una inválida."""
+    lines = ["# posiciones de prueba"]
+    for a in range(1, 7):
+        for b in range(a, 7):
+            if len(lines) < 20:
+                lines.append(f"{OPENING} {encode_turn('W', [a] * 4 if a == b else [a, b])}")
+    lines += ["", f"{_race_id()} {encode_turn('W', [2, 1])}", "no-es-un-id X", OPENING,
+              f"{OPENING} {encode_turn('B', [])}"]
+    path = tmp_path / "posiciones.txt"
+    path.write_text("\n".join(lines) + "\n", encoding="ascii")
+    return path
+
+
+def test_analyze_position_orders_plays():
+    """Verifica que las jugadas salen ordenadas por valor y que la mejor coincide con el evaluador."""
+    result = analyze_position(OPENING, encode_turn("W", [3, 1]), HeuristicEvaluator(), top=4)
+    assert result["method"] == "evaluator" and result["color"] == "W" and result["dice"] == [3, 1]
+    values = [play["value"] for play in result["plays"]]
+    assert len(values) == 4 and values == sorted(values, reverse=True)
+    assert result["legal"] >= 4
+
+
+def test_analyze_position_with_doubles_left():
+    """Verifica que un turno con dos dados dobles por usar se analiza con dos movimientos."""
+    result = analyze_position(OPENING, encode_turn("W", [3, 3]), HeuristicEvaluator())
+    assert result["dice"] == [3, 3]
+    assert result["plays"] and all(len(play["moves"]) == 2 for play in result["plays"])
+
+
+def test_analyze_race_uses_race_values():
+    """Verifica que en una carrera se usa ``core.race`` y que retirar todo vale 1."""
+    result = analyze_position(_race_id(), encode_turn("W", [2, 1]), HeuristicEvaluator())
+    assert result["method"] == "race"
+    assert result["plays"][0]["value"] == 1.0
+
+
+def test_read_chunks_numbers_lines():
+    """Verifica el número de la primera línea de cada bloque."""
+    chunks = list(read_chunks(iter(["a", "b", "c", "d", "e"]), 2))
+    assert chunks == [(1, ["a", "b"]), (3, ["c", "d"]), (5, ["e"])]
+
+
+def test_run_analysis_writes_one_line_per_position(positions, tmp_path):
+    """Verifica la salida en orden, los errores por línea y las estadísticas."""
+    output = tmp_path / "salida.jsonl"
+    stats = run_analysis(str(positions), str(output), chunk_size=4)
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert stats["positions"] == len(records) == 23
+    assert stats["errors"] == 3
+    assert [record["line"] for record in records] == sorted(record["line"] for record in records)
+    assert records[0]["line"] == 2 and records[0]["plays"]
+    assert sum("error" in record for record in records) == 3
+    assert stats["positions_per_sec"] > 0
+
+
+def test_parallel_matches_sequential(positions, tmp_path):
+    """Verifica que con varios procesos la salida es idéntica a la secuencial."""
+    sequential, parallel = tmp_path / "uno.jsonl", tmp_path / "dos.jsonl"
+    run_analysis(str(positions), str(sequential), chunk_size=3)
+    run_analysis(str(positions), str(parallel), workers=2, chunk_size=3)
+    assert sequential.read_bytes() == parallel.read_bytes()
+
+
+def test_resume_from_checkpoint(positions, tmp_path):
+    """Verifica que retomar descarta lo escrito a medias y completa la misma salida."""
+    output = tmp_path / "salida.jsonl"
+    run_analysis(str(positions), str(output), chunk_size=5)
+    complete = output.read_bytes()
+    checkpoint = tmp_path / "salida.jsonl.ckpt"
+    state = json.loads(checkpoint.read_text())
+    assert state["chunks"] == 5
+    lines = complete.splitlines(keepends=True)
+    done = sum(1 for line in lines if json.loads(line)["line"] <= 10)
+    offset = sum(len(line) for line in lines[:done])
+    state.update(chunks=2, offset=offset, positions=done)
+    checkpoint.write_text(json.dumps(state))
+    output.write_bytes(complete[:offset] + b'{"line":11,"posi')
+    stats = run_analysis(str(positions), str(output), chunk_size=5, resume=True)
+    assert stats["resumed_chunks"] == 2 and stats["chunks"] == 3
+    assert stats["total_positions"] == 23
+    assert output.read_bytes() == complete
+    with pytest.raises(ValueError):
+        run_analysis(str(positions), str(output), chunk_size=7, resume=True)
@@ -0,0 +1,141 @@
+import itertools
+import random
+import pytest
+from core.bearoff import (
+    BearoffDatabase, PositionIndexer, build_database, build_tables, home_counts,
+    is_pure_bear_off, successors,
+)
+from core.board import Board
+from core.moves import generate_plays, legal_single_moves
+from core.player import Player
+from core.policies import EvaluatorPolicy
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    """Fixture con una base de datos chica (hasta 6 fichas) generada en disco."""
+    path = tmp_path_factory.mktemp("bearoff") / "bearoff.db"
+    build_database(str(path), max_checkers=6)
+    db = BearoffDatabase(str(path))
+    yield db
+    db.close()
+
+
+def _bear_off_board(white_home, black_home):
+    """Arma un tablero con las fichas indicadas por distancia a la salida y el resto retiradas."""
+    board, white, black = Board(), Player("W", "W"), Player("B", "B")
+    for distance, count in enumerate(white_home, start=1):
+        for _ in range(count):
+            board.place_checker(24 - distance, white)
+    for distance, count in enumerate(black_home, start=1):
+        for _ in range(count):
+            board.place_checker(distance - 1, black)
+    for _ in range(15 - sum(white_home)):
+        board.place_checker(23, white)
+    for _ in range(15 - sum(black_home)):
+        board.place_checker(0, black)
+    for _ in range(15 - sum(white_home)):
+        board.make_move(white, 23, 1)
+    for _ in range(15 - sum(black_home)):
+        board.make_move(black, 0, 1)
+    return board, white, black
+
+
+def test_indexer_is_a_bijection():
+    """Verifica que cada posición tiene un índice distinto y consecutivo."""
+    indexer = PositionIndexer(5)
+    positions = indexer.positions()
+    assert len(positions) == indexer.size() == 462
+    assert [indexer.index(position) for position in positions] == list(range(len(positions)))
+    assert PositionIndexer(15).size() == 54264
+
+
+def test_indexer_rejects_too_many_checkers():
+    """Verifica que una posición con demasiadas fichas lanza ValueError."""
+    with pytest.raises(ValueError):
+        PositionIndexer(3).index((2, 2, 0, 0, 0, 0))
+
+
+def test_successors_follow_overshoot_rule():
+    """Verifica que un dado mayor sólo retira la ficha más cercana a la salida."""
+    assert successors((0, 1, 0, 0, 0, 1), 6) == [(0, 0, 0, 0, 0, 1), (0, 1, 0, 0, 0, 0)]
+    assert successors((0, 1, 0, 1, 0, 0), 5) == [(0, 0, 0, 1, 0, 0)]
+    assert successors((0, 1, 0, 0, 0, 1), 5) == [(0, 0, 0, 0, 0, 1), (1, 1, 0, 0, 0, 0)]
+    assert successors((0, 0, 0, 1, 0, 0), 6) == [(0, 0, 0, 0, 0, 0)]
+
+
+def test_successors_match_board_moves():
+    """Verifica que las reglas de la base coinciden con las del tablero."""
+    rng = random.Random(5)
+    for _ in range(40):
+        cut = sorted(rng.randint(0, 15) for _ in range(5))
+        home = tuple(b - a for a, b in zip([0] + cut, cut + [15]))
+        board, white, _ = _bear_off_board(home, (15, 0, 0, 0, 0, 0))
+        for die in range(1, 7):
+            expected = []
+            for move in legal_single_moves(board, white, die):
+                record = board.make_move(white, *move)
+                expected.append(home_counts(board, "W"))
+                board.unmake_move(white, record)
+            assert sorted(expected) == sorted(successors(home, die))
+
+
+def test_known_expected_rolls():
+    """Verifica valores conocidos de tiradas esperadas."""
+    indexer = PositionIndexer(6)
+    expected, distribution = build_tables(6)
+    assert expected[indexer.index((1, 0, 0, 0, 0, 0))] == pytest.approx(1.0)
+    assert expected[indexer.index((0, 0, 0, 0, 0, 1))] == pytest.approx(1 + 9 / 36)
+    assert expected[indexer.index((2, 0, 0, 0, 0, 0))] == pytest.approx(1.0)
+    assert distribution.sum(axis=1) == pytest.approx([1.0] * len(expected))
+
+
+def test_database_lookup_matches_tables(database):
+    """Verifica que el archivo mapeado devuelve lo calculado."""
+    indexer = PositionIndexer(6)
+    expected, _ = build_tables(6)
+    assert len(database) == len(expected)
+    assert database.get_max_checkers() == 6
+    for position in itertools.islice(indexer.positions(), 0, None, 37):
+        assert database.expected_rolls(position) == pytest.approx(expected[indexer.index(position)], rel=1e-6)
+    distribution = database.roll_distribution((0, 0, 0, 0, 0, 1))
+    assert distribution[:3] == pytest.approx([0.0, 0.75, 0.25], abs=1e-4)
+
+
+def test_invalid_database_file(tmp_path):
+    """Verifica que un archivo con otro formato lanza ValueError."""
+    path = tmp_path / "otro.db"
+    path.write_bytes(b"\0" * 64)
+    with pytest.raises(ValueError):
+        BearoffDatabase(str(path))
+
+
+def test_home_counts_and_contact():
+    """Verifica la lectura del home board y la detección de retirada pura."""
+    board, _, _ = _bear_off_board((1, 0, 2, 0, 0, 3), (0, 4, 0, 0, 0, 0))
+    assert home_counts(board, "W") == (1, 0, 2, 0, 0, 3)
+    assert home_counts(board, "B") == (0, 4, 0, 0, 0, 0)
+    assert is_pure_bear_off(board)
+
+    opening = Board()
+    opening.setup_initial_checkers(Player("W", "W"), Player("B", "B"))
+    assert not is_pure_bear_off(opening)
+
+
+def test_policy_minimizes_expected_rolls(database):
+    """Verifica que el bot elige la jugada con menos tiradas esperadas en la retirada."""
+    board, white, _ = _bear_off_board((0, 2, 0, 1, 0, 2), (3, 0, 0, 0, 0, 0))
+    policy = EvaluatorPolicy(seed=0, bearoff=database)
+    plays = generate_plays(board, white, [4, 1])
+    before = home_counts(board, "W")
+
+    def rolls_after(play):
+        records = [board.make_move(white, *move) for move in play]
+        rolls = database.expected_rolls(home_counts(board, "W"))
+        for record in reversed(records):
+            board.unmake_move(white, record)
+        return rolls
+
+    chosen = policy.choose_play(board, white, plays)
+    assert home_counts(board, "W") == before
+    assert rolls_after(chosen) == min(rolls_after(play) for play in plays)
@@ -0,0 +1,32 @@
+import pytest
+from benchmarks.suite import CORPUS, compare_results, load_position, measure
+from core.zobrist import compute_hash
+
+
+@pytest.mark.parametrize("name", sorted(CORPUS))
+def test_corpus_positions_are_consistent(name):
+    """Verifica que cada posición del corpus es válida y tiene movimientos."""
+    game = load_position(name)
+    board = game.get_board()
+    for color in ("W", "B"):
+        on_board = sum(abs(c) for c in board.get_counts() if (c > 0) == (color == "W") and c)
+        assert on_board + board.get_bar(color) + board.get_borne_off(color) == 15
+    assert board.get_hash() == compute_hash(board)
+    assert game.get_current_player().get_color() == CORPUS[name][2]
+    assert game.has_valid_moves()
+
+
+def test_measure_reports_speed_and_memory():
+    """Verifica que la medición devuelve las métricas esperadas."""
+    result = measure(lambda: [0] * 100, 1, min_time=0.001, repeat=2)
+    assert result["ops_per_sec"] > 0
+    assert result["peak_bytes_per_op"] > 0
+    assert result["retained_blocks"] >= 0
+
+
+def test_compare_results_flags_regressions():
+    """Verifica que sólo se informan las caídas mayores al umbral."""
+    baseline = {"results": {"a": {"ops_per_sec": 100.0}, "b": {"ops_per_sec": 100.0}}}
+    current = {"results": {"a": {"ops_per_sec": 95.0}, "b": {"ops_per_sec": 80.0}, "c": {"ops_per_sec": 1.0}}}
+    regressions = compare_results(baseline, current, threshold=0.1)
+    assert len(regressions) == 1 and regressions[0].startswith("b:")
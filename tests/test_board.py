@@ -25,6 +25,17 @@ def test_place_checker_adds_player_piece(board_with_players):
     assert board.get_point(0) == [p1]
 
 
+def test_get_point_returns_a_copy(board_with_players):
+    """Verifica que modificar lo que devuelve ``get_point`` no desincroniza el tablero."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    before = (board.pip_count("W"), board.get_hash(), board.get_occupied_mask("W"))
+    board.get_point(0).clear()
+    board.get_point(5).append(p1)
+    assert board.get_counts()[0] == 2 and board.get_counts()[5] == -5
+    assert (board.pip_count("W"), board.get_hash(), board.get_occupied_mask("W")) == before
+
+
 def test_get_point_invalid_index_raises_error(board_with_players):
     """Verifica que un índice inválido lanza IndexError."""
     board, _, _ = board_with_players
@@ -185,3 +196,389 @@ def test_is_valid_move_from_bar(board_with_players):
     board.place_checker(3, p2)
     assert board.is_valid_move(p1, 25, 4) is False
     assert board.is_valid_move(p1, 25, 2) is True
+
+
+def test_pip_count_initial_position(board_with_players):
+    """Verifica el pip count de la posición inicial."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    assert board.pip_count("W") == 167
+    assert board.pip_count("B") == 167
+
+
+def test_pip_count_updates_on_hit_and_bar_entry(board_with_players):
+    """Verifica que el pip count se actualiza al golpear y reingresar."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(3, p2)
+    assert board.pip_count("W") == 24
+    assert board.pip_count("B") == 4
+
+    board.move_checker(p2, 3, 3)
+    assert board.pip_count("W") == 25
+    assert board.pip_count("B") == 1
+
+    board.move_checker_from_bar(p1, 4)
+    assert board.pip_count("W") == 21
+
+
+def test_pip_count_updates_on_bear_off(board_with_players):
+    """Verifica que el pip count baja al retirar fichas."""
+    board, p1, _ = board_with_players
+    for _ in range(15):
+        board.place_checker(20, p1)
+    assert board.pip_count("W") == 60
+    board.move_checker(p1, 20, 6)
+    assert board.pip_count("W") == 56
+
+
+def test_incremental_stats_match_full_scan(board_with_players):
+    """Verifica que las estadísticas incrementales coinciden con un recorrido completo."""
+    from core.moves import generate_plays, apply_move
+    import random
+
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    rng = random.Random(11)
+    player, other = p1, p2
+    for _ in range(400):
+        plays = generate_plays(board, player, [rng.randint(1, 6), rng.randint(1, 6)])
+        if plays:
+            for move in rng.choice(plays):
+                apply_move(board, player, move)
+        for p in (p1, p2):
+            color = p.get_color()
+            home = range(18, 24) if color == "W" else range(0, 6)
+            pips = sum(
+                (24 - i if color == "W" else i + 1) * len(point)
+                for i, point in enumerate(board.get_all_points())
+                if point and point[0] == p
+            ) + 25 * board.get_bar(color)
+            in_home = sum(len(board.get_point(i)) for i in home if board.get_point(i) and board.get_point(i)[0] == p)
+            assert board.pip_count(color) == pips
+            assert board.is_ready_to_bear_off(p) == (in_home + board.get_borne_off(color) == 15)
+        if board.has_won(player):
+            break
+        player, other = other, player
+
+
+def _state(board):
+    """Devuelve el estado observable completo de un tablero."""
+    return (
+        [list(point) for point in board.get_all_points()],
+        board.get_bar("W"), board.get_bar("B"),
+        board.get_borne_off("W"), board.get_borne_off("B"),
+        board.pip_count("W"), board.pip_count("B"), board.get_hash(),
+    )
+
+
+def test_make_move_returns_undo_record(board_with_players):
+    """Verifica el registro que devuelve make_move."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(5, p2)
+    record = board.make_move(p1, 0, 5)
+    assert record.from_point == 0
+    assert record.to_point == 5
+    assert record.hit is True
+    assert record.borne_off is False
+
+
+def test_unmake_move_restores_hit_checker(board_with_players):
+    """Verifica que deshacer un golpe devuelve la ficha rival desde la barra."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(5, p2)
+    before = _state(board)
+    record = board.make_move(p1, 0, 5)
+    assert board.get_bar("B") == 1
+    board.unmake_move(p1, record)
+    assert _state(board) == before
+    assert board.get_point(5) == [p2]
+
+
+def test_unmake_bar_entry_and_bear_off(board_with_players):
+    """Verifica deshacer un reingreso con golpe y una retirada."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(3, p2)
+    board.move_checker(p2, 3, 3)
+    board.place_checker(3, p2)
+    before = _state(board)
+    record = board.make_move(p1, 25, 4)
+    assert record.hit is True and record.from_point == 25
+    board.unmake_move(p1, record)
+    assert _state(board) == before
+
+    bear_off = Board()
+    for _ in range(15):
+        bear_off.place_checker(20, p1)
+    before = _state(bear_off)
+    record = bear_off.make_move(p1, 20, 6)
+    assert record.borne_off is True
+    bear_off.unmake_move(p1, record)
+    assert _state(bear_off) == before
+
+
+def test_make_move_invalid_raises_error(board_with_players):
+    """Verifica que make_move valida igual que move_checker."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(5, p2)
+    board.place_checker(5, p2)
+    with pytest.raises(ValueError, match="Movimiento inválido"):
+        board.make_move(p1, 0, 5)
+    with pytest.raises(ValueError, match="barra"):
+        board.make_move(p1, 25, 1)
+
+
+def test_unmake_sequence_restores_initial_position(board_with_players):
+    """Verifica que deshacer una secuencia larga en orden inverso restaura todo."""
+    from core.moves import legal_single_moves
+    import random
+
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    before = _state(board)
+    rng = random.Random(2)
+    history = []
+    player, other = p1, p2
+    for _ in range(120):
+        moves = legal_single_moves(board, player, rng.randint(1, 6))
+        if moves:
+            history.append((player, board.make_move(player, *rng.choice(moves))))
+        if board.has_won(player):
+            break
+        player, other = other, player
+    for mover, record in reversed(history):
+        board.unmake_move(mover, record)
+    assert _state(board) == before
+
+
+def test_setup_position_loads_counts_bar_and_borne_off(board_with_players):
+    """Verifica que se puede cargar una posición arbitraria con barra y fichas retiradas."""
+    from core.zobrist import compute_hash
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    counts = [0] * 24
+    counts[0], counts[20], counts[5] = 3, 10, -12
+    board.setup_position(p1, p2, counts, (1, 2))
+    assert board.get_counts() == counts
+    assert board.get_bar("W") == 1 and board.get_bar("B") == 2
+    assert board.get_borne_off("W") == 1 and board.get_borne_off("B") == 1
+    assert board.pip_count("W") == 3 * 24 + 10 * 4 + 25
+    assert board.get_hash() == compute_hash(board)
+    assert board.get_point(5) == [p2] * 12
+
+
+def test_setup_position_rejects_invalid_counts(board_with_players):
+    """Verifica que una posición con más de 15 fichas o mal formada lanza ValueError."""
+    board, p1, p2 = board_with_players
+    with pytest.raises(ValueError):
+        board.setup_position(p1, p2, [16] + [0] * 23)
+    with pytest.raises(ValueError):
+        board.setup_position(p1, p2, [0] * 23)
+
+
+def _legal_moves(board, player):
+    """Devuelve los movimientos válidos de un jugador con cada dado."""
+    return [(point, die) for die in range(1, 7) for point in list(range(24)) + [25]
+            if board.is_valid_move(player, point, die)]
+
+
+def test_snapshot_round_trip(board_with_players):
+    """Verifica que restaurar una foto reproduce la posición, incluida la barra y las fichas retiradas."""
+    board, p1, p2 = board_with_players
+    counts = [0] * 24
+    counts[2], counts[19], counts[22], counts[4], counts[17] = 2, 6, 4, -9, -3
+    board.setup_position(p1, p2, counts, (1, 2))
+    restored = Board.from_snapshot(board.snapshot())
+    assert _state(restored) == _state(board)
+    assert _legal_moves(restored, p1) == _legal_moves(board, p1)
+    assert _legal_moves(restored, p2) == _legal_moves(board, p2)
+    record = restored.make_move(p1, 25, 1)
+    restored.unmake_move(p1, record)
+    assert _state(restored) == _state(board)
+
+
+def test_snapshot_is_immutable_and_hashable(board_with_players):
+    """Verifica que la foto no cambia al mover, no se puede modificar y se hashea con el Zobrist."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    snapshot = board.snapshot()
+    record = board.make_move(p1, 0, 3)
+    assert snapshot.get_point(0) == (p1, p1) and snapshot.get_point(3) == ()
+    with pytest.raises(AttributeError):
+        snapshot.__zobrist__ = 0
+    board.unmake_move(p1, record)
+    assert snapshot.get_hash() == board.get_hash() and hash(snapshot) == hash(board.get_hash())
+    other = Board()
+    other.setup_initial_checkers(p1, p2)
+    assert other.snapshot() == snapshot
+    assert len({snapshot, other.snapshot(), board.snapshot()}) == 1
+
+
+def test_snapshot_shares_untouched_quadrants(board_with_players):
+    """Verifica que una foto después de mover comparte con la anterior los cuadrantes no tocados."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    parent = board.snapshot()
+    assert board.snapshot() is parent
+    record = board.make_move(p1, 0, 3)
+    child = board.snapshot()
+    board.unmake_move(p1, record)
+    parent_quadrants, child_quadrants = parent.get_quadrants(), child.get_quadrants()
+    assert child_quadrants[0] is not parent_quadrants[0]
+    assert all(child_quadrants[q] is parent_quadrants[q] for q in (1, 2, 3))
+    sibling_board = Board.from_snapshot(parent)
+    sibling_board.make_move(p2, 23, 2)
+    sibling = sibling_board.snapshot()
+    assert sibling.get_quadrants()[0] is parent_quadrants[0]
+    assert sibling.get_counts()[21] == -1
+
+
+def test_snapshot_pickles(board_with_players):
+    """Verifica que las fotos se pueden serializar con pickle."""
+    import pickle
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    copy = pickle.loads(pickle.dumps(board.snapshot()))
+    assert copy.get_counts() == board.get_counts()
+    assert copy.get_hash() == board.get_hash()
+
+
+def test_iter_legal_moves_order_and_filter(board_with_players):
+    """Verifica el orden desde el punto más alejado de la salida, el filtro por origen y la barra primero."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    white = list(board.iter_legal_moves(p1, [3, 1]))
+    assert white[0] == (0, 1) and [point for point, _ in white] == sorted(point for point, _ in white)
+    black = list(board.iter_legal_moves(p2, [3, 1]))
+    assert black[0] == (23, 1) and [point for point, _ in black] == sorted((point for point, _ in black), reverse=True)
+    assert list(board.iter_legal_moves(p1, [3, 2, 3], 11)) == [(11, 2), (11, 3)]
+    assert list(board.iter_legal_moves(p1, [3, 1], 5)) == []
+    assert list(board.iter_legal_moves(p1, [6, 5], 25)) == []
+    counts = [0] * 24
+    counts[11], counts[2], counts[4] = 5, -2, -2
+    board.setup_position(p1, p2, counts, (1, 0))
+    assert list(board.iter_legal_moves(p1, [6, 5, 2])) == [(25, 2), (25, 6)]
+    assert list(board.iter_legal_moves(p1, [6, 5, 2], 11)) == []
+
+
+def test_iter_legal_moves_is_lazy(board_with_players):
+    """Verifica que pedir el primer movimiento no valida el resto de los puntos."""
+    from unittest.mock import patch
+
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    with patch.object(Board, "is_valid_move", autospec=True, side_effect=Board.is_valid_move) as spy:
+        assert next(board.iter_legal_moves(p1, [4, 3])) == (0, 3)
+    assert spy.call_count == 1
+
+
+def _masks_from_counts(counts, color):
+    """Calcula las máscaras esperadas recorriendo los conteos."""
+    sign = 1 if color == "W" else -1
+    occupied = sum(1 << i for i, count in enumerate(counts) if count * sign >= 1)
+    made = sum(1 << i for i, count in enumerate(counts) if count * sign >= 2)
+    return occupied, made, occupied & ~made
+
+
+def test_masks_follow_moves_and_unmakes(board_with_players):
+    """Verifica que las máscaras coinciden con los conteos en cada movimiento y al deshacer."""
+    import random
+    from core.moves import legal_single_moves
+
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    rng = random.Random(8)
+    history = []
+    player, other = p1, p2
+    for _ in range(150):
+        moves = legal_single_moves(board, player, rng.randint(1, 6))
+        if moves:
+            history.append((player, board.make_move(player, *rng.choice(moves))))
+        for color in ("W", "B"):
+            expected = _masks_from_counts(board.get_counts(), color)
+            assert (board.get_occupied_mask(color), board.get_made_mask(color), board.get_blot_mask(color)) == expected
+        if board.has_won(player):
+            break
+        player, other = other, player
+    for mover, record in reversed(history):
+        board.unmake_move(mover, record)
+    initial = Board()
+    initial.setup_initial_checkers(p1, p2)
+    for color in ("W", "B"):
+        assert board.get_occupied_mask(color) == initial.get_occupied_mask(color)
+        assert board.get_made_mask(color) == initial.get_made_mask(color)
+
+
+def test_initial_masks_and_prime(board_with_players):
+    """Verifica las máscaras de la posición inicial y el largo de los primes."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    assert board.get_made_mask("W") == (1 << 0) | (1 << 11) | (1 << 16) | (1 << 18)
+    assert board.get_blot_mask("W") == 0
+    assert board.prime_length("W") == 1
+    counts = [0] * 24
+    for point in (3, 4, 5, 6, 7, 9):
+        counts[point] = 2
+    counts[10] = -2
+    counts[19] = -1
+    board.setup_position(p1, p2, counts)
+    assert board.prime_length("W") == 5
+    assert board.prime_length("B") == 1
+    assert board.is_valid_move(p2, 10, 1) is False
+    assert board.is_valid_move(p2, 10, 6) is False
+    assert board.is_valid_move(p2, 10, 2) is True
+    assert board.is_valid_move(p1, 9, 1) is False
+    assert board.is_valid_move(p1, 9, 10) is True
+
+
+def test_direct_shot_mask(board_with_players):
+    """Verifica los blots al alcance de un solo dado, también desde la barra."""
+    board, p1, p2 = board_with_players
+    counts = [0] * 24
+    counts[10], counts[3], counts[20] = 1, 1, 2
+    counts[16], counts[12] = -2, -1
+    board.setup_position(p1, p2, counts)
+    # Las Negras mueven hacia abajo: desde 16 alcanzan 10-15, desde 12 alcanzan 6-11.
+    assert board.direct_shot_mask("W") == 1 << 10
+    # Las Blancas desde 10 alcanzan 11-16 y desde 3 alcanzan 4-9.
+    assert board.direct_shot_mask("B") == 1 << 12
+    board.setup_position(p1, p2, counts, (0, 1))
+    assert board.direct_shot_mask("W") == 1 << 10
+    counts[19] = 1
+    board.setup_position(p1, p2, counts, (0, 1))
+    assert board.direct_shot_mask("W") == (1 << 10) | (1 << 19)
+
+
+def test_exposed_points_are_resynchronized(board_with_players):
+    """Verifica que modificar las listas de ``get_all_points`` no deja máscaras viejas."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    for point in board.get_all_points():
+        point.clear()
+    board.place_checker(3, p2)
+    assert board.get_made_mask("W") == 0
+    assert board.get_blot_mask("B") == 1 << 3
+    assert board.is_valid_move(p2, 3, 3)
+    assert board.get_hash() == Board.from_snapshot(board.snapshot()).get_hash()
+
+
+def test_incremental_getters_resync_after_exposing_points(board_with_players):
+    """Verifica que pips, bear-off y hash se recalculan si se modificaron las listas de ``get_all_points``."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    points = board.get_all_points()
+    for index in range(18):
+        if points[index] and points[index][0] == p1:
+            points[index].clear()
+    points[20].extend([p1] * 10)
+    expected = Board()
+    expected.setup_position(p1, p2, board.get_counts())
+    assert board.pip_count("W") == expected.pip_count("W")
+    board.get_all_points()
+    assert board.is_ready_to_bear_off(p1)
+    board.get_all_points()
+    assert board.get_hash() == expected.get_hash()
@@ -0,0 +1,238 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.game import BackgammonGame
+from core.player import Player
+
+
+@pytest.fixture
+def board_with_players():
+    """Fixture para crear un tablero compacto con dos jugadores."""
+    board = CompactBoard()
+    player1 = Player("Alice", "W")
+    player2 = Player("Bob", "B")
+    return board, player1, player2
+
+
+def test_compact_board_uses_slots(board_with_players):
+    """Verifica que el tablero compacto no tiene __dict__."""
+    board, _, _ = board_with_players
+    assert not hasattr(board, "__dict__")
+
+
+def test_place_checker_and_get_point(board_with_players):
+    """Verifica que get_point devuelve las fichas como jugadores."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(0, p1)
+    board.place_checker(5, p2)
+    assert board.get_point(0) == [p1, p1]
+    assert board.get_point(5) == [p2]
+    assert board.get_count(0) == 2
+    assert board.get_count(5) == -1
+
+
+def test_get_point_invalid_index_raises_error(board_with_players):
+    """Verifica que un índice inválido lanza IndexError."""
+    board, _, _ = board_with_players
+    with pytest.raises(IndexError):
+        board.get_point(24)
+
+
+def test_place_checker_on_opponent_point_raises_error(board_with_players):
+    """Verifica que no se pueden mezclar colores en un mismo punto."""
+    board, p1, p2 = board_with_players
+    board.place_checker(3, p2)
+    with pytest.raises(ValueError):
+        board.place_checker(3, p1)
+
+
+def test_initial_board_setup(board_with_players):
+    """Verifica la configuración inicial de las fichas."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    assert len(board.get_point(0)) == 2 and board.get_point(0)[0] == p1
+    assert len(board.get_point(5)) == 5 and board.get_point(5)[0] == p2
+    assert sum(len(p) for p in board.get_all_points()) == 30
+
+
+def test_hit_blot_and_enter_from_bar(board_with_players):
+    """Verifica el golpe a una ficha solitaria y el reingreso."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(3, p2)
+    board.move_checker(p2, 3, 3)
+    assert board.get_point(0) == [p2]
+    assert board.get_bar("W") == 1
+
+    board.place_checker(3, p2)
+    board.place_checker(3, p2)
+    assert board.is_valid_move(p1, 25, 4) is False
+    board.move_checker_from_bar(p1, 1)
+    assert board.get_point(0) == [p1]
+    assert board.get_bar("B") == 1
+    assert board.get_bar("W") == 0
+
+
+def test_bear_off_rules_match_board(board_with_players):
+    """Verifica que la retirada de fichas sigue las reglas de Board."""
+    board, p1, _ = board_with_players
+    for _ in range(14):
+        board.place_checker(22, p1)
+    board.place_checker(20, p1)
+    assert board.is_ready_to_bear_off(p1)
+    assert board.is_valid_move(p1, 20, 5) is False
+    assert board.is_valid_move(p1, 22, 6) is True
+    board.move_checker(p1, 22, 6)
+    assert board.get_borne_off("W") == 1
+
+
+def test_move_checker_invalid_raises_error(board_with_players):
+    """Verifica que un movimiento inválido lanza ValueError."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(5, p2)
+    board.place_checker(5, p2)
+    with pytest.raises(ValueError, match="Movimiento inválido"):
+        board.move_checker(p1, 0, 5)
+
+
+def _legal_moves(board, player, die):
+    """Devuelve los orígenes válidos para un dado, con la barra primero."""
+    if board.get_bar(player.get_color()) > 0:
+        return [25] if board.is_valid_move(player, 25, die) else []
+    return [i for i in range(24) if board.is_valid_move(player, i, die)]
+
+
+def test_random_games_match_list_board():
+    """Verifica que ambos motores validan y ejecutan igual en partidas aleatorias."""
+    rng = random.Random(7)
+    reference = BackgammonGame()
+    compact = BackgammonGame(board=CompactBoard())
+    for _ in range(300):
+        if reference.check_winner():
+            break
+        ref_board, cmp_board = reference.get_board(), compact.get_board()
+        ref_player, cmp_player = reference.get_current_player(), compact.get_current_player()
+        for die in (rng.randint(1, 6), rng.randint(1, 6)):
+            legal = _legal_moves(ref_board, ref_player, die)
+            assert legal == _legal_moves(cmp_board, cmp_player, die)
+            if not legal:
+                continue
+            from_point = rng.choice(legal)
+            if from_point == 25:
+                ref_board.move_checker_from_bar(ref_player, die)
+                cmp_board.move_checker_from_bar(cmp_player, die)
+            else:
+                ref_board.move_checker(ref_player, from_point, die)
+                cmp_board.move_checker(cmp_player, from_point, die)
+        for i in range(24):
+            assert len(ref_board.get_point(i)) == len(cmp_board.get_point(i))
+        for color in ("W", "B"):
+            assert ref_board.get_bar(color) == cmp_board.get_bar(color)
+            assert ref_board.get_borne_off(color) == cmp_board.get_borne_off(color)
+        reference.switch_player()
+        compact.switch_player()
+
+
+def test_game_accepts_compact_board():
+    """Verifica que BackgammonGame funciona con el tablero compacto."""
+    game = BackgammonGame(board=CompactBoard())
+    assert isinstance(game.get_board(), CompactBoard)
+    assert isinstance(BackgammonGame().get_board(), Board)
+    board = game.get_board()
+    assert board.get_point(0)[0] == game.get_player1()
+    assert board.get_point(23)[0] == game.get_player2()
+
+
+def test_pip_count_matches_board(board_with_players):
+    """Verifica que el pip count coincide con el de Board."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    assert board.pip_count("W") == 167
+    board.move_checker(p1, 0, 3)
+    reference = Board()
+    reference.setup_initial_checkers(p1, p2)
+    reference.move_checker(p1, 0, 3)
+    assert board.pip_count("W") == reference.pip_count("W")
+    assert board.pip_count("B") == reference.pip_count("B")
+
+
+def test_make_and_unmake_restore_state(board_with_players):
+    """Verifica que make_move y unmake_move restauran conteos y hash."""
+    from core.moves import legal_single_moves
+
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    before = (board.get_counts(), board.get_bar("W"), board.get_bar("B"), board.get_hash())
+    rng = random.Random(4)
+    history = []
+    player, other = p1, p2
+    for _ in range(120):
+        moves = legal_single_moves(board, player, rng.randint(1, 6))
+        if moves:
+            history.append((player, board.make_move(player, *rng.choice(moves))))
+        if board.has_won(player):
+            break
+        player, other = other, player
+    assert any(record.hit for _, record in history)
+    for mover, record in reversed(history):
+        board.unmake_move(mover, record)
+    assert (board.get_counts(), board.get_bar("W"), board.get_bar("B"), board.get_hash()) == before
+
+
+def test_setup_position_matches_board():
+    """Verifica que ambos motores cargan igual una posición arbitraria."""
+    counts = [0] * 24
+    counts[2], counts[9], counts[18], counts[21] = 2, -3, 4, -5
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    compact, board = CompactBoard(), Board()
+    compact.setup_position(p1, p2, counts, (1, 2))
+    board.setup_position(p1, p2, counts, (1, 2))
+    assert compact.get_counts() == board.get_counts() == counts
+    assert compact.get_hash() == board.get_hash()
+    assert compact.pip_count("W") == board.pip_count("W")
+    for color in ("W", "B"):
+        assert compact.get_bar(color) == board.get_bar(color)
+        assert compact.get_borne_off(color) == board.get_borne_off(color)
+
+
+def test_iter_legal_moves_matches_board():
+    """Verifica que ambos motores generan los mismos movimientos en el mismo orden."""
+    rng = random.Random(11)
+    white, black = Player("W", "W"), Player("B", "B")
+    for _ in range(200):
+        counts = [0] * 24
+        for _ in range(rng.randint(1, 14)):
+            counts[rng.randrange(24)] += 1
+        for point in rng.sample(range(24), 6):
+            if counts[point] == 0:
+                counts[point] = -rng.randint(1, 2)
+        bar = (rng.randint(0, 1), rng.randint(0, 1))
+        board, compact = Board(), CompactBoard()
+        board.setup_position(white, black, counts, bar)
+        compact.setup_position(white, black, counts, bar)
+        dice = [rng.randint(1, 6), rng.randint(1, 6)]
+        for player in (white, black):
+            assert list(compact.iter_legal_moves(player, dice)) == list(board.iter_legal_moves(player, dice))
+
+
+def test_mask_queries_match_board():
+    """Verifica que las máscaras, primes y tiros directos coinciden con los de ``Board``."""
+    rng = random.Random(12)
+    white, black = Player("W", "W"), Player("B", "B")
+    for _ in range(100):
+        counts = [0] * 24
+        for _ in range(rng.randint(1, 14)):
+            counts[rng.randrange(24)] += 1
+        for point in rng.sample(range(24), 8):
+            if counts[point] == 0:
+                counts[point] = -rng.randint(1, 2)
+        bar = (rng.randint(0, 1), rng.randint(0, 1))
+        board, compact = Board(), CompactBoard()
+        board.setup_position(white, black, counts, bar)
+        compact.setup_position(white, black, counts, bar)
+        for color in ("W", "B"):
+            for query in ("get_occupied_mask", "get_made_mask", "get_blot_mask", "prime_length", "direct_shot_mask"):
+                assert getattr(compact, query)(color) == getattr(board, query)(color)
@@ -1,3 +1,8 @@
+import os
+import random
+import subprocess
+import sys
+
 import pytest
 from unittest.mock import patch
 from core.dice import Dice
@@ -43,4 +48,73 @@ def test_get_values_returns_last_roll():
     """Verifica que get_values() devuelve el resultado de la última tirada."""
     dice = Dice()
     rolled_values = dice.roll()
-    assert dice.get_values() == rolled_values
\ No newline at end of file
+    assert dice.get_values() == rolled_values
+
+def test_seeded_dice_are_reproducible():
+    """Verifica que dos dados con la misma semilla producen las mismas tiradas."""
+    first, second = Dice(seed=7), Dice(seed=7)
+    assert [first.roll()[:] for _ in range(50)] == [second.roll()[:] for _ in range(50)]
+
+
+@patch('random.randint')
+def test_seeded_dice_do_not_use_global_random(mock_randint):
+    """Verifica que los dados con semilla no usan el módulo global ``random``."""
+    Dice(seed=1).roll()
+    Dice(seed=1, block_size=8).roll()
+    assert mock_randint.call_count == 0
+
+
+def test_block_dice_are_reproducible_and_valid():
+    """Verifica que las tiradas por bloques son válidas y no dependen del tamaño de bloque."""
+    small, large = Dice(seed=3, block_size=4), Dice(seed=3, block_size=64)
+    rolls = [small.roll()[:] for _ in range(100)]
+    assert rolls == [large.roll()[:] for _ in range(100)]
+    assert all(1 <= v <= 6 for values in rolls for v in values)
+    assert all(len(values) == (4 if values[0] == values[1] else 2) for values in rolls)
+
+
+def test_seed_and_rng_together_raise():
+    """Verifica que no se puede indicar una semilla y un generador a la vez."""
+    with pytest.raises(ValueError):
+        Dice(seed=1, rng=random.Random(1))
+
+
+def test_plain_dice_do_not_import_numpy():
+    """Verifica que los dados sin bloques se pueden usar sin NumPy instalado."""
+    code = ("import sys; sys.modules['numpy'] = None; "
+            "from core.dice import Dice; from core.game import BackgammonGame; "
+            "assert len(Dice(seed=1).roll()) in (2, 4); BackgammonGame().roll_dice()")
+    subprocess.run([sys.executable, "-c", code], check=True, cwd=os.path.dirname(os.path.dirname(__file__)))
+
+
+def test_injected_numpy_generator():
+    """Verifica que se puede inyectar un generador de NumPy."""
+    import numpy as np
+    dice = Dice(rng=np.random.default_rng(11))
+    expected = np.random.default_rng(11).integers(1, 7, size=(1024, 2)).tolist()[0]
+    assert dice.roll()[:2] == expected
+
+
+def test_block_size_requires_numpy_generator():
+    """Verifica que los bloques con un generador que no es de NumPy lanzan ValueError."""
+    import random
+    with pytest.raises(ValueError):
+        Dice(rng=random.Random(0), block_size=16)
+    with pytest.raises(ValueError):
+        Dice(block_size=-1)
+
+
+def test_replay_recorded_sequence():
+    """Verifica que una secuencia grabada se reproduce igual y luego se agota."""
+    recorder = Dice(seed=5, record=True)
+    rolls = [recorder.roll()[:] for _ in range(10)]
+    replay = Dice(sequence=recorder.get_history())
+    assert [replay.roll()[:] for _ in range(10)] == rolls
+    with pytest.raises(IndexError):
+        replay.roll()
+
+
+def test_replay_rejects_invalid_values():
+    """Verifica que una secuencia con valores fuera de 1..6 lanza ValueError."""
+    with pytest.raises(ValueError):
+        Dice(sequence=[(3, 7)])
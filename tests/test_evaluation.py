@@ -0,0 +1,111 @@
+import numpy as np
+import pytest
+from core.board import Board
+from core.evaluation import (
+    FEATURE_COUNT, FEATURE_NAMES, HeuristicEvaluator, LinearEvaluator, MLPEvaluator,
+    encode_board, encode_boards, extract_features, evaluate_boards, evaluate_plays,
+)
+from core.moves import generate_plays, apply_move
+from core.player import Player
+from core.policies import EvaluatorPolicy
+
+
+@pytest.fixture
+def opening():
+    """Fixture con el tablero en la posición inicial."""
+    board = Board()
+    player1 = Player("Alice", "W")
+    player2 = Player("Bob", "B")
+    board.setup_initial_checkers(player1, player2)
+    return board, player1, player2
+
+
+def _feature(features, name):
+    return features[:, FEATURE_NAMES.index(name)]
+
+
+def test_encode_board_layout(opening):
+    """Verifica el formato de la codificación cruda."""
+    board, _, _ = opening
+    raw = encode_board(board)
+    assert len(raw) == 28
+    assert raw[0] == 2 and raw[23] == -2
+    assert raw[24:] == [0, 0, 0, 0]
+    assert encode_boards([board, board]).shape == (2, 28)
+
+
+def test_opening_features_are_symmetric(opening):
+    """Verifica que la posición inicial se ve igual desde ambos colores."""
+    board, _, _ = opening
+    raw = encode_boards([board])
+    white = extract_features(raw, "W")
+    black = extract_features(raw, "B")
+    assert white.shape == (1, FEATURE_COUNT)
+    np.testing.assert_allclose(white, black)
+    assert _feature(white, "own_pips")[0] == pytest.approx(1.0)
+    assert _feature(white, "own_points")[0] == pytest.approx(4 / 12)
+
+
+def test_blots_and_primes_features():
+    """Verifica el conteo de blots y el largo del prime."""
+    board, p1, p2 = Board(), Player("W", "W"), Player("B", "B")
+    for point in (3, 4, 5, 6):
+        board.place_checker(point, p1)
+        board.place_checker(point, p1)
+    board.place_checker(10, p1)
+    board.place_checker(20, p2)
+    features = extract_features(encode_boards([board]), "W")
+    assert _feature(features, "own_prime")[0] == pytest.approx(4 / 6)
+    assert _feature(features, "own_blots")[0] == pytest.approx(1 / 15)
+    assert _feature(features, "opp_blots")[0] == pytest.approx(1 / 15)
+
+
+def test_evaluate_plays_matches_board_by_board(opening):
+    """Verifica que la evaluación por lote coincide con evaluar cada tablero."""
+    board, p1, _ = opening
+    plays = generate_plays(board, p1, [6, 5])
+    before = board.get_hash()
+    evaluator = HeuristicEvaluator()
+    scores = evaluate_plays(board, p1, plays, evaluator)
+    assert board.get_hash() == before
+    boards = []
+    for play in plays:
+        clone = board.copy()
+        for move in play:
+            apply_move(clone, p1, move)
+        boards.append(clone)
+    np.testing.assert_allclose(scores, evaluate_boards(boards, "W", evaluator), rtol=1e-6)
+
+
+def test_heuristic_prefers_hitting_and_safety():
+    """Verifica que el evaluador heurístico prefiere golpear a dejar blots."""
+    board, p1, p2 = Board(), Player("W", "W"), Player("B", "B")
+    board.place_checker(0, p1)
+    board.place_checker(0, p1)
+    board.place_checker(4, p2)
+    board.place_checker(12, p2)
+    board.place_checker(12, p2)
+    plays = generate_plays(board, p1, [4, 1])
+    best = EvaluatorPolicy(0).choose_play(board, p1, plays)
+    assert (0, 4) in best
+
+
+def test_mlp_evaluator_batch_and_save(tmp_path, opening):
+    """Verifica la red neuronal: forma de la salida y guardado/carga."""
+    board, _, _ = opening
+    evaluator = MLPEvaluator.random(hidden=8, seed=1)
+    features = extract_features(encode_boards([board] * 5), "W")
+    scores = evaluator.evaluate(features)
+    assert scores.shape == (5,)
+    assert np.all(np.abs(scores) <= 1)
+    path = tmp_path / "red.npz"
+    evaluator.save(str(path))
+    np.testing.assert_allclose(MLPEvaluator.load(str(path)).evaluate(features), scores)
+
+
+def test_invalid_weights_raise_error():
+    """Verifica que pesos con forma incorrecta lanzan ValueError."""
+    with pytest.raises(ValueError):
+        LinearEvaluator(np.zeros(3))
+    with pytest.raises(ValueError):
+        MLPEvaluator(np.zeros((3, 2)), np.zeros(2), np.zeros(2))
@@ -3,6 +3,7 @@ from unittest.mock import patch
 from core.game import BackgammonGame
 from core.board import Board
 from core.player import Player
+from core.dice import Dice
 
 
 def test_game_initialization():
@@ -167,3 +168,58 @@ def test_make_move_from_bar(mock_roll):
     assert result is True
     assert board.get_bar("W") == 0
     assert board.get_point(2)[0] == p1
+
+
+def test_game_uses_injected_dice():
+    """Verifica que el juego usa los dados recibidos, por ejemplo una secuencia grabada."""
+    from core.dice import Dice
+    dice = Dice(sequence=[(6, 1), (2, 2)])
+    game = BackgammonGame(dice=dice)
+    assert game.get_dice() is dice
+    assert game.roll_dice() == [6, 1]
+    assert game.roll_dice() == [2, 2, 2, 2]
+
+
+def test_game_setup_position_sets_turn_and_dice():
+    """Verifica que se puede cargar una posición con turno y dados restantes."""
+    game = BackgammonGame()
+    counts = [0] * 24
+    counts[20], counts[3] = 2, -1
+    game.setup_position(counts, (0, 1), "B", [4])
+    assert game.get_current_player() is game.get_player2()
+    assert game.get_remaining_moves() == [4]
+    assert game.get_board().get_bar("B") == 1
+    with pytest.raises(ValueError):
+        game.setup_position(counts, color="X")
+
+
+def test_iter_legal_moves_uses_make_move_numbering():
+    """Verifica que los movimientos del juego usan la numeración 1-24 y se pueden filtrar por origen."""
+    game = BackgammonGame()
+    game.setup_position(game.get_board().get_counts(), color="W", remaining_moves=[6, 5])
+    moves = list(game.iter_legal_moves())
+    assert moves[0] == (1, 6) and set(moves) == set(game.get_legal_moves())
+    assert list(game.iter_legal_moves(12)) == [(12, 5), (12, 6)]
+    for from_point, die_value in moves:
+        assert game.get_board().is_valid_move(game.get_current_player(), from_point - 1, die_value)
+
+
+def test_has_valid_moves_stops_at_first_move():
+    """Verifica que ``has_valid_moves`` se detiene en el primer movimiento válido."""
+    game = BackgammonGame()
+    game.setup_position(game.get_board().get_counts(), color="W", remaining_moves=[4, 3])
+    with patch.object(Board, "is_valid_move", autospec=True, side_effect=Board.is_valid_move) as spy:
+        assert game.has_valid_moves() is True
+    assert spy.call_count == 1
+
+
+def test_play_turn_with_doubles_left_mid_turn():
+    """Verifica que a mitad de un doble el bot juega sólo los dados que quedan."""
+    from core.policies import RandomPolicy
+    game = BackgammonGame(dice=Dice(sequence=[(3, 3)]))
+    game.roll_dice()
+    assert game.make_move(1, 3) and game.make_move(1, 3)
+    assert game.get_remaining_moves() == [3, 3]
+    play = game.play_turn(RandomPolicy(0))
+    assert len(play) == 2
+    assert game.get_remaining_moves() == []
@@ -0,0 +1,84 @@
+import pstats
+
+import pytest
+
+from core.board import Board
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.instrumentation import EngineProfiler, Histogram
+
+
+def test_disabled_profiler_leaves_methods_untouched():
+    """Verifica que sin activar la instrumentación los métodos son los originales."""
+    original = Board.__dict__["is_valid_move"]
+    profiler = EngineProfiler()
+    assert Board.__dict__["is_valid_move"] is original
+    with profiler:
+        assert Board.__dict__["is_valid_move"] is not original
+    assert Board.__dict__["is_valid_move"] is original
+    assert not profiler.is_enabled()
+
+
+def test_counts_calls_and_time():
+    """Verifica que se cuentan las llamadas y el tiempo de cada método."""
+    game = BackgammonGame(dice=Dice(sequence=[(3, 1)]))
+    game.roll_dice()
+    with EngineProfiler() as profiler:
+        game.has_valid_moves()
+        game.make_move(1, 1)
+    stats = profiler.get_stats()
+    assert stats["BackgammonGame.has_valid_moves"]["calls"] == 1
+    assert stats["BackgammonGame.make_move"]["calls"] == 1
+    assert stats["Board.make_move"]["calls"] == 1
+    assert stats["Board.is_valid_move"]["calls"] > 0
+    assert stats["BackgammonGame.make_move"]["seconds"] > 0
+
+
+def test_turn_histogram_counts_nested_calls_once():
+    """Verifica que cada turno registra sólo el tiempo de las llamadas de primer nivel."""
+    game = BackgammonGame(dice=Dice(sequence=[(3, 1), (6, 5)]))
+    with EngineProfiler() as profiler:
+        for _ in range(2):
+            game.roll_dice()
+            game.has_valid_moves()
+            game.switch_player()
+    turns = profiler.get_turn_histogram()
+    stats = profiler.get_stats()
+    assert turns.get_count() == 2
+    assert turns.get_total() == pytest.approx(stats["BackgammonGame.has_valid_moves"]["seconds"])
+
+
+def test_two_profilers_cannot_overlap():
+    """Verifica que no se puede instrumentar dos veces el mismo método."""
+    with EngineProfiler():
+        with pytest.raises(RuntimeError):
+            EngineProfiler().enable()
+
+
+def test_report_and_cprofile_dump(tmp_path):
+    """Verifica el informe de texto y que el volcado se puede leer con pstats."""
+    path = str(tmp_path / "engine.pstats")
+    game = BackgammonGame(dice=Dice(sequence=[(6, 4)]))
+    with EngineProfiler(profile=True) as profiler:
+        game.roll_dice()
+        game.has_valid_moves()
+    assert "BackgammonGame.has_valid_moves" in profiler.report()
+    profiler.dump_profile(path)
+    assert pstats.Stats(path).total_calls > 0
+
+
+def test_dump_without_cprofile_raises(tmp_path):
+    """Verifica que no se puede volcar cProfile si no se perfiló."""
+    with pytest.raises(RuntimeError):
+        EngineProfiler().dump_profile(str(tmp_path / "x.pstats"))
+
+
+def test_histogram_buckets_and_percentiles():
+    """Verifica los intervalos que se duplican y la cota de los percentiles."""
+    histogram = Histogram()
+    for seconds in (0.5e-6, 3e-6, 3e-6, 100e-6):
+        histogram.add(seconds)
+    assert histogram.get_buckets() == [(1, 1), (4, 2), (128, 1)]
+    assert histogram.percentile(0.5) == pytest.approx(4e-6)
+    assert histogram.percentile(0.99) == pytest.approx(128e-6)
+    assert Histogram().percentile(0.5) == 0.0
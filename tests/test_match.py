@@ -0,0 +1,123 @@
+import pytest
+
+from core.game import BackgammonGame
+from core.match import Match, play_match, win_probability
+from core.met import MatchEquityTable
+from core.policies import PipCountPolicy
+from core.search import load_board
+
+
+@pytest.fixture(scope="module")
+def table():
+    """Fixture con una tabla de 11 puntos generada en memoria."""
+    return MatchEquityTable(11)
+
+
+def _finish(match, winner, gammon=False):
+    """Deja el juego en curso terminado a favor de ``winner`` y lo anota."""
+    counts = [0] * 24
+    if winner == "W":
+        counts[5 if gammon else 0] = -15 if gammon else -14
+    else:
+        counts[18 if gammon else 23] = 15 if gammon else 14
+    match.get_game().setup_position(counts)
+    return match.finish_game()
+
+
+def test_new_match_state(table):
+    """Verifica el marcador, el cubo centrado y la equity inicial."""
+    match = Match(5, table=table)
+    assert match.get_away("W") == match.get_away("B") == 5
+    assert match.get_cube() == 1 and match.get_cube_owner() is None
+    assert match.get_match_equity("W") == pytest.approx(0.5)
+    with pytest.raises(ValueError):
+        Match(12, table=table)
+
+
+def test_double_take_and_drop(table):
+    """Verifica que aceptar duplica el cubo y lo entrega, y que abandonar da los puntos del cubo."""
+    match = Match(7, table=table)
+    assert match.can_double("W") and not match.can_double("B")
+    match.double("W")
+    with pytest.raises(ValueError):
+        match.double("W")
+    match.take()
+    assert match.get_cube() == 2 and match.get_cube_owner() == "B"
+    assert not match.can_double("W")
+    match.get_game().switch_player()
+    match.double("B")
+    assert match.drop() == 2
+    assert match.get_score("B") == 2 and match.get_games() == 1
+    with pytest.raises(ValueError):
+        match.take()
+
+
+def test_gammon_scores_by_cube(table):
+    """Verifica que un gammon con el cubo en 2 vale 4 puntos."""
+    match = Match(7, table=table)
+    match.double("W")
+    match.take()
+    assert _finish(match, "W", gammon=True) == 4
+    assert match.get_score("W") == 4
+    match.new_game()
+    assert match.get_cube() == 1 and match.get_cube_owner() is None
+    with pytest.raises(ValueError):
+        match.finish_game()
+
+
+def test_crawford_rule(table):
+    """Verifica que el juego Crawford se juega sin cubo y los siguientes con cubo."""
+    match = Match(3, table=table)
+    _finish(match, "W", gammon=True)
+    assert match.is_crawford_game() and not match.is_post_crawford()
+    match.new_game()
+    assert not match.can_double("W")
+    _finish(match, "B")
+    assert match.is_post_crawford() and not match.is_crawford_game()
+    match.new_game()
+    assert match.can_double("W")
+    assert match.get_match_equity("B") == pytest.approx(table.equity(2, 1, post_crawford=True))
+    _finish(match, "W")
+    assert match.is_over() and match.get_winner() == "W"
+    with pytest.raises(ValueError):
+        match.new_game()
+
+
+def test_without_crawford_rule(table):
+    """Verifica que sin la regla Crawford se puede doblar apenas alguien queda a 1 punto."""
+    match = Match(3, table=table, crawford=False)
+    _finish(match, "W", gammon=True)
+    match.new_game()
+    assert match.can_double("W") and match.is_post_crawford()
+
+
+def test_cube_decisions_follow_table(table):
+    """Verifica dobles y aceptaciones en casos claros y el valor de abandonar."""
+    match = Match(7, table=table)
+    weak = match.cube_decision("W", 0.5)
+    assert not weak["double"] and weak["take"]
+    strong = match.cube_decision("W", 0.8)
+    assert strong["double"] and not strong["take"]
+    assert strong["double_pass"] == pytest.approx(table.equity(6, 7))
+    assert match.should_take("B", 0.4)
+    assert not match.should_take("B", 0.05)
+
+
+def test_win_probability_uses_race_or_evaluator():
+    """Verifica que la estimación está entre 0 y 1 y que en una carrera segura es 1."""
+    game = BackgammonGame()
+    assert 0 < win_probability(game.get_board(), "W") < 1
+    counts = [0] * 24
+    counts[23], counts[0] = 1, -15
+    board = load_board(counts, (0, 0))[0]
+    assert win_probability(board, "W") == pytest.approx(1.0, abs=1e-3)
+
+
+def test_play_match_is_reproducible(table):
+    """Verifica que un partido entre bots termina y se repite con la misma semilla."""
+    first = play_match(PipCountPolicy(1), PipCountPolicy(2), 3, seed=5, table=table)
+    second = play_match(PipCountPolicy(1), PipCountPolicy(2), 3, seed=5, table=table)
+    assert first == second
+    assert first["winner"] in ("W", "B")
+    winner_score = first["white_score"] if first["winner"] == "W" else first["black_score"]
+    assert winner_score >= 3
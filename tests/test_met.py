@@ -0,0 +1,66 @@
+import pytest
+
+from core.met import MatchEquityTable, build_table, game_value, save_table
+
+
+@pytest.fixture(scope="module")
+def table():
+    """Fixture con una tabla de 11 puntos generada en memoria."""
+    return MatchEquityTable(11)
+
+
+def test_table_is_symmetric_and_bounded(table):
+    """Verifica que la equity de un marcador y la del marcador inverso suman 1."""
+    for away in range(1, 12):
+        for opponent_away in range(1, 12):
+            value = table.equity(away, opponent_away)
+            assert 0 < value < 1
+            assert value + table.equity(opponent_away, away) == pytest.approx(1.0)
+    assert table.equity(7, 7) == pytest.approx(0.5)
+
+
+def test_table_is_monotonic(table):
+    """Verifica que estar más cerca de ganar siempre da más equity."""
+    for away in range(1, 11):
+        for opponent_away in range(1, 12):
+            assert table.equity(away, opponent_away) > table.equity(away + 1, opponent_away)
+
+
+def test_known_scores(table):
+    """Verifica valores de referencia: Crawford, post-Crawford y marcadores ganados."""
+    assert 0.55 < table.equity(2, 3) < 0.65
+    assert 0.65 < table.equity(1, 2) < 0.72
+    assert table.equity(1, 2, post_crawford=True) == pytest.approx(0.5)
+    assert table.equity(1, 1, post_crawford=True) == pytest.approx(0.5)
+    assert table.equity(0, 5) == 1.0 and table.equity(5, -1) == 0.0
+    with pytest.raises(IndexError):
+        table.equity(12, 3)
+
+
+def test_game_value_without_cube_is_plain_average():
+    """Verifica que sin cubo la equity es el promedio de ganar y perder el juego."""
+    after = {(0, 2): 1.0, (-1, 2): 1.0, (-2, 2): 1.0, (1, 1): 0.5, (1, 0): 0.0, (1, -1): 0.0}
+    value = game_value(1, 2, lambda a, b: after[(a, b)], cube=False)
+    single = 1 - 0.26 - 0.01
+    assert value == pytest.approx(0.5 + 0.5 * (single * 0.5))
+
+
+def test_save_and_load_round_trip(tmp_path):
+    """Verifica que la tabla guardada en disco se lee con los mismos valores."""
+    path = tmp_path / "met.bin"
+    save_table(str(path), 9, 0.2, 0.0)
+    loaded = MatchEquityTable.load(str(path))
+    pre, post = build_table(9, 0.2, 0.0)
+    assert loaded.get_length() == 9
+    assert loaded.get_gammon_rate() == pytest.approx(0.2)
+    assert loaded.equity(4, 6) == pytest.approx(pre[4 * 10 + 6], abs=1e-6)
+    assert loaded.equity(1, 6, True) == pytest.approx(post[6], abs=1e-6)
+    path.write_bytes(b"XXXX" + path.read_bytes()[4:])
+    with pytest.raises(ValueError):
+        MatchEquityTable.load(str(path))
+
+
+def test_default_table_is_shared():
+    """Verifica que la tabla por defecto se genera una sola vez."""
+    assert MatchEquityTable.default() is MatchEquityTable.default()
+    assert MatchEquityTable.default().get_length() >= 25
@@ -0,0 +1,252 @@
+import itertools
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.search import load_board
+from core.moves import LegalMoveCache, generate_plays, apply_move, position_key, legal_single_moves
+from core.player import Player
+
+
+@pytest.fixture
+def board_with_players():
+    """Fixture para crear un tablero con dos jugadores."""
+    board = Board()
+    player1 = Player("Alice", "W")
+    player2 = Player("Bob", "B")
+    return board, player1, player2
+
+
+def _final_position(board, player, play):
+    """Aplica una jugada sobre una copia y devuelve la clave de la posición."""
+    clone = board.copy()
+    for move in play:
+        apply_move(clone, player, move)
+    return position_key(clone)
+
+
+def _brute_force_positions(board, player, dice):
+    """Referencia: todas las permutaciones de dados sin poda ni deduplicación."""
+    sequences = []
+
+    def search(current, remaining, play):
+        moves = legal_single_moves(current, player, remaining[0]) if remaining else []
+        if not moves:
+            sequences.append((current, play))
+            return
+        for move in moves:
+            child = current.copy()
+            apply_move(child, player, move)
+            search(child, remaining[1:], play + (move,))
+
+    for order in set(itertools.permutations(dice)):
+        search(board, order, ())
+    longest = max(len(play) for _, play in sequences)
+    finals = [(b, play) for b, play in sequences if len(play) == longest]
+    if longest == 1 and len(set(dice)) == 2:
+        largest = max(play[0][1] for _, play in finals)
+        finals = [(b, play) for b, play in finals if play[0][1] == largest]
+    return {position_key(b) for b, play in finals if play}
+
+
+def test_opening_roll_has_distinct_plays(board_with_players):
+    """Verifica que las jugadas de apertura llevan a posiciones distintas."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    plays = generate_plays(board, p1, [3, 1])
+    positions = [_final_position(board, p1, play) for play in plays]
+    assert len(positions) == len(set(positions))
+    assert all(len(play) == 2 for play in plays)
+    assert ((16, 3), (18, 1)) in plays or ((18, 1), (16, 3)) in plays
+
+
+def test_same_checker_orders_are_deduplicated(board_with_players):
+    """Verifica que 6-1 y 1-6 con la misma ficha cuentan una sola vez."""
+    board, p1, _ = board_with_players
+    board.place_checker(0, p1)
+    plays = generate_plays(board, p1, [6, 1])
+    assert len(plays) == 1
+    assert _final_position(board, p1, plays[0])[0][7] == 1
+
+
+def test_larger_die_must_be_played(board_with_players):
+    """Verifica que si sólo se puede usar un dado se exige el mayor."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(7, p2)
+    board.place_checker(7, p2)
+    assert generate_plays(board, p1, [1, 6]) == [((0, 6),)]
+
+
+def test_both_dice_must_be_used(board_with_players):
+    """Verifica que se descartan jugadas que usan un solo dado si hay de dos."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(6, p2)
+    board.place_checker(6, p2)
+    plays = generate_plays(board, p1, [6, 1])
+    assert plays == [((0, 1), (1, 6))]
+
+
+def test_doubles_use_four_moves(board_with_players):
+    """Verifica que los dobles generan jugadas de cuatro movimientos."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    plays = generate_plays(board, p1, [1, 1, 1, 1])
+    assert plays and all(len(play) == 4 for play in plays)
+
+
+def test_single_move_keeps_larger_die_for_shared_position():
+    """Verifica que si ambos dados llevan a la misma posición se conserva la jugada con el mayor."""
+    counts = [0] * 24
+    counts[23], counts[0] = 1, -15
+    board, players = load_board(counts, (0, 0))
+    assert generate_plays(board, players["W"], [1, 6]) == [((23, 6),)]
+    assert generate_plays(board, players["W"], [6, 1]) == [((23, 6),)]
+    counts[23], counts[22] = 0, 1
+    board, players = load_board(counts, (0, 0))
+    assert generate_plays(board, players["W"], [2, 6]) == [((22, 6),)]
+
+
+def test_remaining_doubles_use_only_the_moves_left(board_with_players):
+    """Verifica que dos dados iguales son los dos movimientos que quedan de un doble, no cuatro."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    plays = generate_plays(board, p1, [1, 1])
+    assert plays and all(len(play) == 2 for play in plays)
+
+
+def test_bar_checkers_enter_first(board_with_players):
+    """Verifica que las fichas en la barra se reingresan antes de mover otras."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(10, p1)
+    board.place_checker(3, p2)
+    board.move_checker(p2, 3, 3)
+    plays = generate_plays(board, p1, [4, 2])
+    assert plays
+    assert all(play[0][0] == 25 for play in plays)
+
+
+def test_no_legal_plays_returns_empty_list(board_with_players):
+    """Verifica que sin movimientos posibles se devuelve una lista vacía."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(10, p1)
+    board.place_checker(3, p2)
+    board.move_checker(p2, 3, 3)
+    for point in range(1, 6):
+        board.place_checker(point, p2)
+        board.place_checker(point, p2)
+    assert generate_plays(board, p1, [3, 5]) == []
+    assert generate_plays(board, p1, []) == []
+
+
+@pytest.mark.parametrize("board_class", [Board, CompactBoard])
+def test_matches_brute_force_on_random_positions(board_class):
+    """Verifica contra una búsqueda exhaustiva sobre posiciones de partidas aleatorias."""
+    rng = random.Random(3)
+    p1, p2 = Player("Alice", "W"), Player("Bob", "B")
+    board = board_class()
+    board.setup_initial_checkers(p1, p2)
+    player, other = p1, p2
+    for _ in range(40):
+        d1, d2 = rng.randint(1, 6), rng.randint(1, 6)
+        dice = [d1, d2] * (2 if d1 == d2 else 1)
+        plays = generate_plays(board, player, dice)
+        positions = {_final_position(board, player, play) for play in plays}
+        assert len(positions) == len(plays)
+        if plays:
+            assert positions == _brute_force_positions(board, player, dice)
+            for move in rng.choice(plays):
+                apply_move(board, player, move)
+        player, other = other, player
+
+
+def test_cache_evicts_least_recently_used():
+    """Verifica el desalojo LRU y las estadísticas de la caché."""
+    cache = LegalMoveCache(max_size=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    cache.put("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+    assert cache.get_stats() == {"hits": 2, "misses": 1, "evictions": 1, "size": 2, "max_size": 2}
+    with pytest.raises(ValueError):
+        LegalMoveCache(max_size=0)
+
+
+def test_cache_peek_does_not_count():
+    """Verifica que ``peek`` consulta la caché sin alterar las estadísticas."""
+    cache = LegalMoveCache()
+    assert cache.peek("a") is None
+    cache.put("a", 1)
+    assert cache.peek("a") == 1
+    assert cache.get_stats()["hits"] == 0
+    assert cache.get_stats()["misses"] == 0
+
+
+def test_has_valid_moves_does_not_skew_cache_stats():
+    """Verifica que ``has_valid_moves`` no suma aciertos ni fallos a la caché."""
+    game = BackgammonGame(dice=Dice(sequence=[(6, 5)]))
+    game.roll_dice()
+    assert game.has_valid_moves()
+    assert game.get_move_cache().get_stats()["misses"] == 0
+    game.get_legal_moves()
+    assert game.has_valid_moves()
+    assert game.get_move_cache().get_stats()["misses"] == 1
+    assert game.get_move_cache().get_stats()["hits"] == 0
+
+
+def test_cached_plays_match_and_are_independent_copies(board_with_players):
+    """Verifica que la caché devuelve las mismas jugadas sin compartir la lista."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    cache = LegalMoveCache()
+    first = generate_plays(board, p1, [3, 1], cache)
+    first.clear()
+    second = generate_plays(board, p1, [1, 3], cache)
+    assert sorted(second) == sorted(generate_plays(board, p1, [3, 1]))
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_game_cache_is_invalidated_by_board_changes():
+    """Verifica que mover fichas o reiniciar el tablero no reutiliza resultados viejos."""
+    game = BackgammonGame(dice=Dice(sequence=[(6, 5)]))
+    board, white = game.get_board(), game.get_player1()
+    game.roll_dice()
+    opening = game.get_legal_moves()
+    assert game.get_legal_moves() == opening
+    assert game.get_move_cache().get_stats()["hits"] == 1
+
+    board.move_checker(white, 0, 6)
+    assert game.get_legal_moves() != opening
+
+    board.setup_initial_checkers(white, game.get_player2())
+    assert game.get_legal_moves() == opening
+
+
+def test_game_legal_moves_match_board_validation():
+    """Verifica que has_valid_moves con caché coincide con la validación del tablero."""
+    rng = random.Random(9)
+    game = BackgammonGame()
+    board = game.get_board()
+    for _ in range(150):
+        player = game.get_current_player()
+        dice = game.roll_dice()
+        expected = {
+            (25 if from_point == 25 else from_point + 1, die)
+            for die in set(dice) for from_point, _ in legal_single_moves(board, player, die)
+        }
+        assert set(game.get_legal_moves()) == expected
+        assert game.has_valid_moves() == bool(expected)
+        plays = generate_plays(board, player, dice)
+        if plays:
+            for from_point, die in rng.choice(plays):
+                assert game.make_move(25 if from_point == 25 else from_point + 1, die)
+        if game.check_winner():
+            break
+        game.switch_player()
@@ -0,0 +1,120 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.game import BackgammonGame
+from core.moves import generate_plays, apply_move
+from core.player import Player
+from core.position_id import (
+    decode_game, decode_position, decode_position_bytes, decode_turn, encode_game,
+    encode_position, encode_position_bytes, encode_turn,
+)
+
+
+def _random_positions(count, seed):
+    """Devuelve tableros tomados de partidas al azar."""
+    rng = random.Random(seed)
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.setup_initial_checkers(p1, p2)
+    player, other = p1, p2
+    positions = []
+    while len(positions) < count:
+        plays = generate_plays(board, player, [rng.randint(1, 6), rng.randint(1, 6)])
+        if plays:
+            for move in rng.choice(plays):
+                apply_move(board, player, move)
+        positions.append(board.copy())
+        if board.has_won(player):
+            board.setup_initial_checkers(p1, p2)
+        player, other = other, player
+    return positions
+
+
+def test_opening_matches_gnubg_position_id():
+    """Verifica que la posición inicial tiene el ID conocido de GNU Backgammon."""
+    game = BackgammonGame()
+    assert encode_position(game.get_board()) == "4HPwATDgc/ABMA"
+    assert len(encode_position_bytes(game.get_board().get_counts())) == 10
+
+
+@pytest.mark.parametrize("board_class", [Board, CompactBoard])
+def test_position_round_trip(board_class):
+    """Verifica que codificar y decodificar reproduce exactamente la posición."""
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    for board in _random_positions(300, 4):
+        counts, bar = decode_position(encode_position(board))
+        assert counts == board.get_counts()
+        assert bar == (board.get_bar("W"), board.get_bar("B"))
+        loaded = board_class()
+        loaded.setup_position(p1, p2, counts, bar)
+        assert loaded.get_hash() == board.get_hash()
+        assert loaded.get_borne_off("W") == board.get_borne_off("W")
+
+
+def test_position_ids_differ_between_positions():
+    """Verifica que posiciones distintas producen IDs distintos."""
+    boards = _random_positions(300, 8)
+    by_hash = {board.get_hash(): encode_position(board) for board in boards}
+    assert len(set(by_hash.values())) == len(by_hash)
+
+
+def test_invalid_position_ids():
+    """Verifica que los IDs mal formados lanzan ValueError."""
+    with pytest.raises(ValueError):
+        decode_position("no es base64!")
+    with pytest.raises(ValueError):
+        decode_position("AAAA")
+    with pytest.raises(ValueError):
+        decode_position_bytes(b"\xff" * 10)
+    white = "10" + "0" * 23 + "0"
+    black = "0" * 23 + "10" + "0"
+    overlapping = int((white + black)[::-1], 2).to_bytes(10, "little")
+    with pytest.raises(ValueError):
+        decode_position_bytes(overlapping)
+
+
+@pytest.mark.parametrize("remaining", [[], [3], [6, 1], [1, 6], [4, 4, 4, 4], [2, 2, 2], [5, 5]])
+@pytest.mark.parametrize("color", ["W", "B"])
+def test_turn_round_trip(color, remaining):
+    """Verifica que el ID de turno guarda el color y los dados restantes."""
+    decoded_color, decoded = decode_turn(encode_turn(color, remaining))
+    assert decoded_color == color
+    assert decoded == remaining
+
+
+def test_too_many_checkers_raise_value_error():
+    """Verifica que codificar más de 15 fichas de un color lanza ValueError."""
+    counts = [0] * 24
+    counts[0], counts[23] = 15, -15
+    with pytest.raises(ValueError):
+        encode_position_bytes(counts, (1, 0))
+    counts[0] = 16
+    with pytest.raises(ValueError):
+        encode_position_bytes(counts)
+
+
+def test_invalid_turns():
+    """Verifica que dados imposibles lanzan ValueError."""
+    with pytest.raises(ValueError):
+        encode_turn("W", [1, 2, 3])
+    with pytest.raises(ValueError):
+        encode_turn("W", [7])
+    with pytest.raises(ValueError):
+        decode_turn("////")
+
+
+def test_game_round_trip():
+    """Verifica que una partida se restaura con su turno y dados."""
+    from core.dice import Dice
+    game = BackgammonGame(dice=Dice(sequence=[(2, 2)]))
+    game.switch_player()
+    game.roll_dice()
+    assert game.make_move(24, 2)
+    position_id, turn_id = encode_game(game)
+    restored = decode_game(position_id, turn_id)
+    assert restored.get_current_player().get_color() == "B"
+    assert restored.get_remaining_moves() == [2, 2, 2]
+    assert restored.get_board().get_counts() == game.get_board().get_counts()
+    assert restored.get_board().get_point(21) == [restored.get_player2()]
+    assert encode_game(restored) == (position_id, turn_id)
@@ -0,0 +1,132 @@
+import random
+
+import numpy as np
+import pytest
+
+from benchmarks.bench_race import build_races
+from core.bearoff import BearoffDatabase, build_database
+from core.board import Board
+from core.dice import AVERAGE_PIPS
+from core.evaluation import encode_boards
+from core.moves import generate_plays
+from core.player import Player
+from core.policies import EvaluatorPolicy, ExpectiminimaxPolicy
+from core.race import (
+    WASTAGE_BASE, WASTAGE_PER_POINT, contact_mask, effective_pip_count, has_contact, kleinman,
+    race_play_values, race_win_probabilities, race_win_probability,
+)
+from core.search import load_board
+
+
+@pytest.fixture(scope="module")
+def database(tmp_path_factory):
+    """Fixture con una base de datos chica (hasta 6 fichas) generada en disco."""
+    path = tmp_path_factory.mktemp("race") / "bearoff.db"
+    build_database(str(path), max_checkers=6)
+    db = BearoffDatabase(str(path))
+    yield db
+    db.close()
+
+
+def _board(white, black, bar=(0, 0)):
+    counts = [0] * 24
+    for point, count in white.items():
+        counts[point] = count
+    for point, count in black.items():
+        counts[point] = -count
+    return load_board(counts, bar)
+
+
+def test_initial_position_has_contact():
+    """Verifica que la posición inicial tiene contacto."""
+    board, white, black = Board(), Player("W", "W"), Player("B", "B")
+    board.setup_initial_checkers(white, black)
+    assert has_contact(board)
+
+
+def test_race_and_bar_contact():
+    """Verifica la detección de contacto con fichas cruzadas y con fichas en la barra."""
+    assert not has_contact(_board({12: 15}, {11: 15})[0])
+    assert has_contact(_board({10: 1, 20: 14}, {11: 15})[0])
+    assert has_contact(_board({20: 14}, {5: 15}, bar=(1, 0))[0])
+
+
+def test_contact_mask_matches_single_board():
+    """Verifica que la versión por lotes coincide con ``has_contact``."""
+    rng = random.Random(3)
+    boards = build_races(50, seed=1)
+    for _ in range(50):
+        counts = [0] * 24
+        for _ in range(14):
+            counts[rng.randrange(24)] += 1
+        for point in rng.sample(range(24), 5):
+            if counts[point] == 0:
+                counts[point] = -3
+        boards.append(load_board(counts, (rng.randint(0, 1), 0))[0])
+    assert contact_mask(encode_boards(boards)).tolist() == [has_contact(board) for board in boards]
+
+
+def test_effective_pip_count_from_wastage_table():
+    """Verifica el EPC estimado con la tabla de desperdicio y el de un color que ya retiró todo."""
+    board = _board({20: 2, 14: 1}, {0: 3})[0]
+    expected = board.pip_count("W") + WASTAGE_BASE + 2 * WASTAGE_PER_POINT[3] + WASTAGE_PER_POINT[5]
+    assert effective_pip_count(board, "W") == pytest.approx(expected)
+    assert effective_pip_count(_board({}, {0: 3})[0], "W") == 0.0
+
+
+def test_effective_pip_count_from_database(database):
+    """Verifica que con la base el EPC es exacto: tiradas esperadas por pips por tirada."""
+    board = _board({22: 2, 19: 1}, {0: 3})[0]
+    assert effective_pip_count(board, "W", database) == pytest.approx(
+        database.expected_rolls((0, 2, 0, 0, 1, 0)) * AVERAGE_PIPS, rel=1e-6)
+
+
+def test_exact_probabilities_from_database(database):
+    """Verifica los casos seguros y la ventaja de tirar primero con posiciones iguales."""
+    assert race_win_probability(_board({23: 1}, {0: 1})[0], "W", database) == pytest.approx(1.0, abs=1e-3)
+    assert race_win_probability(_board({23: 1}, {5: 6})[0], "W", database) == pytest.approx(1.0, abs=1e-3)
+    assert race_win_probability(_board({23: 1}, {5: 6})[0], "B", database) < 0.1
+    rolls = np.array(database.roll_distribution((0, 0, 0, 0, 0, 1)))
+    expected = sum(rolls[n] * rolls[n:].sum() for n in range(len(rolls)))
+    assert race_win_probability(_board({18: 1}, {5: 1})[0], "W", database) == pytest.approx(expected, abs=1e-3)
+    assert expected > 0.5
+
+
+def test_kleinman_properties():
+    """Verifica que la fórmula favorece a quien tira con EPC iguales y crece con la ventaja."""
+    even = kleinman(np.array([100.0]), np.array([100.0]))[0]
+    assert 0.5 < even < 0.6
+    probabilities = kleinman(np.full(5, 100.0), np.array([90.0, 95.0, 100.0, 105.0, 110.0]))
+    assert np.all(np.diff(probabilities) > 0)
+
+
+def test_batch_matches_single_and_rejects_contact(database):
+    """Verifica que el lote coincide con las posiciones sueltas y que no acepta posiciones con contacto."""
+    boards = build_races(30, seed=2)
+    batch = race_win_probabilities(encode_boards(boards), "B", database)
+    assert batch == pytest.approx([race_win_probability(board, "B", database) for board in boards])
+    assert np.all((batch >= 0) & (batch <= 1))
+    board, white, black = Board(), Player("W", "W"), Player("B", "B")
+    board.setup_initial_checkers(white, black)
+    with pytest.raises(ValueError):
+        race_win_probability(board, "W")
+
+
+def test_race_play_values_prefer_finishing():
+    """Verifica que la jugada que retira la última ficha vale 1 y es la mejor."""
+    board, players = _board({22: 1, 23: 1}, {0: 5})
+    plays = generate_plays(board, players["W"], [2, 1])
+    values = race_play_values(board, players["W"], plays)
+    assert values.max() == 1.0
+    assert board.get_counts()[22] == 1 and board.get_counts()[23] == 1
+
+
+def test_policies_short_circuit_races():
+    """Verifica que los bots eligen en las carreras la mejor jugada según ``core.race``."""
+    board, players = _board({13: 3, 17: 4, 20: 4, 22: 4}, {11: 5, 6: 5, 2: 5})
+    plays = generate_plays(board, players["W"], [6, 5])
+    best = plays[int(np.argmax(race_play_values(board, players["W"], plays, BearoffDatabase.default())))]
+    assert EvaluatorPolicy(seed=0).choose_play(board, players["W"], plays) == best
+    policy = ExpectiminimaxPolicy(seed=0, depth=3)
+    assert policy.choose_play(board, players["W"], plays) == best
+    assert policy.get_stats()["nodes"] == len(plays)
@@ -0,0 +1,99 @@
+import io
+import pytest
+from core.compact_board import CompactBoard
+from core.dice import Dice
+from core.game import BackgammonGame
+from core.policies import PipCountPolicy, RandomPolicy
+from core.record import GameRecordWriter, read_events, replay
+from core.selfplay import play_game
+
+
+def _record_games(count, stream):
+    """Juega partidas entre bots anotándolas en ``stream`` y devuelve sus resultados."""
+    with GameRecordWriter(stream) as writer:
+        return [
+            play_game(PipCountPolicy(seed), RandomPolicy(seed + 1), seed, max_turns=60, recorder=writer)
+            for seed in range(count)
+        ]
+
+
+def test_writer_hooks_into_game_events():
+    """Verifica las líneas que produce una partida corta."""
+    stream = io.StringIO()
+    writer = GameRecordWriter(stream)
+    game = BackgammonGame(dice=Dice(sequence=[(6, 5)]), recorder=writer)
+    game.start_new_game("A", "B")
+    game.roll_dice()
+    assert game.make_move(1, 6)
+    assert game.make_move(7, 5)
+    game.switch_player()
+    writer.close()
+    assert stream.getvalue().splitlines() == ["N 4HPwATDgc/ABMA AAA", "R 65", "M 1 6 0", "M 7 5 0", "S"]
+    assert writer.get_record_count() == 5
+
+
+def test_replay_drops_used_dice():
+    """Verifica que en cada paso de la reproducción sólo quedan los dados sin usar."""
+    stream = io.StringIO()
+    game = BackgammonGame(dice=Dice(sequence=[(6, 5), (3, 3)]), recorder=GameRecordWriter(stream))
+    game.roll_dice()
+    assert game.make_move(1, 6) and game.make_move(7, 5)
+    game.switch_player()
+    game.roll_dice()
+    assert game.make_move(24, 3) and game.make_move(21, 3)
+    game.get_recorder().close()
+    stream.seek(0)
+    dice = [step.dice for step in replay(stream)]
+    assert dice == [(), (6, 5), (5,), (), (), (3, 3, 3, 3), (3, 3, 3), (3, 3)]
+
+
+def test_replay_reproduces_recorded_games():
+    """Verifica que la reproducción llega a las mismas posiciones y detecta golpes."""
+    stream = io.StringIO()
+    game = BackgammonGame(dice=Dice(seed=3), recorder=GameRecordWriter(stream))
+    boards = []
+    for _ in range(40):
+        game.roll_dice()
+        for from_point, die in game.get_legal_moves()[:1]:
+            game.make_move(from_point, die)
+        boards.append(game.get_board().get_counts())
+        game.switch_player()
+    game.get_recorder().close()
+
+    stream.seek(0)
+    replayed = [step.board.get_counts() for step in replay(stream) if step.event[0] == "S"]
+    assert replayed == boards
+
+
+@pytest.mark.parametrize("suffix", [".log", ".log.gz"])
+def test_replay_from_file_is_lazy_and_matches_games(tmp_path, suffix):
+    """Verifica escritura y lectura en archivos (también comprimidos) con varias partidas."""
+    path = str(tmp_path / f"partidas{suffix}")
+    results = _record_games(3, path)
+    steps = replay(path, board_class=CompactBoard)
+    first = next(steps)
+    assert first.event[0] == "N" and first.game_index == 0
+    last_index = first.game_index
+    winners = []
+    for step in steps:
+        last_index = step.game_index
+        if step.event[0] == "E":
+            winners.append(step.event[1])
+            assert step.board.get_borne_off(step.event[1]) == 15
+    assert last_index == 2
+    assert winners == [result["winner"] for result in results if result["winner"]]
+
+
+def test_read_events_rejects_bad_lines():
+    """Verifica que una línea mal formada lanza ValueError con su número."""
+    events = read_events(["R 31", "M 1 x 0"])
+    assert next(events) == ("R", 3, 1)
+    with pytest.raises(ValueError, match="Línea 2"):
+        next(events)
+
+
+def test_replay_detects_inconsistent_hit_flag():
+    """Verifica que un golpe anotado que no ocurre lanza ValueError."""
+    lines = ["N 4HPwATDgc/ABMA AAA", "R 65", "M 1 6 1"]
+    with pytest.raises(ValueError):
+        list(replay(lines))
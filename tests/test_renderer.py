@@ -0,0 +1,141 @@
+import os
+
+os.environ.setdefault("SDL_VIDEODRIVER", "dummy")
+
+import pygame  # noqa: E402
+import pytest  # noqa: E402
+
+from core.dice import Dice  # noqa: E402
+from core.game import BackgammonGame  # noqa: E402
+from pygame_ui.renderer import (  # noqa: E402
+    BAR_B, BAR_W, BAR_X, BEAR_OFF_X, HEIGHT, OFF_B, OFF_W, WIDTH, BoardRenderer, HitGrid, board_origin, destination, point_column,
+    point_region,
+)
+
+
+@pytest.fixture
+def renderer():
+    pygame.init()
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    yield BoardRenderer(screen)
+    pygame.quit()
+
+
+def test_first_frame_redraws_whole_screen(renderer):
+    """Verifica que el primer cuadro actualiza toda la pantalla."""
+    dirty = renderer.draw(BackgammonGame())
+    assert dirty == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+
+
+def test_unchanged_frame_updates_nothing(renderer):
+    """Verifica que si el estado no cambió no se redibuja nada."""
+    game = BackgammonGame()
+    renderer.draw(game)
+    assert renderer.draw(game) == []
+
+
+def test_move_updates_only_affected_regions(renderer):
+    """Verifica que un movimiento sólo redibuja los puntos de origen y destino y el panel."""
+    game = BackgammonGame(dice=Dice(sequence=[(3, 1)]))
+    game.roll_dice()
+    renderer.draw(game)
+    assert game.make_move(17, 3)
+    regions = renderer.get_regions()
+    dirty = renderer.draw(game)
+    assert sorted(map(tuple, dirty)) == sorted(map(tuple, [regions["point16"], regions["point19"], regions["info"]]))
+
+
+def test_overlay_change_redraws_whole_screen(renderer):
+    """Verifica que mostrar y quitar un aviso redibuja toda la pantalla."""
+    game = BackgammonGame()
+    renderer.draw(game)
+    assert len(renderer.draw(game, "Aviso")) == 1
+    assert renderer.draw(game, "Aviso") == []
+    assert renderer.draw(game) == [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+
+
+def test_text_surfaces_are_cached(renderer):
+    """Verifica que un mismo texto se renderiza una sola vez."""
+    assert renderer.get_text("Hola", 18, (0, 0, 0)) is renderer.get_text("Hola", 18, (0, 0, 0))
+    assert renderer.get_font(18) is renderer.get_font(18)
+
+
+def test_point_regions_do_not_overlap():
+    """Verifica que las regiones de los puntos no se superponen entre sí."""
+    regions = [point_region(idx) for idx in range(24)]
+    for i, first in enumerate(regions):
+        assert not any(first.colliderect(second) for second in regions[i + 1:])
+    assert point_column(0)[1] is False and point_column(12)[1] is True
+
+
+def test_hit_grid_matches_point_regions():
+    """Verifica que la grilla ubica el centro de cada punto en su índice."""
+    grid = HitGrid()
+    for idx in range(24):
+        x, is_top = point_column(idx)
+        assert grid.locate((x + 30, 100 if is_top else HEIGHT - 100)) == idx
+
+
+def test_hit_grid_bar_trays_and_outside():
+    """Verifica la barra y las bandejas de cada color y las posiciones fuera del tablero."""
+    grid = HitGrid()
+    bar = BAR_X + 20
+    tray = BEAR_OFF_X + 50
+    assert grid.locate((bar, 100)) == BAR_B and grid.locate((bar, HEIGHT - 100)) == BAR_W
+    assert grid.locate((tray, 100)) == OFF_B and grid.locate((tray, HEIGHT - 100)) == OFF_W
+    assert grid.locate((5, 100)) is None
+    assert grid.locate((100, 5)) is None
+    assert grid.locate((-1, 100)) is None and grid.locate((WIDTH + 10, 100)) is None
+
+
+def test_hit_grid_follows_origin():
+    """Verifica que la grilla tiene en cuenta el desplazamiento del tablero en la ventana."""
+    origin = board_origin((WIDTH + 200, HEIGHT + 100))
+    assert origin == (100, 50)
+    x, _ = point_column(0)
+    assert HitGrid(origin).locate((x + 130, HEIGHT - 50)) == 0
+    assert HitGrid().locate((x + 130, HEIGHT - 50)) != 0
+
+
+def test_destination_numbering():
+    """Verifica los destinos de movimientos normales, desde la barra y de salida."""
+    assert destination("W", 1, 3) == 3
+    assert destination("B", 24, 3) == 20
+    assert destination("W", 25, 2) == 1 and destination("B", 25, 2) == 22
+    assert destination("W", 22, 6) == OFF_W and destination("B", 3, 6) == OFF_B
+
+
+def test_highlights_only_redraw_their_regions(renderer):
+    """Verifica que resaltar destinos sólo redibuja las regiones que cambian de estado."""
+    game = BackgammonGame()
+    renderer.draw(game)
+    regions = renderer.get_regions()
+    assert renderer.draw(game, highlights={3, OFF_W}) == [regions["point3"], regions["offW"]]
+    assert renderer.draw(game, highlights={3, OFF_W}) == []
+    assert renderer.draw(game, highlights={4}) == [regions["point3"], regions["point4"], regions["offW"]]
+
+
+def test_renderer_with_origin_offsets_dirty_rects():
+    """Verifica que con el tablero desplazado los rectángulos sucios quedan en coordenadas de ventana."""
+    pygame.init()
+    try:
+        screen = pygame.display.set_mode((WIDTH + 200, HEIGHT + 100))
+        renderer = BoardRenderer(screen, (100, 50))
+        game = BackgammonGame()
+        assert renderer.draw(game) == [screen.get_rect()]
+        dirty = renderer.draw(game, highlights={5})
+        assert dirty == [renderer.get_regions()["point5"].move(100, 50)]
+    finally:
+        pygame.quit()
+
+
+def test_legal_destinations_from_selected_point():
+    """Verifica los destinos resaltados de un origen, de uno sin movimientos y de la bandeja."""
+    from pygame_ui.interfaz import legal_destinations
+
+    game = BackgammonGame()
+    game.setup_position(game.get_board().get_counts(), color="W", remaining_moves=[6, 5])
+    assert legal_destinations(game, 11) == {16, 17}
+    assert legal_destinations(game, 5) == frozenset()
+    assert legal_destinations(game, OFF_W) == frozenset()
+    assert legal_destinations(game, None) == frozenset()
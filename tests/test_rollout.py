@@ -0,0 +1,122 @@
+import random
+
+import pytest
+
+from core.board import Board
+from core.dice import ROLLS
+from core.player import Player
+from core.rollout import PipLuck, SearchLuck, _permutations, quasi_random_roll, rollout, trial_seeds
+from core.search import load_board
+
+
+def _race_counts():
+    counts = [0] * 24
+    counts[18], counts[20], counts[22] = 5, 5, 5
+    counts[5], counts[3], counts[1] = -5, -5, -5
+    return counts
+
+
+def _opening():
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.setup_initial_checkers(p1, p2)
+    return board
+
+
+def test_quasi_random_rolls_cover_every_outcome():
+    """Verifica que cada bloque de 36 pruebas usa las 36 tiradas una vez, y 36² las combinaciones de dos."""
+    permutations = _permutations(7, 2)
+    first = [quasi_random_roll(permutations, trial, 0) for trial in range(36)]
+    assert len(set(first)) == 36
+    pairs = {(quasi_random_roll(permutations, trial, 0), quasi_random_roll(permutations, trial, 1))
+             for trial in range(36 ** 2)}
+    assert len(pairs) == 36 ** 2
+    for block in range(0, 36 ** 2, 36):
+        second = {quasi_random_roll(permutations, trial, 1) for trial in range(block, block + 36)}
+        assert len(second) == 36
+
+
+def test_policy_and_dice_streams_differ():
+    """Verifica que la política y los dados de cada prueba usan flujos aleatorios distintos."""
+    for trial in range(50):
+        dice_seed, policy_seed = trial_seeds(9, trial)
+        assert dice_seed != policy_seed
+        dice_stream, policy_stream = random.Random(dice_seed), random.Random(policy_seed)
+        assert [dice_stream.random() for _ in range(5)] != [policy_stream.random() for _ in range(5)]
+
+
+def test_rollout_does_not_depend_on_chunk_size():
+    """Verifica que el tamaño de bloque no cambia los resultados."""
+    board = _opening()
+    small = rollout(board, "W", trials=12, seed=4, chunk_size=3, policy="random")
+    large = rollout(board, "W", trials=12, seed=4, chunk_size=12, policy="random")
+    assert small["raw_equity"] == large["raw_equity"]
+    assert small["equity"] == large["equity"]
+
+
+@pytest.mark.parametrize("meter_class", [PipLuck, SearchLuck])
+def test_luck_has_zero_expectation(meter_class):
+    """Verifica que la suerte promedio sobre las 21 tiradas es cero."""
+    board, players = load_board(_race_counts(), (0, 0))
+    meter = meter_class("W")
+    expected = sum(probability * meter.luck(board, players, "B", (a, b)) for a, b, probability in ROLLS)
+    assert expected == pytest.approx(0.0)
+
+
+def test_pip_luck_sign_depends_on_who_rolls():
+    """Verifica que una tirada grande es buena suerte para quien tira."""
+    meter = PipLuck("W")
+    assert meter.luck(None, None, "W", (6, 6)) > 0
+    assert meter.luck(None, None, "B", (6, 6)) < 0
+
+
+def test_certain_win_has_full_equity():
+    """Verifica que una posición ganada en una tirada vale un punto sin error."""
+    counts = [0] * 24
+    counts[23], counts[0] = 1, -14
+    board, _ = load_board(counts, (0, 0))
+    stats = rollout(board, "W", trials=36)
+    assert stats["equity"] == pytest.approx(1.0)
+    assert stats["std_error"] == 0.0
+    assert stats["win_rate"] == 1.0
+    assert stats["win_gammon_rate"] == 0.0
+
+
+def test_rollout_is_reproducible_and_leaves_board_unchanged():
+    """Verifica que la misma semilla da el mismo resultado y que el tablero no cambia."""
+    board = _opening()
+    before = board.get_hash()
+    first = rollout(board, "W", trials=8, seed=3, chunk_size=4)
+    second = rollout(board, "W", trials=8, seed=3, chunk_size=4)
+    assert first["raw_equity"] == second["raw_equity"]
+    assert first["equity"] == second["equity"]
+    assert board.get_hash() == before
+
+
+def test_parallel_rollout_matches_serial():
+    """Verifica que repartir las pruebas en procesos no cambia los resultados."""
+    board, _ = load_board(_race_counts(), (0, 0))
+    serial = rollout(board, "W", trials=12, seed=5, chunk_size=4)
+    parallel = rollout(board, "W", trials=12, seed=5, chunk_size=4, workers=2)
+    assert parallel["equity"] == serial["equity"]
+    assert parallel["trials_per_sec"] > 0
+
+
+def test_rollout_reports_rates_and_errors():
+    """Verifica que el resultado incluye tasas válidas y el error con y sin ajuste."""
+    board, _ = load_board(_race_counts(), (0, 0))
+    stats = rollout(board, "B", trials=36, variance_reduction=None)
+    assert stats["equity"] == stats["raw_equity"]
+    assert stats["std_error"] == stats["raw_std_error"]
+    assert 0.0 <= stats["lose_backgammon_rate"] <= stats["lose_gammon_rate"] <= 1.0
+    assert stats["unfinished"] == 0
+
+
+@pytest.mark.parametrize("kwargs", [
+    {"color": "X"}, {"policy": "nope"}, {"variance_reduction": "nope"}, {"trials": 0},
+])
+def test_invalid_arguments_raise(kwargs):
+    """Verifica que los argumentos inválidos se rechazan."""
+    arguments = {"color": "W", **kwargs}
+    with pytest.raises(ValueError):
+        rollout(_opening(), **arguments)
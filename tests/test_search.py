@@ -0,0 +1,162 @@
+import pytest
+
+from core.board import Board
+from core.dice import ROLLS, Dice
+from core.game import BackgammonGame
+from core.moves import generate_plays
+from core.player import Player
+from core.policies import POLICIES, ExpectiminimaxPolicy
+from core.search import WIN_VALUE, Searcher, load_board
+from core.selfplay import play_game
+
+
+def _opening():
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.setup_initial_checkers(p1, p2)
+    return board, p1
+
+
+def test_rolls_cover_all_dice_outcomes():
+    """Verifica que las 21 tiradas distintas suman probabilidad 1."""
+    assert len(ROLLS) == 21
+    assert sum(probability for _, _, probability in ROLLS) == pytest.approx(1.0)
+
+
+def test_policy_is_registered():
+    """Verifica que la política de búsqueda está disponible para las partidas entre bots."""
+    assert POLICIES["expectiminimax"] is ExpectiminimaxPolicy
+
+
+@pytest.mark.parametrize("depth", [0, -1])
+def test_invalid_depth_raises(depth):
+    """Verifica que la profundidad debe ser positiva."""
+    with pytest.raises(ValueError):
+        ExpectiminimaxPolicy(depth=depth)
+
+
+def test_depth_one_matches_static_evaluation():
+    """Verifica que a 1 ply se elige la jugada con mejor evaluación inmediata."""
+    board, p1 = _opening()
+    plays = generate_plays(board, p1, [3, 1])
+    searcher = Searcher()
+    local, players = load_board(board.get_counts(), (0, 0))
+    values = searcher.play_values(local, players["W"], plays, "W")
+    assert ExpectiminimaxPolicy(depth=1).choose_play(board, p1, plays) == plays[int(values.argmax())]
+
+
+def test_search_leaves_board_unchanged():
+    """Verifica que buscar a 2 plies no modifica el tablero."""
+    board, p1 = _opening()
+    plays = generate_plays(board, p1, [6, 4])
+    before = board.get_hash()
+    play = ExpectiminimaxPolicy(depth=2, candidates=3).choose_play(board, p1, plays)
+    assert play in plays
+    assert board.get_hash() == before
+
+
+def test_winning_play_is_chosen():
+    """Verifica que se elige la jugada que termina la partida."""
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    counts = [0] * 24
+    counts[22], counts[21], counts[0] = 1, 1, -15
+    board.setup_position(p1, p2, counts)
+    plays = generate_plays(board, p1, [3, 2])
+    play = ExpectiminimaxPolicy(depth=2).choose_play(board, p1, plays)
+    for move in play:
+        board.make_move(p1, *move)
+    assert board.has_won(p1)
+
+
+def test_chosen_play_is_a_searched_candidate():
+    """Verifica que la jugada elegida a 2 plies es siempre una de las candidatas buscadas."""
+    game = BackgammonGame(dice=Dice(seed=5))
+    policy, opponent = ExpectiminimaxPolicy(depth=2, candidates=2), POLICIES["random"](5)
+    searcher = Searcher(candidates=2)
+    checked = 0
+    while checked < 6 and game.check_winner() is None:
+        game.roll_dice()
+        board, player = game.get_board(), game.get_current_player()
+        plays = generate_plays(board, player, game.get_remaining_moves())
+        if len(plays) > 2:
+            local, players = load_board(board.get_counts(), (board.get_bar("W"), board.get_bar("B")))
+            values = searcher.play_values(local, players[player.get_color()], plays, player.get_color())
+            searched = [plays[index] for index in searcher.best_indices(values, True)]
+            assert policy.choose_play(board, player, plays) in searched
+            checked += 1
+        game.play_turn(opponent)
+        game.switch_player()
+    assert checked == 6
+
+
+def test_roll_value_ignores_unsearched_plays():
+    """Verifica que el mejor valor de una tirada sale sólo de las jugadas exploradas."""
+    board, players = load_board(_opening()[0].get_counts(), (0, 0))
+    searcher = Searcher(candidates=1)
+    plays = generate_plays(board, players["W"], [6, 4])
+    values = searcher.play_values(board, players["W"], plays, "W")
+    best = plays[int(searcher.best_indices(values, True)[0])]
+    records = [board.make_move(players["W"], *move) for move in best]
+    expected = searcher.chance_value(board, players, "B", 1, "W")
+    for record in reversed(records):
+        board.unmake_move(players["W"], record)
+    assert searcher.roll_value(board, players, "W", (6, 4), 2, "W") == pytest.approx(expected)
+
+
+def test_chance_value_of_finished_game():
+    """Verifica que una partida terminada vale ±1 sin explorar tiradas."""
+    counts = [0] * 24
+    counts[0] = -15
+    board, players = load_board(counts, (0, 0))
+    searcher = Searcher()
+    assert searcher.chance_value(board, players, "B", 2, "W") == WIN_VALUE
+    assert searcher.chance_value(board, players, "B", 2, "B") == -WIN_VALUE
+
+
+def test_parallel_search_matches_serial():
+    """Verifica que repartir las ramas de azar en procesos da la misma jugada y los mismos nodos."""
+    board, p1 = _opening()
+    plays = generate_plays(board, p1, [5, 2])
+    serial = ExpectiminimaxPolicy(depth=2, candidates=2)
+    with ExpectiminimaxPolicy(depth=2, workers=2, candidates=2) as parallel:
+        assert parallel.choose_play(board, p1, plays) == serial.choose_play(board, p1, plays)
+        assert parallel.get_stats()["nodes"] == serial.get_stats()["nodes"]
+
+
+def test_stats_report_decisions_and_speed():
+    """Verifica las métricas de nodos por segundo y tiempo por decisión."""
+    board, p1 = _opening()
+    policy = ExpectiminimaxPolicy(depth=1)
+    policy.choose_play(board, p1, generate_plays(board, p1, [6, 1]))
+    stats = policy.get_stats()
+    assert stats["decisions"] == 1
+    assert stats["nodes"] > 0
+    assert stats["nodes_per_sec"] > 0
+    assert stats["seconds_per_decision"] == stats["seconds"]
+
+
+def test_play_turn_applies_policy_choice():
+    """Verifica que la partida juega la tirada con la jugada de la política."""
+    game = BackgammonGame(dice=Dice(sequence=[(6, 4)]))
+    game.roll_dice()
+    play = game.play_turn(ExpectiminimaxPolicy(depth=1))
+    assert len(play) == 2
+    assert game.get_remaining_moves() == []
+
+
+def test_play_turn_without_moves_returns_empty_play():
+    """Verifica que sin movimientos posibles no se juega nada."""
+    game = BackgammonGame()
+    counts = [0] * 24
+    counts[0] = 2
+    for point in range(1, 7):
+        counts[point] = -2
+    game.setup_position(counts, color="W", remaining_moves=[6, 6, 6, 6])
+    assert game.play_turn(ExpectiminimaxPolicy(depth=1)) == ()
+
+
+def test_search_bot_plays_full_game():
+    """Verifica que el bot de búsqueda a 1 ply completa una partida."""
+    result = play_game(ExpectiminimaxPolicy(0, depth=1), POLICIES["random"](1), seed=3)
+    assert result["winner"] in ("W", "B")
@@ -0,0 +1,85 @@
+import pytest
+from core.board import Board
+from core.moves import generate_plays
+from core.player import Player
+from core.policies import RandomPolicy, PipCountPolicy, POLICIES
+from core.selfplay import play_game, run_selfplay, game_points, derive_seed
+
+
+def test_play_game_is_reproducible_per_seed():
+    """Verifica que la misma semilla produce la misma partida."""
+    first = play_game(RandomPolicy(1), RandomPolicy(2), seed=7)
+    second = play_game(RandomPolicy(1), RandomPolicy(2), seed=7)
+    assert first == second
+    assert first["winner"] in ("W", "B")
+    assert first["points"] in (1, 2, 3)
+
+
+def test_play_game_respects_turn_limit():
+    """Verifica que el límite de turnos corta la partida sin ganador."""
+    result = play_game(RandomPolicy(1), RandomPolicy(2), seed=3, max_turns=5)
+    assert result["turns"] == 5
+    assert result["winner"] is None
+    assert result["points"] == 0
+
+
+def test_run_selfplay_is_independent_of_worker_count():
+    """Verifica que los resultados no dependen de la cantidad de procesos."""
+    keys = ("games", "moves", "turns", "white_wins", "black_wins", "unfinished", "gammons")
+    single = run_selfplay(6, workers=1, seed=42, chunk_size=2, max_turns=80)
+    parallel = run_selfplay(6, workers=2, seed=42, chunk_size=2, max_turns=80)
+    assert {k: single[k] for k in keys} == {k: parallel[k] for k in keys}
+    assert single["games"] == 6
+    assert single["moves_per_sec"] > 0
+
+
+def test_run_selfplay_unknown_policy():
+    """Verifica que una política inexistente lanza ValueError."""
+    with pytest.raises(ValueError):
+        run_selfplay(1, white="inexistente")
+
+
+def test_derive_seed_differs_per_game():
+    """Verifica que cada partida recibe una semilla distinta."""
+    seeds = {derive_seed(42, i) for i in range(1000)}
+    assert len(seeds) == 1000
+
+
+@pytest.mark.parametrize("policy_class", list(POLICIES.values()))
+def test_policies_choose_legal_play_without_changing_board(policy_class):
+    """Verifica que las políticas eligen una jugada legal y no alteran el tablero."""
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.setup_initial_checkers(p1, p2)
+    plays = generate_plays(board, p1, [6, 4])
+    before = board.get_hash()
+    assert policy_class(0).choose_play(board, p1, plays) in plays
+    assert board.get_hash() == before
+
+
+def test_pipcount_policy_prefers_hitting():
+    """Verifica que la política de pip count golpea cuando puede."""
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.place_checker(0, p1)
+    board.place_checker(10, p1)
+    board.place_checker(14, p2)
+    board.place_checker(3, p2)
+    plays = generate_plays(board, p1, [4, 3])
+    play = PipCountPolicy(0).choose_play(board, p1, plays)
+    assert (10, 4) in play or (0, 3) in play
+
+
+def test_game_points_scoring():
+    """Verifica el puntaje simple, gammon y backgammon."""
+    p1, p2 = Player("W", "W"), Player("B", "B")
+    board = Board()
+    board.place_checker(10, p2)
+    assert game_points(board, "W") == 2
+    board.place_checker(20, p2)
+    assert game_points(board, "W") == 3
+    single = Board()
+    for _ in range(15):
+        single.place_checker(0, p2)
+    single.move_checker(p2, 0, 1)
+    assert game_points(single, "W") == 1
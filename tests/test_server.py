@@ -0,0 +1,222 @@
+import asyncio
+import json
+
+from core.position_id import encode_position, encode_turn
+from core.search import load_board
+from server.game_server import GameServer
+from server.load_client import percentile, run_load
+
+
+class FakeClock:
+    """Reloj manual para probar la expiración de partidas."""
+
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _run(coroutine):
+    return asyncio.run(coroutine)
+
+
+def test_new_game_returns_initial_state():
+    """Verifica que una partida nueva empieza en la posición inicial con las Blancas."""
+    server = GameServer()
+    response = _run(server.handle_command({"cmd": "new", "id": 7}))
+    assert response["ok"] and response["id"] == 7
+    assert response["position"] == "4HPwATDgc/ABMA"
+    assert response["color"] == "W"
+    assert response["dice"] == [] and response["winner"] is None
+    assert server.get_game_count() == 1
+
+
+def test_roll_and_move_with_seeded_dice():
+    """Verifica que se puede tirar y mover hasta agotar los dados, y que el turno pasa al rival."""
+    server = GameServer()
+
+    async def scenario():
+        game_id = (await server.handle_command({"cmd": "new", "seed": 1}))["game"]
+        state = await server.handle_command({"cmd": "roll", "game": game_id})
+        dice = state["dice"]
+        while state["color"] == "W":
+            moves = (await server.handle_command({"cmd": "moves", "game": game_id}))["moves"]
+            from_point, die = moves[0]
+            state = await server.handle_command({"cmd": "move", "game": game_id, "from": from_point, "die": die})
+            assert state["ok"]
+        return dice, state
+
+    dice, state = _run(scenario())
+    assert len(dice) in (2, 4)
+    assert state["color"] == "B" and state["dice"] == []
+    assert server.get_stats()["moves"] >= 1
+
+
+def test_invalid_commands_report_errors():
+    """Verifica que los comandos inválidos responden con un error sin cortar el servidor."""
+    server = GameServer()
+
+    async def scenario():
+        game_id = (await server.handle_command({"cmd": "new"}))["game"]
+        return [
+            await server.handle_command({"cmd": "move", "game": game_id, "from": 1, "die": 3}),
+            await server.handle_command({"cmd": "pass", "game": game_id}),
+            await server.handle_command({"cmd": "state", "game": "nope"}),
+            await server.handle_command({"cmd": "dance", "game": game_id}),
+            await server.handle_command({"game": game_id}),
+            await server.handle_command(["not", "a", "dict"]),
+        ]
+
+    responses = _run(scenario())
+    assert all(not response["ok"] and response["error"] for response in responses)
+    assert server.get_stats()["errors"] == len(responses)
+
+
+def test_out_of_range_moves_report_errors():
+    """Verifica que un origen o un dado fuera de rango responden con un error sin mover."""
+    server = GameServer()
+
+    async def scenario():
+        game_id = (await server.handle_command({"cmd": "new", "seed": 1}))["game"]
+        before = await server.handle_command({"cmd": "roll", "game": game_id})
+        die = before["dice"][0]
+        responses = [
+            await server.handle_command({"cmd": "move", "game": game_id, "from": from_point, "die": value})
+            for from_point, value in ((0, die), (40, die), (-3, die), (26, die), (1, 0), (1, 7))
+        ]
+        after = await server.handle_command({"cmd": "state", "game": game_id})
+        return before, responses, after
+
+    before, responses, after = _run(scenario())
+    assert all(not response["ok"] and response["error"] for response in responses)
+    assert after["position"] == before["position"] and after["dice"] == before["dice"]
+    assert server.get_stats()["errors"] == len(responses)
+
+
+def test_out_of_range_move_keeps_connection_open():
+    """Verifica que por la conexión llega la respuesta de error y se puede seguir enviando comandos."""
+    async def scenario():
+        server = GameServer()
+        port = await server.start(port=0)
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+
+        async def send(request):
+            writer.write((json.dumps(request) + "\n").encode())
+            await writer.drain()
+            return json.loads(await reader.readline())
+
+        created = await send({"cmd": "new", "seed": 1})
+        die = (await send({"cmd": "roll", "game": created["game"]}))["dice"][0]
+        replies = [created, await send({"cmd": "move", "game": created["game"], "from": 40, "die": die}),
+                   await send({"cmd": "stats"})]
+        writer.close()
+        await server.close()
+        return replies
+
+    created, move, stats = _run(scenario())
+    assert created["ok"] and created["game"] == "g1"
+    assert not move["ok"] and move["error"]
+    assert stats["ok"]
+
+
+def test_pass_only_without_legal_moves():
+    """Verifica que se puede pasar el turno cuando no hay movimientos posibles."""
+    server = GameServer()
+    counts = [0] * 24
+    counts[0] = 2
+    for point in range(1, 7):
+        counts[point] = -2
+    position_id = encode_position(load_board(counts, (0, 0))[0])
+
+    async def scenario():
+        state = await server.handle_command({"cmd": "new", "position": position_id,
+                                             "turn": encode_turn("W", [6, 6, 6, 6])})
+        return await server.handle_command({"cmd": "pass", "game": state["game"]})
+
+    response = _run(scenario())
+    assert response["ok"] and response["color"] == "B"
+
+
+def test_idle_games_are_evicted():
+    """Verifica que las partidas sin actividad se descartan y las activas se conservan."""
+    clock = FakeClock()
+    server = GameServer(idle_timeout=10, clock=clock)
+
+    async def scenario():
+        old = (await server.handle_command({"cmd": "new"}))["game"]
+        clock.now = 8
+        active = (await server.handle_command({"cmd": "new"}))["game"]
+        clock.now = 15
+        await server.handle_command({"cmd": "state", "game": active})
+        return old, active
+
+    old, active = _run(scenario())
+    assert server.evict_idle() == 1
+    response = _run(server.handle_command({"cmd": "state", "game": old}))
+    assert not response["ok"]
+    assert _run(server.handle_command({"cmd": "state", "game": active}))["ok"]
+    assert server.get_stats()["evicted"] == 1
+
+
+def test_max_games_limit():
+    """Verifica que no se crean más partidas que el máximo si ninguna está inactiva."""
+    server = GameServer(max_games=2)
+    responses = [_run(server.handle_command({"cmd": "new"})) for _ in range(3)]
+    assert [response["ok"] for response in responses] == [True, True, False]
+
+
+def test_close_removes_game():
+    """Verifica que cerrar una partida la elimina del servidor."""
+    server = GameServer()
+    game_id = _run(server.handle_command({"cmd": "new"}))["game"]
+    assert _run(server.handle_command({"cmd": "close", "game": game_id}))["ok"]
+    assert server.get_game_count() == 0
+
+
+def test_tcp_protocol_round_trip():
+    """Verifica el protocolo de líneas JSON sobre una conexión TCP real."""
+
+    async def scenario():
+        server = GameServer()
+        port = await server.start("127.0.0.1", 0)
+        try:
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(b'{"cmd": "new", "id": 1}\nnot json\n{"cmd": "stats"}\n')
+            await writer.drain()
+            lines = [json.loads(await reader.readline()) for _ in range(3)]
+            writer.close()
+            await writer.wait_closed()
+            return lines
+        finally:
+            await server.close()
+
+    created, invalid, stats = _run(scenario())
+    assert created["ok"] and created["id"] == 1
+    assert not invalid["ok"]
+    assert stats["ok"] and stats["games"] == 1
+
+
+def test_load_client_plays_moves():
+    """Verifica que el generador de carga juega movimientos y mide latencias."""
+
+    async def scenario():
+        server = GameServer()
+        port = await server.start("127.0.0.1", 0)
+        try:
+            return await run_load("127.0.0.1", port, clients=3, duration=0.3)
+        finally:
+            await server.close()
+
+    stats = _run(scenario())
+    assert stats["moves"] > 0
+    assert stats["moves_per_sec"] > 0
+    assert 0 < stats["p50_ms"] <= stats["p99_ms"]
+
+
+def test_percentile():
+    """Verifica el percentil por rango."""
+    values = list(range(1, 101))
+    assert percentile(values, 0.5) == 51
+    assert percentile(values, 0.99) == 100
+    assert percentile([], 0.99) == 0.0
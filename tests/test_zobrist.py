@@ -0,0 +1,117 @@
+import random
+import pytest
+from core.board import Board
+from core.compact_board import CompactBoard
+from core.game import BackgammonGame
+from core.moves import generate_plays, apply_move
+from core.player import Player
+from core.zobrist import TranspositionTable, compute_hash, SIDE_KEY
+
+
+@pytest.fixture
+def board_with_players():
+    """Fixture para crear un tablero con dos jugadores."""
+    board = Board()
+    player1 = Player("Alice", "W")
+    player2 = Player("Bob", "B")
+    return board, player1, player2
+
+
+def test_empty_board_hash_is_zero(board_with_players):
+    """Verifica que el tablero vacío tiene hash 0."""
+    board, _, _ = board_with_players
+    assert board.get_hash() == 0
+
+
+def test_transposed_moves_give_same_hash(board_with_players):
+    """Verifica que el mismo resultado por distinto orden da el mismo hash."""
+    board, p1, p2 = board_with_players
+    board.setup_initial_checkers(p1, p2)
+    other = board.copy()
+    board.move_checker(p1, 0, 2)
+    board.move_checker(p1, 2, 1)
+    other.move_checker(p1, 0, 1)
+    other.move_checker(p1, 1, 2)
+    assert board.get_hash() == other.get_hash()
+    assert board.get_hash() != Board().get_hash()
+
+
+def test_hit_changes_hash(board_with_players):
+    """Verifica que golpear una ficha cambia el hash y coincide con el cálculo completo."""
+    board, p1, p2 = board_with_players
+    board.place_checker(0, p1)
+    board.place_checker(3, p2)
+    before = board.get_hash()
+    board.move_checker(p2, 3, 3)
+    assert board.get_hash() != before
+    assert board.get_hash() == compute_hash(board)
+    board.move_checker_from_bar(p1, 2)
+    assert board.get_hash() == compute_hash(board)
+
+
+@pytest.mark.parametrize("board_class", [Board, CompactBoard])
+def test_incremental_hash_matches_full_computation(board_class):
+    """Verifica el hash incremental durante partidas aleatorias."""
+    rng = random.Random(5)
+    p1, p2 = Player("Alice", "W"), Player("Bob", "B")
+    board = board_class()
+    board.setup_initial_checkers(p1, p2)
+    player, other = p1, p2
+    for _ in range(300):
+        plays = generate_plays(board, player, [rng.randint(1, 6), rng.randint(1, 6)])
+        if plays:
+            for move in rng.choice(plays):
+                apply_move(board, player, move)
+                assert board.get_hash() == compute_hash(board)
+        if board.has_won(player):
+            break
+        player, other = other, player
+
+
+def test_game_hash_includes_side_to_move():
+    """Verifica que el hash de la partida cambia según quién mueve."""
+    game = BackgammonGame()
+    white_hash = game.get_position_hash()
+    game.switch_player()
+    assert game.get_position_hash() == white_hash ^ SIDE_KEY
+    assert game.get_position_hash() ^ SIDE_KEY == game.get_board().get_hash()
+
+
+def test_transposition_table_store_and_probe():
+    """Verifica que la tabla guarda y recupera valores."""
+    table = TranspositionTable(size=16)
+    table.store(12345, "valor", depth=2)
+    assert table.probe(12345) == "valor"
+    assert table.probe(12345, min_depth=3) is None
+    assert table.probe(999) is None
+    assert table.get_stats()["hits"] == 1
+    assert table.get_stats()["misses"] == 2
+
+
+def test_transposition_table_is_bounded():
+    """Verifica que la tabla no supera su capacidad y reemplaza entradas."""
+    table = TranspositionTable(size=8)
+    for key in range(1000):
+        table.store(key, key)
+    assert len(table) <= 16
+    assert table.get_stats()["replacements"] > 0
+    assert table.probe(999) == 999
+
+
+def test_transposition_table_prefers_deeper_entries():
+    """Verifica que una entrada profunda sobrevive a una superficial en el mismo índice."""
+    table = TranspositionTable(size=4)
+    table.store(1, "profundo", depth=5)
+    table.store(5, "superficial", depth=0)
+    table.store(9, "otro", depth=0)
+    assert table.probe(1) == "profundo"
+    assert table.probe(9) == "otro"
+    table.new_search()
+    table.store(13, "nuevo", depth=0)
+    assert table.probe(13) == "nuevo"
+
+
+def test_transposition_table_invalid_size():
+    """Verifica que un tamaño no positivo lanza ValueError."""
+    with pytest.raises(ValueError):
+        TranspositionTable(size=0)